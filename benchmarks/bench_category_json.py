@@ -0,0 +1,71 @@
+"""
+Encoding a category list response: the DRF path (ListCategoryResponseSerializer
++ JSONRenderer) against the direct encoders in category_app.renderers, with and
+without orjson.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_category_json
+"""
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import django
+
+# the Django apps import each other as `django_project...`, as pytest.ini arranges for the tests
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_project.settings')
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from src.core.category.application.usecase.list_category import CategoryOutput, ListCategoryResponse  # noqa: E402
+from src.django_project.category_app import renderers  # noqa: E402
+from src.django_project.category_app.serializers import ListCategoryResponseSerializer  # noqa: E402
+
+PAGE_SIZES = (50, 100, 1_000)
+REPEAT = 200
+
+
+def measure(render, response) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        render(response)
+    return (time.perf_counter() - start) / REPEAT * 1_000_000
+
+
+def drf(response: ListCategoryResponse) -> bytes:
+    return JSONRenderer().render(ListCategoryResponseSerializer(instance=response).data)
+
+
+def python_encoders(response: ListCategoryResponse) -> bytes:
+    orjson, renderers.orjson = renderers.orjson, None
+    try:
+        return renderers.render_category_list(response)
+    finally:
+        renderers.orjson = orjson
+
+
+def main() -> None:
+    print(f'{"rows":>6} {"DRF (us)":>10} {"python (us)":>12} {"orjson (us)":>12}')
+    for size in PAGE_SIZES:
+        response = ListCategoryResponse(
+            data=[
+                CategoryOutput(id=uuid.uuid4(), name=f'Categoria {i} – ação', description='Descrição ' * 5,
+                               is_active=i % 2 == 0)
+                for i in range(size)
+            ],
+            next_cursor='eyJuYW1lIjoiRmlsbXMifQ',
+        )
+        assert drf(response) == python_encoders(response) == renderers.render_category_list(response)
+
+        orjson = measure(renderers.render_category_list, response) if renderers.orjson else float('nan')
+        print(f'{size:>6} {measure(drf, response):>10.1f} {measure(python_encoders, response):>12.1f} '
+              f'{orjson:>12.1f}')
+
+
+if __name__ == '__main__':
+    main()
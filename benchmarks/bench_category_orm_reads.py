@@ -0,0 +1,76 @@
+"""
+Reading categories through the ORM: a model instance per row converted to a
+Category (the previous DjangoORMCategoryRepository.list) against the
+values_list tuples the repository now rehydrates directly.
+
+Runs against a throwaway in-memory SQLite test database. From the repository root:
+
+    python -m benchmarks.bench_category_orm_reads
+"""
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import django
+
+# the Django apps import each other as `django_project...`, as pytest.ini arranges for the tests
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_project.settings')
+django.setup()
+
+from django.db import connection  # noqa: E402
+
+from django_project.category_app.models import Category as CategoryModel  # noqa: E402
+from src.core.category.domain.category import Category  # noqa: E402
+from src.django_project.category_app.repository import DjangoORMCategoryRepository  # noqa: E402
+
+SIZES = (1_000, 10_000, 50_000)
+REPEAT = 5
+
+
+def model_instances() -> list:
+    return [
+        Category.rehydrate(id=record.id, name=record.name, description=record.description,
+                           is_active=record.is_active)
+        for record in CategoryModel.objects.all()
+    ]
+
+
+def measure(read) -> tuple[float, float]:
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        read()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1_000, peak / len(result)
+
+
+def main() -> None:
+    connection.creation.create_test_db(verbosity=0)
+    repository = DjangoORMCategoryRepository()
+    reads = {
+        'model instances': model_instances,
+        'values_list': repository.list,
+    }
+
+    print(f'{"rows":>8} {"read":<22} {"time (ms)":>10} {"peak bytes/row":>15}')
+    for size in SIZES:
+        CategoryModel.objects.all().delete()
+        CategoryModel.objects.bulk_create(
+            [CategoryModel(name=f'Category {i}', description=f'Description {i}') for i in range(size)],
+            batch_size=500,
+        )
+        for label, read in reads.items():
+            elapsed, per_row = measure(read)
+            print(f'{size:>8} {label:<22} {elapsed:>10.2f} {per_row:>15.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+Cost of turning stored rows into Category entities: the validating
+constructor versus the trusted Category.rehydrate factory.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_category_rehydration
+"""
+import time
+import uuid
+
+from src.core.category.domain.category import Category
+
+ROWS = 200_000
+
+
+def construct(rows) -> None:
+    for id, name, description, is_active in rows:
+        category = Category(id=id, name=name, description=description, is_active=is_active)
+        category.clear_changes()
+
+
+def rehydrate(rows) -> None:
+    for id, name, description, is_active in rows:
+        Category.rehydrate(id=id, name=name, description=description, is_active=is_active)
+
+
+def measure(function, rows) -> float:
+    start = time.perf_counter()
+    function(rows)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rows = [(uuid.uuid4(), f'Category {i}', f'Description {i}', i % 2 == 0) for i in range(ROWS)]
+
+    constructor_time = min(measure(construct, rows) for _ in range(3))
+    rehydrate_time = min(measure(rehydrate, rows) for _ in range(3))
+
+    print(f'{ROWS} rows')
+    print(f'Category(...)       {constructor_time * 1000:8.1f} ms  {constructor_time / ROWS * 1e9:6.0f} ns/row')
+    print(f'Category.rehydrate  {rehydrate_time * 1000:8.1f} ms  {rehydrate_time / ROWS * 1e9:6.0f} ns/row')
+    print(f'speedup             {constructor_time / rehydrate_time:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+Analytics-style predicates on ColumnarCategoryRepository versus walking the
+Category objects of InMemoryCategoryRepository.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_columnar_category_repository
+"""
+import time
+
+from src.core.category.domain.category import Category
+from src.core.category.infra.columnar_category_repository import ColumnarCategoryRepository
+from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
+
+SIZES = (10_000, 100_000, 1_000_000)
+NAME_LENGTH = 14
+
+
+def measure(operation, repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    return best * 1_000
+
+
+def main() -> None:
+    print(f'{"entities":>10} {"query":<28} {"objects (ms)":>13} {"columnar (ms)":>14}')
+    for size in SIZES:
+        categories = [
+            Category(name=f'Category {i}', is_active=i % 3 != 0) for i in range(size)
+        ]
+        objects = InMemoryCategoryRepository(categories=categories)
+        columnar = ColumnarCategoryRepository(categories=categories)
+
+        queries = {
+            'count active': (
+                lambda: sum(1 for category in objects.list() if category.is_active),
+                lambda: columnar.count(is_active=True),
+            ),
+            'inactive ids': (
+                lambda: [category.id for category in objects.list() if not category.is_active],
+                lambda: columnar.find_ids(is_active=False),
+            ),
+            f'count names > {NAME_LENGTH} chars': (
+                lambda: sum(1 for category in objects.list() if len(category.name) > NAME_LENGTH),
+                lambda: columnar.count(name_longer_than=NAME_LENGTH),
+            ),
+        }
+        for label, (walk, scan) in queries.items():
+            assert walk() == scan()
+            print(f'{size:>10} {label:<28} {measure(walk):>13.2f} {measure(scan):>14.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Bytes per entity for Category and Genre, measured with tracemalloc.
+
+The baseline is the previous layout: a plain @dataclass with a per-instance
+__dict__, and genres holding their own UUID objects for every category.
+Genre category ids are parsed from strings, as they are when loaded from
+the database or a request body, so equal ids arrive as distinct objects.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_entity_memory
+"""
+import gc
+import tracemalloc
+import uuid
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+
+ENTITIES = 100_000
+CATEGORIES_PER_GENRE = 5
+DISTINCT_CATEGORIES = 200
+
+
+@dataclass
+class BaselineCategory:
+    name: str
+    id: UUID = field(default_factory=uuid.uuid4)
+    description: str = ''
+    is_active: bool = True
+
+
+@dataclass
+class BaselineGenre:
+    name: str
+    id: UUID = field(default_factory=uuid.uuid4)
+    is_active: bool = True
+    categories: set[UUID] = field(default_factory=set)
+
+
+def bytes_per_entity(build) -> float:
+    gc.collect()
+    tracemalloc.start()
+    entities = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(entities) == ENTITIES
+    return size / ENTITIES
+
+
+def main() -> None:
+    names = [f'Category {i}' for i in range(ENTITIES)]
+    ids = [uuid.uuid4() for _ in range(ENTITIES)]
+    category_ids = [str(uuid.uuid4()) for _ in range(DISTINCT_CATEGORIES)]
+    memberships = [
+        [category_ids[(i + offset * 37) % DISTINCT_CATEGORIES] for offset in range(CATEGORIES_PER_GENRE)]
+        for i in range(ENTITIES)
+    ]
+
+    results = {
+        'Category baseline': bytes_per_entity(lambda: [
+            BaselineCategory(id=id, name=name) for id, name in zip(ids, names)
+        ]),
+        'Category': bytes_per_entity(lambda: [
+            Category.rehydrate(id=id, name=name, description='', is_active=True) for id, name in zip(ids, names)
+        ]),
+        'Genre baseline': bytes_per_entity(lambda: [
+            BaselineGenre(id=id, name=name, categories={UUID(category_id) for category_id in membership})
+            for id, name, membership in zip(ids, names, memberships)
+        ]),
+        'Genre': bytes_per_entity(lambda: [
+            Genre.rehydrate(id=id, name=name, is_active=True,
+                            categories={UUID(category_id) for category_id in membership})
+            for id, name, membership in zip(ids, names, memberships)
+        ]),
+    }
+
+    print(f'{ENTITIES} entities, ids and names allocated up front')
+    for label, size in results.items():
+        print(f'{label:<20} {size:8.1f} bytes/entity')
+
+
+if __name__ == '__main__':
+    main()
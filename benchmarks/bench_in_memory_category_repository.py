@@ -0,0 +1,41 @@
+"""
+Point-operation latency of InMemoryCategoryRepository as the catalog grows.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_in_memory_category_repository
+"""
+import random
+import time
+
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+OPERATIONS = 10_000
+
+
+def measure(operation, ids) -> float:
+    start = time.perf_counter()
+    for id in ids:
+        operation(id)
+    return (time.perf_counter() - start) / len(ids) * 1_000_000
+
+
+def main() -> None:
+    print(f'{"entities":>10} {"get_by_id (us)":>15} {"update (us)":>12} {"delete (us)":>12}')
+    for size in SIZES:
+        categories = [Category(name=f'Category {i}') for i in range(size)]
+        repository = InMemoryCategoryRepository(categories=categories)
+        sample = random.sample(categories, min(OPERATIONS, size))
+        ids = [category.id for category in sample]
+
+        get_latency = measure(repository.get_by_id, ids)
+        update_latency = measure(lambda id: repository.update(repository.get_by_id(id)), ids)
+        delete_latency = measure(repository.delete, ids)
+
+        print(f'{size:>10} {get_latency:>15.3f} {update_latency:>12.3f} {delete_latency:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+import pytest
+from django.core.cache import caches
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # the locmem caches outlive the per-test database rollback
+    for cache in caches.all():
+        cache.clear()
+    yield
@@ -0,0 +1,43 @@
+from typing import ClassVar, Dict, Tuple
+
+_MISSING = object()
+
+
+class ChangeTracked:
+    # mixin for slotted entity dataclasses: assignments to a TRACKED_FIELDS entry that change its value set
+    # one bit in `_changes`, a small int that costs nothing per instance, unlike a set.
+    # Tracking starts once `_changes` is assigned (in __post_init__ or rehydrate), so __init__ is not counted
+    __slots__ = ('_changes',)
+
+    TRACKED_FIELDS: ClassVar[Tuple[str, ...]] = ()
+    _FIELD_BITS: ClassVar[Dict[str, int]] = {}
+    _ALL_CHANGES: ClassVar[int] = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_BITS = {name: 1 << index for index, name in enumerate(cls.TRACKED_FIELDS)}
+        cls._ALL_CHANGES = sum(cls._FIELD_BITS.values())
+
+    def __setattr__(self, name, value):
+        # zero-arg super() does not work in slotted dataclasses, so go through object directly
+        bit = self._FIELD_BITS.get(name)
+        if bit is not None:
+            changes = getattr(self, '_changes', None)
+            if changes is not None and getattr(self, name, _MISSING) != value:
+                object.__setattr__(self, '_changes', changes | bit)
+        object.__setattr__(self, name, value)
+
+    @property
+    def changed_fields(self) -> set[str]:
+        return {name for name, bit in self._FIELD_BITS.items() if self._changes & bit}
+
+    def clear_changes(self):
+        self._changes = 0
+
+    def _mark_changed(self, name: str) -> None:
+        # for in-place changes that do not go through __setattr__
+        self._changes |= self._FIELD_BITS[name]
+
+    def _mark_all_changed(self) -> None:
+        # a new entity has nothing persisted yet, so every field counts as changed
+        self._changes = self._ALL_CHANGES
@@ -0,0 +1,36 @@
+import base64
+import binascii
+import json
+from uuid import UUID
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class InvalidPageSize(Exception):
+    pass
+
+
+def validate_page_size(page_size: int) -> None:
+    if page_size < 1:
+        raise InvalidPageSize(f'page_size must be at least 1, got {page_size}')
+
+
+def encode_cursor(name: str, id: UUID) -> str:
+    payload = json.dumps([name, str(id)], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[str, UUID]:
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        name, id = json.loads(payload)
+        if not isinstance(name, str) or not isinstance(id, str):
+            raise ValueError('cursor must hold a name and an id')
+        return name, UUID(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursor(f'Invalid cursor: {cursor}') from e
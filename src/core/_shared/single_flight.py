@@ -0,0 +1,56 @@
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    # calls that waited for an execution already in flight instead of running their own
+    collapsed: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, collapsed: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            self.collapsed += collapsed
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.collapsed = 0
+
+
+class SingleFlight:
+    # concurrent calls with the same key share one execution: the first caller runs it and the others
+    # wait for its result (or exception). Nothing is kept once it finishes, so this is not a cache
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self.stats = SingleFlightStats()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        self.stats.record(collapsed=not leader)
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
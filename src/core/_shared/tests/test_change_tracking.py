@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+
+from src.core._shared.change_tracking import ChangeTracked
+
+
+@dataclass(slots=True)
+class Item(ChangeTracked):
+    TRACKED_FIELDS = ('name', 'tags')
+
+    name: str
+    tags: list
+    untracked: int = 0
+
+    def __post_init__(self):
+        self._mark_all_changed()
+
+
+class TestChangeTracked:
+    def test_new_entity_has_every_tracked_field_changed(self):
+        assert Item(name='a', tags=[]).changed_fields == {'name', 'tags'}
+
+    def test_only_assignments_that_change_a_tracked_value_are_recorded(self):
+        item = Item(name='a', tags=[])
+        item.clear_changes()
+
+        item.name = 'a'
+        item.untracked = 1
+        assert item.changed_fields == set()
+
+        item.name = 'b'
+        assert item.changed_fields == {'name'}
+
+    def test_in_place_changes_are_recorded_when_marked(self):
+        item = Item(name='a', tags=[])
+        item.clear_changes()
+
+        item.tags.append('x')
+        item._mark_changed('tags')
+
+        assert item.changed_fields == {'tags'}
+
+    def test_each_subclass_gets_its_own_bits(self):
+        assert Item._FIELD_BITS == {'name': 1, 'tags': 2}
+        assert Item._ALL_CHANGES == 3
+        assert not hasattr(Item(name='a', tags=[]), '__dict__')
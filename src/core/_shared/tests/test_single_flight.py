@@ -0,0 +1,68 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core._shared.single_flight import SingleFlight
+
+
+def wait_for_calls(single_flight: SingleFlight, calls: int) -> None:
+    deadline = time.monotonic() + 5
+    while single_flight.stats.calls < calls and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestDo:
+    def test_concurrent_calls_with_the_same_key_share_one_execution(self):
+        single_flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        executions = []
+
+        def load():
+            executions.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return ['Films']
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(single_flight.do, 'list', load)
+            started.wait(timeout=5)
+            followers = [executor.submit(single_flight.do, 'list', load) for _ in range(4)]
+            wait_for_calls(single_flight, 5)
+            release.set()
+            results = [leader.result()] + [follower.result() for follower in followers]
+
+        assert executions == [1]
+        assert all(result is results[0] for result in results)
+        assert (single_flight.stats.calls, single_flight.stats.collapsed) == (5, 4)
+
+    def test_different_keys_and_sequential_calls_are_not_collapsed(self):
+        single_flight = SingleFlight()
+
+        assert single_flight.do('a', lambda: 1) == 1
+        assert single_flight.do('a', lambda: 2) == 2
+        assert single_flight.do('b', lambda: 3) == 3
+        assert single_flight.stats.collapsed == 0
+
+    def test_exception_is_raised_to_every_waiting_caller(self):
+        single_flight = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def fail():
+            started.set()
+            release.wait(timeout=5)
+            raise ValueError('boom')
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(single_flight.do, 'key', fail)
+            started.wait(timeout=5)
+            follower = executor.submit(single_flight.do, 'key', fail)
+            wait_for_calls(single_flight, 2)
+            release.set()
+
+            for future in (leader, follower):
+                with pytest.raises(ValueError, match='boom'):
+                    future.result()
+
+        assert single_flight.do('key', lambda: 'recovered') == 'recovered'
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+
+
+class UnitOfWork(ABC):
+    # used as a context manager around one request: writes collected by its repositories are
+    # committed together when the block ends, or discarded if it raises
+    def __enter__(self) -> 'UnitOfWork':
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    @abstractmethod
+    def begin(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def commit(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def rollback(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,50 @@
+from dataclasses import dataclass, field
+from typing import List
+from uuid import UUID
+
+from src.core.category.application.usecase.create_category import CreateCategoryRequest
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+@dataclass
+class BulkCreateCategoryRequest:
+    categories: List[CreateCategoryRequest]
+
+@dataclass
+class CreatedCategory:
+    index: int
+    id: UUID
+
+@dataclass
+class BulkCreateCategoryError:
+    index: int
+    message: str
+
+@dataclass
+class BulkCreateCategoryResponse:
+    created: List[CreatedCategory] = field(default_factory=list)
+    errors: List[BulkCreateCategoryError] = field(default_factory=list)
+
+
+class BulkCreateCategory:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: BulkCreateCategoryRequest) -> BulkCreateCategoryResponse:
+        response = BulkCreateCategoryResponse()
+        categories = []
+        for index, item in enumerate(request.categories):
+            try:
+                category = Category(name=item.name, description=item.description, is_active=item.is_active)
+            except ValueError as e:
+                response.errors.append(BulkCreateCategoryError(index=index, message=str(e)))
+                continue
+
+            categories.append(category)
+            response.created.append(CreatedCategory(index=index, id=category.id))
+
+        if categories:
+            self.repository.save_many(categories)
+
+        return response
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+@dataclass
+class DeleteCategoriesRequest:
+    ids: set[UUID]
+
+@dataclass
+class DeleteCategoriesResponse:
+    not_found: set[UUID]
+
+
+class DeleteCategories:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: DeleteCategoriesRequest) -> DeleteCategoriesResponse:
+        # one round trip: the ids the repository did not delete are the ones that were not there
+        deleted = self.repository.delete_many(set(request.ids))
+        return DeleteCategoriesResponse(not_found=set(request.ids) - deleted)
@@ -15,8 +15,6 @@ class DeleteCategory:
         self.repository = repository
 
     def execute(self, request: DeleteCategoryRequest) -> None:
-        category = self.repository.get_by_id(request.id)
-        if not category:
+        deleted = self.repository.delete(id = request.id)
+        if not deleted:
             raise CategoryNotFound(f'Category with id {request.id} not found')
-
-        self.repository.delete(id = request.id)
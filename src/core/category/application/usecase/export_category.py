@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from src.core.category.application.usecase.list_category import CategoryOutput
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+@dataclass
+class ExportCategoryRequest:
+    pass
+
+@dataclass
+class ExportCategoryResponse:
+    data: Iterator[CategoryOutput]
+
+
+class ExportCategory:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: ExportCategoryRequest) -> ExportCategoryResponse:
+        return ExportCategoryResponse(data=(
+            CategoryOutput(
+                id=category.id,
+                name=category.name,
+                description=category.description,
+                is_active=category.is_active
+            ) for category in self.repository.iter_all()
+        ))
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import List
+from uuid import UUID
+
+from src.core.category.application.usecase.list_category import CategoryOutput
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+@dataclass
+class GetCategoriesRequest:
+    ids: set[UUID]
+
+
+@dataclass
+class GetCategoriesResponse:
+    data: List[CategoryOutput]
+    not_found: set[UUID]
+
+
+class GetCategories:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: GetCategoriesRequest) -> GetCategoriesResponse:
+        # one get_many for the whole batch; whatever it did not return does not exist
+        categories = sorted(self.repository.get_many(request.ids), key=lambda category: (category.name, category.id))
+
+        return GetCategoriesResponse(
+            data=[
+                CategoryOutput(
+                    id=category.id,
+                    name=category.name,
+                    description=category.description,
+                    is_active=category.is_active
+                ) for category in categories
+            ],
+            not_found=set(request.ids) - {category.id for category in categories}
+        )
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import List
 from uuid import UUID
 
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor, validate_page_size
 from src.core.category.domain.category_repository import CategoryRepository
 
 
@@ -14,11 +15,14 @@ class CategoryOutput:
 
 @dataclass
 class ListCategoryRequest:
-    pass
+    page_size: int = DEFAULT_PAGE_SIZE
+    cursor: str | None = None
+    is_active: bool | None = None
 
 @dataclass
 class ListCategoryResponse:
     data: List[CategoryOutput]
+    next_cursor: str | None = None
 
 
 class ListCategory:
@@ -26,7 +30,17 @@ class ListCategory:
         self.repository = repository
 
     def execute(self, request: ListCategoryRequest) -> ListCategoryResponse:
-        categories = self.repository.list()
+        validate_page_size(request.page_size)
+        after = decode_cursor(request.cursor) if request.cursor else None
+        # one extra row tells whether another page exists without a COUNT query
+        categories = self.repository.list_page(
+            page_size=request.page_size + 1, after=after, is_active=request.is_active
+        )
+
+        next_cursor = None
+        if len(categories) > request.page_size:
+            categories = categories[:request.page_size]
+            next_cursor = encode_cursor(categories[-1].name, categories[-1].id)
 
         return ListCategoryResponse(data=[
             CategoryOutput(
@@ -35,4 +49,4 @@ class ListCategory:
                 description=category.description,
                 is_active=category.is_active
             ) for category in categories
-        ])
+        ], next_cursor=next_cursor)
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import List
+from uuid import UUID
+
+from src.core.category.application.usecase.exceptions import InvalidCategoryData
+from src.core.category.application.usecase.update_category import UpdateCategoryRequest
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+@dataclass
+class PatchCategoriesRequest:
+    categories: List[UpdateCategoryRequest]
+
+@dataclass
+class PatchCategoriesResponse:
+    not_found: set[UUID]
+
+
+class PatchCategories:
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+
+    def execute(self, request: PatchCategoriesRequest) -> PatchCategoriesResponse:
+        ids = {item.id for item in request.categories}
+        categories = {category.id: category for category in self.repository.get_many(ids)}
+
+        for item in request.categories:
+            category = categories.get(item.id)
+            if not category:
+                continue
+
+            name = item.name if item.name is not None else category.name
+            description = item.description if item.description is not None else category.description
+
+            try:
+                category.update_category(name=name, description=description)
+            except ValueError as e:
+                raise InvalidCategoryData(f'Category {item.id}: {e}')
+
+            if item.is_active:
+                category.activate()
+
+            if item.is_active is False:
+                category.deactivate()
+
+        if categories:
+            self.repository.update_many(list(categories.values()))
+
+        return PatchCategoriesResponse(not_found=ids - categories.keys())
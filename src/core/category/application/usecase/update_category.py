@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
 from src.core.category.application.usecase.exceptions import CategoryNotFound, InvalidCategoryData
 
@@ -18,22 +19,18 @@ class UpdateCategory:
         self.repository = repository
 
     def execute(self, request: UpdateCategoryRequest) -> None:
-        category = self.repository.get_by_id(request.id)
-        if not category:
+        if request.name is not None:
+            try:
+                Category.validate_name(request.name)
+            except ValueError as e:
+                raise InvalidCategoryData(e)
+
+        # not-found is detected from the write itself, so the category is never read first
+        updated = self.repository.update_fields(
+            request.id,
+            name=request.name,
+            description=request.description,
+            is_active=request.is_active
+        )
+        if not updated:
             raise CategoryNotFound(f'Category with id {request.id} not found')
-
-        name = request.name if request.name is not None else category.name
-        description = request.description if request.description is not None else category.description
-
-        try:
-            category.update_category(name=name, description=description)
-        except ValueError as e:
-            raise InvalidCategoryData(e)
-
-        if request.is_active:
-            category.activate()
-
-        if request.is_active is False:
-            category.deactivate()
-
-        self.repository.update(category)
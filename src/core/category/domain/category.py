@@ -2,9 +2,13 @@ from dataclasses import dataclass, field
 from uuid import UUID
 import uuid
 
+from src.core._shared.change_tracking import ChangeTracked
+
+
+@dataclass(slots=True)
+class Category(ChangeTracked):
+    TRACKED_FIELDS = ('name', 'description', 'is_active')
 
-@dataclass
-class Category:
     name: str
     id: UUID = field(default_factory=uuid.uuid4)
     description: str = ""
@@ -12,6 +16,19 @@ class Category:
 
     def __post_init__(self):
         self.validate()
+        self._mark_all_changed()
+
+    @classmethod
+    def rehydrate(cls, id: UUID, name: str, description: str, is_active: bool) -> 'Category':
+        # trusted path for data that was validated when it was written: no __init__, validation or tracking
+        category = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(category, 'name', name)
+        setattr_(category, 'id', id)
+        setattr_(category, 'description', description)
+        setattr_(category, 'is_active', is_active)
+        setattr_(category, '_changes', 0)
+        return category
 
     def update_category(self, name: str, description: str):
         self.name = name
@@ -19,9 +36,13 @@ class Category:
         self.description = description
 
     def validate(self):
-        if len(self.name) > 255:
+        self.validate_name(self.name)
+
+    @staticmethod
+    def validate_name(name: str):
+        if len(name) > 255:
             raise ValueError("name cannot be longer than 255 characters")
-        if not self.name:
+        if not name:
             raise ValueError("name cannot be empty")
         
     def activate(self):
@@ -41,4 +62,4 @@ class Category:
     def __eq__(self, other):
         if not isinstance(other, Category):
             return False
-        return self.id == other.id
\ No newline at end of file
+        return self.id == other.id
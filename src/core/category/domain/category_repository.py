@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 from uuid import UUID
 
 from src.core.category.domain.category import Category
@@ -14,14 +14,53 @@ class CategoryRepository(ABC):
     def get_by_id(self, id: UUID) -> Category | None:
         raise NotImplementedError
 
+    # delete, update and update_fields return the number of rows affected (0 when the id does not exist)
     @abstractmethod
-    def delete(self, id: UUID) -> None:
+    def delete(self, id: UUID) -> int:
         raise NotImplementedError
 
     @abstractmethod
-    def update(self, category: Category) -> None:
+    def update(self, category: Category) -> int:
+        raise NotImplementedError
+
+    # only the fields that are not None are written
+    @abstractmethod
+    def update_fields(self, id: UUID, name: str | None = None, description: str | None = None,
+                      is_active: bool | None = None) -> int:
         raise NotImplementedError
 
     @abstractmethod
     def list(self) -> List[Category]:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_missing(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
+
+    # up to page_size categories ordered by (name, id), starting right after the `after` key,
+    # optionally only the active or inactive ones
+    @abstractmethod
+    def list_page(self, page_size: int, after: tuple[str, UUID] | None = None,
+                  is_active: bool | None = None) -> List[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_all(self) -> Iterator[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_many(self, categories: List[Category]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_many(self, ids: set[UUID]) -> List[Category]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_many(self, categories: List[Category]) -> None:
+        raise NotImplementedError
+
+    # returns the ids that were actually deleted, so callers can tell the missing ones without a lookup
+    @abstractmethod
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        raise NotImplementedError
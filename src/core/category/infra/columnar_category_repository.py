@@ -0,0 +1,266 @@
+import heapq
+import struct
+from array import array
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Optional
+from uuid import UUID
+
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.category.domain.category import Category
+
+
+_ID_SIZE = 16
+# names are at most 255 characters, so their lengths fit one byte each and can go through translate too
+_MAX_NAME_LENGTH = 255
+
+# predicates are evaluated as ints with one bit per row (row 0 the most significant); this table turns
+# their binary digits back into the 0/1 bytes itertools.compress selects rows with
+_DIGITS_TO_MASK = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def _longer_than_digits(length: int) -> bytes:
+    # translate table turning the name lengths column into one binary digit per row
+    return bytes(ord('1') if value > length else ord('0') for value in range(256))
+
+
+class _BitColumn:
+    # booleans packed eight rows per byte, row 0 in the high bit of the first byte, so the whole column
+    # reads as one int in row order
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def append(self, row: int, value: bool) -> None:
+        if row % 8 == 0:
+            self.buffer.append(0)
+        self.set(row, value)
+
+    def set(self, row: int, value: bool) -> None:
+        bit = 0x80 >> (row % 8)
+        if value:
+            self.buffer[row // 8] |= bit
+        else:
+            self.buffer[row // 8] &= ~bit & 0xFF
+
+    def get(self, row: int) -> bool:
+        return bool(self.buffer[row // 8] & (0x80 >> (row % 8)))
+
+    def bits(self) -> int:
+        return int.from_bytes(self.buffer, 'big')
+
+    def take(self, rows: Iterable[int]) -> '_BitColumn':
+        column = _BitColumn()
+        for index, row in enumerate(rows):
+            column.append(index, self.get(row))
+        return column
+
+
+class _StringColumn:
+    # utf-8 values packed in one buffer; a changed value is appended and the old bytes are left as garbage
+    def __init__(self):
+        self.buffer = bytearray()
+        self.starts = array('Q')
+        self.ends = array('Q')
+        self.garbage = 0
+
+    def append(self, value: str) -> None:
+        encoded = value.encode()
+        self.starts.append(len(self.buffer))
+        self.buffer += encoded
+        self.ends.append(len(self.buffer))
+
+    def set(self, row: int, value: str) -> None:
+        encoded = value.encode()
+        start, end = self.starts[row], self.ends[row]
+        if self.buffer[start:end] == encoded:
+            return
+        self.garbage += end - start
+        self.starts[row] = len(self.buffer)
+        self.buffer += encoded
+        self.ends[row] = len(self.buffer)
+
+    def get(self, row: int) -> str:
+        return self.buffer[self.starts[row]:self.ends[row]].decode()
+
+    def take(self, rows: Iterable[int]) -> '_StringColumn':
+        column = _StringColumn()
+        buffer, starts, ends = self.buffer, self.starts, self.ends
+        for row in rows:
+            column.starts.append(len(column.buffer))
+            column.buffer += buffer[starts[row]:ends[row]]
+            column.ends.append(len(column.buffer))
+        return column
+
+
+class ColumnarCategoryRepository(CategoryRepository):
+    # deleted rows and replaced string bytes are dropped once they outweigh the live data
+    COMPACT_MIN_ROWS = 1024
+    COMPACT_MIN_BYTES = 64 * 1024
+
+    def __init__(self, categories: List[Category] = None):
+        # one 16-byte id per row, contiguous; UUID objects are only built for the rows returned
+        self._ids = bytearray()
+        # rows are never moved on delete, only cleared in _live until the next compaction
+        self._live = _BitColumn()
+        self._active = _BitColumn()
+        self._names = _StringColumn()
+        self._name_lengths = bytearray()
+        self._descriptions = _StringColumn()
+        self._rows: Dict[UUID, int] = {}
+        self.save_many(categories or [])
+
+    @property
+    def categories(self) -> List[Category]:
+        return self.list()
+
+    def save(self, category):
+        row = self._rows.get(category.id)
+        if row is not None:
+            self._write(row, category.name, category.description, category.is_active)
+            return
+
+        row = self._size()
+        self._rows[category.id] = row
+        self._ids += category.id.bytes
+        self._live.append(row, True)
+        self._active.append(row, category.is_active)
+        self._names.append(category.name)
+        self._name_lengths.append(min(len(category.name), _MAX_NAME_LENGTH))
+        self._descriptions.append(category.description)
+
+    def save_many(self, categories: List[Category]) -> None:
+        for category in categories:
+            self.save(category)
+
+    def get_by_id(self, id: UUID) -> Optional[Category]:
+        row = self._rows.get(id)
+        return None if row is None else self._materialize(row)
+
+    def delete(self, id: UUID) -> int:
+        row = self._rows.pop(id, None)
+        if row is None:
+            return 0
+        self._live.set(row, False)
+        self._compact_if_needed()
+        return 1
+
+    def update(self, category: Category) -> int:
+        row = self._rows.get(category.id)
+        if row is None:
+            return 0
+        self._write(row, category.name, category.description, category.is_active)
+        return 1
+
+    def update_fields(self, id: UUID, name: str | None = None, description: str | None = None,
+                      is_active: bool | None = None) -> int:
+        row = self._rows.get(id)
+        if row is None:
+            return 0
+
+        if name is not None:
+            Category.validate_name(name)
+        self._write(row, name, description, is_active)
+        return 1
+
+    def list(self) -> List[Category]:
+        return [self._materialize(row) for row in self._select()]
+
+    def iter_all(self) -> Iterator[Category]:
+        for row in self._select():
+            yield self._materialize(row)
+
+    def find_missing(self, ids: set[UUID]) -> set[UUID]:
+        return {id for id in ids if id not in self._rows}
+
+    def list_page(self, page_size: int, after: tuple[str, UUID] | None = None,
+                  is_active: bool | None = None) -> List[Category]:
+        # ids compare as big-endian bytes in the same order as UUIDs do
+        keys = ((self._names.get(row), self._id_bytes(row), row) for row in self._select(is_active))
+        if after is not None:
+            after_key = (after[0], after[1].bytes)
+            keys = (key for key in keys if key[:2] > after_key)
+        return [self._materialize(row) for _, _, row in heapq.nsmallest(page_size, keys)]
+
+    def get_many(self, ids: set[UUID]) -> List[Category]:
+        return [self._materialize(self._rows[id]) for id in ids if id in self._rows]
+
+    def update_many(self, categories: List[Category]) -> None:
+        for category in categories:
+            self.update(category)
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        return {id for id in ids if self.delete(id)}
+
+    # column scans: predicates are evaluated over whole columns and only matching rows are materialized
+    def count(self, is_active: bool | None = None, name_longer_than: int | None = None) -> int:
+        return self._bits(is_active, name_longer_than).bit_count()
+
+    def find_ids(self, is_active: bool | None = None, name_longer_than: int | None = None) -> List[UUID]:
+        # UUID objects are built only for the matching rows, straight from the id column
+        ids = compress(struct.iter_unpack(f'{_ID_SIZE}s', self._ids), self._mask(is_active, name_longer_than))
+        return [UUID(bytes=id) for id, in ids]
+
+    def find(self, is_active: bool | None = None, name_longer_than: int | None = None) -> List[Category]:
+        return [self._materialize(row) for row in self._select(is_active, name_longer_than)]
+
+    def _bits(self, is_active: bool | None = None, name_longer_than: int | None = None) -> int:
+        # bit columns are padded to whole bytes, the same amount of low bits in every one of them
+        bits = self._live.bits()
+        if is_active is not None:
+            active = self._active.bits()
+            bits &= active if is_active else ~active
+
+        if name_longer_than is not None and bits:
+            digits = self._name_lengths.translate(_longer_than_digits(name_longer_than))
+            bits &= int(digits, 2) << (8 * len(self._live.buffer) - self._size())
+        return bits
+
+    def _mask(self, is_active: bool | None = None, name_longer_than: int | None = None) -> bytes:
+        digits = format(self._bits(is_active, name_longer_than), f'0{8 * len(self._live.buffer)}b')
+        return digits[:self._size()].encode().translate(_DIGITS_TO_MASK)
+
+    def _select(self, is_active: bool | None = None, name_longer_than: int | None = None) -> Iterator[int]:
+        return compress(range(self._size()), self._mask(is_active, name_longer_than))
+
+    def _size(self) -> int:
+        # rows stored, deleted ones included
+        return len(self._name_lengths)
+
+    def _id_bytes(self, row: int) -> bytes:
+        return bytes(self._ids[row * _ID_SIZE:(row + 1) * _ID_SIZE])
+
+    def _materialize(self, row: int) -> Category:
+        return Category.rehydrate(
+            id=UUID(bytes=self._id_bytes(row)),
+            name=self._names.get(row),
+            description=self._descriptions.get(row),
+            is_active=self._active.get(row),
+        )
+
+    def _write(self, row: int, name: str | None, description: str | None, is_active: bool | None) -> None:
+        if name is not None:
+            self._names.set(row, name)
+            self._name_lengths[row] = min(len(name), _MAX_NAME_LENGTH)
+        if description is not None:
+            self._descriptions.set(row, description)
+        if is_active is not None:
+            self._active.set(row, is_active)
+        self._compact_if_needed()
+
+    def _compact_if_needed(self) -> None:
+        dead_rows = self._size() - len(self._rows)
+        wasted_bytes = self._names.garbage + self._descriptions.garbage
+        live_bytes = len(self._names.buffer) + len(self._descriptions.buffer) - wasted_bytes
+        if (dead_rows >= self.COMPACT_MIN_ROWS and dead_rows > len(self._rows)) or \
+                (wasted_bytes >= self.COMPACT_MIN_BYTES and wasted_bytes > live_bytes):
+            self._compact()
+
+    def _compact(self) -> None:
+        rows = list(self._select())
+        new_rows = {row: index for index, row in enumerate(rows)}
+        self._ids = bytearray().join(self._ids[row * _ID_SIZE:(row + 1) * _ID_SIZE] for row in rows)
+        self._live = self._live.take(rows)
+        self._active = self._active.take(rows)
+        self._names = self._names.take(rows)
+        self._name_lengths = bytearray(self._name_lengths[row] for row in rows)
+        self._descriptions = self._descriptions.take(rows)
+        self._rows = {id: new_rows[row] for id, row in self._rows.items()}
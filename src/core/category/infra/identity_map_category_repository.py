@@ -0,0 +1,157 @@
+from typing import Dict, Iterable, Iterator, List, Optional
+from uuid import UUID
+
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+class IdentityMapCategoryRepository(CategoryRepository):
+    # scoped to one unit of work: every category is loaded at most once and always handed out as the
+    # same object, and saves/updates of categories it knows about are queued until flush() writes
+    # them in bulk. Writes whose result depends on the database flush the queue and run right away
+    def __init__(self, repository: CategoryRepository):
+        self.repository = repository
+        # None marks an id that is known not to exist
+        self._identity: Dict[UUID, Optional[Category]] = {}
+        self._new: Dict[UUID, Category] = {}
+        self._dirty: Dict[UUID, Category] = {}
+
+    def save(self, category: Category) -> None:
+        self._identity[category.id] = category
+        self._new[category.id] = category
+
+    def save_many(self, categories: List[Category]) -> None:
+        for category in categories:
+            self.save(category)
+
+    def get_by_id(self, id: UUID) -> Category | None:
+        if id not in self._identity:
+            self._identity[id] = self.repository.get_by_id(id)
+        return self._identity[id]
+
+    def delete(self, id: UUID) -> int:
+        self._dirty.pop(id, None)
+        if self._new.pop(id, None) is not None:
+            self._identity[id] = None
+            return 1
+
+        self.flush()
+        self._identity[id] = None
+        return self.repository.delete(id)
+
+    def update(self, category: Category) -> int:
+        if self._identity.get(category.id) is not None:
+            self._queue_update(category)
+            return 1
+
+        self.flush()
+        updated = self.repository.update(category)
+        if updated:
+            self._identity[category.id] = category
+        return updated
+
+    def update_fields(self, id: UUID, name: str | None = None, description: str | None = None,
+                      is_active: bool | None = None) -> int:
+        category = self._identity.get(id)
+        if category is None:
+            self.flush()
+            # the row is written without being loaded, so any copy we might hold would be stale
+            self._identity.pop(id, None)
+            return self.repository.update_fields(id, name=name, description=description, is_active=is_active)
+
+        category.update_category(
+            name=name if name is not None else category.name,
+            description=description if description is not None else category.description
+        )
+        if is_active:
+            category.activate()
+        if is_active is False:
+            category.deactivate()
+        self._queue_update(category)
+        return 1
+
+    def list(self) -> List[Category]:
+        self.flush()
+        return self._register(self.repository.list())
+
+    def iter_all(self) -> Iterator[Category]:
+        self.flush()
+        for category in self.repository.iter_all():
+            yield self._identity.get(category.id) or category
+
+    def find_missing(self, ids: set[UUID]) -> set[UUID]:
+        # ids not in the map are checked without loading them; only the missing ones are remembered
+        unknown = ids - self._identity.keys()
+        not_found = self.repository.find_missing(unknown) if unknown else set()
+        for id in not_found:
+            self._identity[id] = None
+        return not_found | {id for id in ids - unknown if self._identity[id] is None}
+
+    def list_page(self, page_size: int, after: tuple[str, UUID] | None = None,
+                  is_active: bool | None = None) -> List[Category]:
+        self.flush()
+        return self._register(self.repository.list_page(page_size=page_size, after=after, is_active=is_active))
+
+    def get_many(self, ids: set[UUID]) -> List[Category]:
+        unknown = ids - self._identity.keys()
+        if unknown:
+            loaded = {category.id: category for category in self.repository.get_many(unknown)}
+            for id in unknown:
+                self._identity[id] = loaded.get(id)
+        return [self._identity[id] for id in ids if self._identity[id] is not None]
+
+    def update_many(self, categories: List[Category]) -> None:
+        unknown = []
+        for category in categories:
+            if self._identity.get(category.id) is not None:
+                self._queue_update(category)
+            else:
+                unknown.append(category)
+
+        if unknown:
+            self.flush()
+            self.repository.update_many(unknown)
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        for id in ids & self._dirty.keys():
+            del self._dirty[id]
+        pending = ids & self._new.keys()
+        for id in pending:
+            del self._new[id]
+
+        remaining = ids - pending
+        if not remaining:
+            return pending
+        self.flush()
+        return pending | self.repository.delete_many(remaining)
+        for id in ids:
+            self._identity[id] = None
+
+    def flush(self) -> None:
+        if self._new:
+            new, self._new = list(self._new.values()), {}
+            self.repository.save_many(new)
+        if self._dirty:
+            dirty, self._dirty = list(self._dirty.values()), {}
+            self.repository.update_many(dirty)
+
+    def clear(self) -> None:
+        self._identity.clear()
+        self._new.clear()
+        self._dirty.clear()
+
+    def _queue_update(self, category: Category) -> None:
+        self._identity[category.id] = category
+        if category.id in self._new:
+            self._new[category.id] = category
+        else:
+            self._dirty[category.id] = category
+
+    def _register(self, categories: Iterable[Category]) -> List[Category]:
+        registered = []
+        for category in categories:
+            known = self._identity.get(category.id)
+            if known is None:
+                self._identity[category.id] = known = category
+            registered.append(known)
+        return registered
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import heapq
+from typing import Dict, Iterator, List, Optional
 from uuid import UUID
 
 from src.core.category.domain.category_repository import CategoryRepository
@@ -7,26 +8,72 @@ from src.core.category.domain.category import Category
 
 class InMemoryCategoryRepository(CategoryRepository):
     def __init__(self, categories: List[Category] = None):
-        self.categories = categories or []
+        # dict keeps insertion order, so list() stays stable while point operations are O(1)
+        self._categories: Dict[UUID, Category] = {category.id: category for category in categories or []}
+
+    @property
+    def categories(self) -> List[Category]:
+        return list(self._categories.values())
 
     def save(self, category):
-        self.categories.append(category)
+        self._categories[category.id] = category
+
+    def save_many(self, categories: List[Category]) -> None:
+        for category in categories:
+            self.save(category)
 
     def get_by_id(self, id: UUID) -> Optional[Category]:
-        return next((category for category in self.categories if category.id == id), None)
+        return self._categories.get(id)
+
+    def delete(self, id: UUID) -> int:
+        return 0 if self._categories.pop(id, None) is None else 1
 
-    def delete(self, id: UUID) -> None:
-        category = self.get_by_id(id)
+    def update(self, category: Category) -> int:
+        if category.id not in self._categories:
+            return 0
+        self._categories[category.id] = category
+        return 1
+
+    def update_fields(self, id: UUID, name: str | None = None, description: str | None = None,
+                      is_active: bool | None = None) -> int:
+        category = self._categories.get(id)
         if not category:
-            return
-        self.categories.remove(category)
-        # self.categories = [category for category in self.categories if category.id != id]
+            return 0
 
-    def update(self, category: Category) -> None:
-        if not category in self.categories:
-            return
-        index = self.categories.index(category)
-        self.categories[index] = category
+        category.update_category(
+            name=name if name is not None else category.name,
+            description=description if description is not None else category.description
+        )
+        if is_active:
+            category.activate()
+        if is_active is False:
+            category.deactivate()
+        return 1
 
     def list(self) -> List[Category]:
-        return [category for category in self.categories]
+        return list(self._categories.values())
+
+    def iter_all(self) -> Iterator[Category]:
+        yield from self.list()
+
+    def find_missing(self, ids: set[UUID]) -> set[UUID]:
+        return {id for id in ids if id not in self._categories}
+
+    def list_page(self, page_size: int, after: tuple[str, UUID] | None = None,
+                  is_active: bool | None = None) -> List[Category]:
+        categories = self._categories.values()
+        if is_active is not None:
+            categories = (category for category in categories if category.is_active is is_active)
+        if after is not None:
+            categories = (category for category in categories if (category.name, category.id) > after)
+        return heapq.nsmallest(page_size, categories, key=lambda category: (category.name, category.id))
+
+    def get_many(self, ids: set[UUID]) -> List[Category]:
+        return [self._categories[id] for id in ids if id in self._categories]
+
+    def update_many(self, categories: List[Category]) -> None:
+        for category in categories:
+            self.update(category)
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        return {id for id in ids if self.delete(id)}
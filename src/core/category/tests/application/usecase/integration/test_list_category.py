@@ -31,3 +31,30 @@ class TestListCategory:
                            description=category_series.description, is_active=category_series.is_active),
         ])
 
+
+    def test_can_walk_all_pages_ordered_by_name(self):
+        categories = [Category(name=name) for name in ('Series', 'Films', 'Documentaries', 'Anime', 'Films')]
+        repository = InMemoryCategoryRepository(categories=categories)
+        use_case = ListCategory(repository=repository)
+
+        pages = []
+        response = use_case.execute(request=ListCategoryRequest(page_size=2))
+        pages.append(response.data)
+        while response.next_cursor:
+            response = use_case.execute(request=ListCategoryRequest(page_size=2, cursor=response.next_cursor))
+            pages.append(response.data)
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        listed = [category for page in pages for category in page]
+        assert [category.name for category in listed] == ['Anime', 'Documentaries', 'Films', 'Films', 'Series']
+        assert {category.id for category in listed} == {category.id for category in categories}
+
+    def test_when_is_active_is_given_then_list_only_matching_categories(self):
+        category_film = Category(name='Films', description='Category for films')
+        category_series = Category(name='Series', description='Category for series', is_active=False)
+        repository = InMemoryCategoryRepository(categories=[category_film, category_series])
+
+        use_case = ListCategory(repository=repository)
+        response = use_case.execute(request=ListCategoryRequest(is_active=False))
+
+        assert [category.id for category in response.data] == [category_series.id]
@@ -0,0 +1,54 @@
+from unittest.mock import create_autospec
+from uuid import UUID
+
+from src.core.category.application.usecase.bulk_create_category import BulkCreateCategory, \
+    BulkCreateCategoryRequest, BulkCreateCategoryError
+from src.core.category.application.usecase.create_category import CreateCategoryRequest
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+class TestBulkCreateCategory:
+    def test_create_all_valid_categories_in_one_call(self):
+        mock_repository = create_autospec(CategoryRepository)
+        use_case = BulkCreateCategory(repository=mock_repository)
+
+        response = use_case.execute(request=BulkCreateCategoryRequest(categories=[
+            CreateCategoryRequest(name='Films', description='Category for films'),
+            CreateCategoryRequest(name='Series', is_active=False),
+        ]))
+
+        assert [item.index for item in response.created] == [0, 1]
+        assert all(isinstance(item.id, UUID) for item in response.created)
+        assert response.errors == []
+        mock_repository.save_many.assert_called_once()
+        saved = mock_repository.save_many.call_args.args[0]
+        assert [category.id for category in saved] == [item.id for item in response.created]
+        assert saved[1].is_active is False
+
+    def test_invalid_categories_are_reported_without_aborting_valid_ones(self):
+        mock_repository = create_autospec(CategoryRepository)
+        use_case = BulkCreateCategory(repository=mock_repository)
+
+        response = use_case.execute(request=BulkCreateCategoryRequest(categories=[
+            CreateCategoryRequest(name=''),
+            CreateCategoryRequest(name='Films'),
+            CreateCategoryRequest(name='a' * 256),
+        ]))
+
+        assert [item.index for item in response.created] == [1]
+        assert response.errors == [
+            BulkCreateCategoryError(index=0, message='name cannot be empty'),
+            BulkCreateCategoryError(index=2, message='name cannot be longer than 255 characters'),
+        ]
+        saved = mock_repository.save_many.call_args.args[0]
+        assert [category.name for category in saved] == ['Films']
+
+    def test_when_every_category_is_invalid_then_save_nothing(self):
+        mock_repository = create_autospec(CategoryRepository)
+        use_case = BulkCreateCategory(repository=mock_repository)
+
+        response = use_case.execute(request=BulkCreateCategoryRequest(categories=[CreateCategoryRequest(name='')]))
+
+        assert response.created == []
+        assert len(response.errors) == 1
+        mock_repository.save_many.assert_not_called()
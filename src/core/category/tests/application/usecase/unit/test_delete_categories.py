@@ -0,0 +1,31 @@
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+from src.core.category.application.usecase.delete_categories import DeleteCategories, DeleteCategoriesRequest, \
+    DeleteCategoriesResponse
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+class TestDeleteCategories:
+    def test_delete_existing_ids_and_report_missing_ones(self):
+        existing_ids = {uuid4(), uuid4()}
+        missing_id = uuid4()
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.delete_many.return_value = existing_ids
+
+        use_case = DeleteCategories(repository=mock_repository)
+        response = use_case.execute(request=DeleteCategoriesRequest(ids=existing_ids | {missing_id}))
+
+        assert response == DeleteCategoriesResponse(not_found={missing_id})
+        mock_repository.delete_many.assert_called_once_with(existing_ids | {missing_id})
+        mock_repository.find_missing.assert_not_called()
+
+    def test_when_no_id_exists_then_report_them_all(self):
+        ids = {uuid4()}
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.delete_many.return_value = set()
+
+        use_case = DeleteCategories(repository=mock_repository)
+        response = use_case.execute(request=DeleteCategoriesRequest(ids=ids))
+
+        assert response == DeleteCategoriesResponse(not_found=ids)
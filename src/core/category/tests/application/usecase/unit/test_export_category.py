@@ -0,0 +1,34 @@
+from unittest.mock import create_autospec
+
+from src.core.category.application.usecase.export_category import ExportCategory, ExportCategoryRequest
+from src.core.category.application.usecase.list_category import CategoryOutput
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+class TestExportCategory:
+    def test_when_no_category_then_export_nothing(self):
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.iter_all.return_value = iter([])
+
+        use_case = ExportCategory(repository=mock_repository)
+        response = use_case.execute(request=ExportCategoryRequest())
+
+        assert list(response.data) == []
+
+    def test_categories_are_read_lazily_from_repository(self):
+        category_film = Category(name='Films', description='Category for films')
+        category_series = Category(name='Series', description='Category for series', is_active=False)
+
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.iter_all.return_value = iter([category_film, category_series])
+
+        use_case = ExportCategory(repository=mock_repository)
+        response = use_case.execute(request=ExportCategoryRequest())
+
+        assert next(response.data) == CategoryOutput(id=category_film.id, name=category_film.name,
+                                                     description=category_film.description, is_active=True)
+        assert list(response.data) == [
+            CategoryOutput(id=category_series.id, name=category_series.name,
+                           description=category_series.description, is_active=False),
+        ]
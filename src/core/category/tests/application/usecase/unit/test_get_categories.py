@@ -0,0 +1,42 @@
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+from src.core.category.application.usecase.get_categories import GetCategories, GetCategoriesRequest, \
+    GetCategoriesResponse
+from src.core.category.application.usecase.list_category import CategoryOutput
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+class TestGetCategories:
+    def test_return_found_categories_and_missing_ids(self):
+        category_series = Category(name='Series', description='Category for series')
+        category_films = Category(name='Films', description='Category for films', is_active=False)
+        missing_id = uuid4()
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.get_many.return_value = [category_series, category_films]
+        ids = {category_series.id, category_films.id, missing_id}
+
+        use_case = GetCategories(repository=mock_repository)
+        response = use_case.execute(request=GetCategoriesRequest(ids=ids))
+
+        assert response == GetCategoriesResponse(
+            data=[
+                CategoryOutput(id=category_films.id, name='Films', description='Category for films',
+                               is_active=False),
+                CategoryOutput(id=category_series.id, name='Series', description='Category for series',
+                               is_active=True),
+            ],
+            not_found={missing_id}
+        )
+        mock_repository.get_many.assert_called_once_with(ids)
+
+    def test_when_no_id_exists_then_return_only_missing_ids(self):
+        ids = {uuid4(), uuid4()}
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.get_many.return_value = []
+
+        use_case = GetCategories(repository=mock_repository)
+        response = use_case.execute(request=GetCategoriesRequest(ids=ids))
+
+        assert response == GetCategoriesResponse(data=[], not_found=ids)
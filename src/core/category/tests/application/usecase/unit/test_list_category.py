@@ -1,5 +1,8 @@
 from unittest.mock import create_autospec
 
+import pytest
+
+from src.core._shared.pagination import InvalidCursor, InvalidPageSize, encode_cursor
 from src.core.category.domain.category_repository import CategoryRepository
 from src.core.category.application.usecase.list_category import ListCategory, ListCategoryResponse, CategoryOutput, \
     ListCategoryRequest
@@ -9,7 +12,7 @@ from src.core.category.domain.category import Category
 class TestListCategory:
     def test_when_no_category_then_return_empty_list(self):
         mock_repository = create_autospec(CategoryRepository)
-        mock_repository.list.return_value = []
+        mock_repository.list_page.return_value = []
 
         use_case = ListCategory(repository=mock_repository)
         response = use_case.execute(request=ListCategoryRequest())
@@ -21,7 +24,7 @@ class TestListCategory:
         category_series = Category(name='Series', description='Category for series', is_active=False)
 
         mock_repository = create_autospec(CategoryRepository)
-        mock_repository.list.return_value = [category_film, category_series]
+        mock_repository.list_page.return_value = [category_film, category_series]
 
         use_case = ListCategory(repository=mock_repository)
         response = use_case.execute(request=ListCategoryRequest())
@@ -35,3 +38,51 @@ class TestListCategory:
                            description=category_series.description, is_active=category_series.is_active),
         ])
 
+    def test_when_more_categories_than_page_size_then_return_next_cursor(self):
+        category_film = Category(name='Films', description='Category for films')
+        category_series = Category(name='Series', description='Category for series')
+
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.list_page.return_value = [category_film, category_series]
+
+        use_case = ListCategory(repository=mock_repository)
+        response = use_case.execute(request=ListCategoryRequest(page_size=1))
+
+        mock_repository.list_page.assert_called_once_with(page_size=2, after=None, is_active=None)
+        assert response == ListCategoryResponse(
+            data=[CategoryOutput(id=category_film.id, name=category_film.name,
+                                 description=category_film.description, is_active=category_film.is_active)],
+            next_cursor=encode_cursor(category_film.name, category_film.id),
+        )
+
+    def test_when_cursor_is_given_then_list_after_its_key(self):
+        category_film = Category(name='Films', description='Category for films')
+
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.list_page.return_value = []
+
+        use_case = ListCategory(repository=mock_repository)
+        use_case.execute(request=ListCategoryRequest(page_size=10, is_active=True,
+                                                     cursor=encode_cursor(category_film.name, category_film.id)))
+
+        mock_repository.list_page.assert_called_once_with(page_size=11, is_active=True,
+                                                          after=(category_film.name, category_film.id))
+
+    def test_when_cursor_is_invalid_then_raise_exception(self):
+        mock_repository = create_autospec(CategoryRepository)
+
+        use_case = ListCategory(repository=mock_repository)
+        with pytest.raises(InvalidCursor):
+            use_case.execute(request=ListCategoryRequest(cursor='not-a-cursor'))
+
+        mock_repository.list_page.assert_not_called()
+
+    @pytest.mark.parametrize('page_size', [0, -1])
+    def test_when_page_size_is_not_positive_then_raise_exception(self, page_size: int):
+        mock_repository = create_autospec(CategoryRepository)
+
+        use_case = ListCategory(repository=mock_repository)
+        with pytest.raises(InvalidPageSize):
+            use_case.execute(request=ListCategoryRequest(page_size=page_size))
+
+        mock_repository.list_page.assert_not_called()
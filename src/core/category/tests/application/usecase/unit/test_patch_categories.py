@@ -0,0 +1,61 @@
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+import pytest
+
+from src.core.category.application.usecase.exceptions import InvalidCategoryData
+from src.core.category.application.usecase.patch_categories import PatchCategories, PatchCategoriesRequest, \
+    PatchCategoriesResponse
+from src.core.category.application.usecase.update_category import UpdateCategoryRequest
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+
+
+class TestPatchCategories:
+    def test_apply_patches_and_write_them_in_one_call(self):
+        category_film = Category(name='Films', description='Category for films')
+        category_series = Category(name='Series', description='Category for series')
+        missing_id = uuid4()
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.get_many.return_value = [category_film, category_series]
+
+        use_case = PatchCategories(repository=mock_repository)
+        response = use_case.execute(request=PatchCategoriesRequest(categories=[
+            UpdateCategoryRequest(id=category_film.id, is_active=False),
+            UpdateCategoryRequest(id=category_series.id, name='TV Series'),
+            UpdateCategoryRequest(id=missing_id, is_active=False),
+        ]))
+
+        assert response == PatchCategoriesResponse(not_found={missing_id})
+        mock_repository.get_many.assert_called_once_with({category_film.id, category_series.id, missing_id})
+        mock_repository.update_many.assert_called_once_with([category_film, category_series])
+        assert category_film.is_active is False
+        assert category_film.name == 'Films'
+        assert category_series.name == 'TV Series'
+        assert category_series.description == 'Category for series'
+
+    def test_when_patch_is_invalid_then_raise_exception_and_write_nothing(self):
+        category_film = Category(name='Films', description='Category for films')
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.get_many.return_value = [category_film]
+
+        use_case = PatchCategories(repository=mock_repository)
+        with pytest.raises(InvalidCategoryData, match='name cannot be empty'):
+            use_case.execute(request=PatchCategoriesRequest(categories=[
+                UpdateCategoryRequest(id=category_film.id, name=''),
+            ]))
+
+        mock_repository.update_many.assert_not_called()
+
+    def test_when_no_category_exists_then_write_nothing(self):
+        missing_id = uuid4()
+        mock_repository = create_autospec(CategoryRepository)
+        mock_repository.get_many.return_value = []
+
+        use_case = PatchCategories(repository=mock_repository)
+        response = use_case.execute(request=PatchCategoriesRequest(categories=[
+            UpdateCategoryRequest(id=missing_id, is_active=False),
+        ]))
+
+        assert response == PatchCategoriesResponse(not_found={missing_id})
+        mock_repository.update_many.assert_not_called()
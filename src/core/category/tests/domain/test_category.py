@@ -1,4 +1,5 @@
 import pytest
+import copy
 import uuid
 from uuid import UUID
 
@@ -58,6 +59,18 @@ class TestCategory:
         with pytest.raises(ValueError, match='name cannot be empty'):
             Category(name='')
 
+class TestValidateName:
+    def test_valid_name_passes(self):
+        Category.validate_name('Movies')
+
+    def test_empty_name_is_rejected(self):
+        with pytest.raises(ValueError, match='name cannot be empty'):
+            Category.validate_name('')
+
+    def test_long_name_is_rejected(self):
+        with pytest.raises(ValueError, match='name cannot be longer than 255 characters'):
+            Category.validate_name('a' * 256)
+
 class TestUpdateCategory:
     def test_update_category_with_name_and_description(self):
         new_name = 'Films'
@@ -137,4 +150,85 @@ class TestEquality:
         dummy = Dummy()
         dummy.id = cat_id
 
-        assert category != dummy
\ No newline at end of file
+        assert category != dummy
+
+class TestChangeTracking:
+    def test_new_category_has_every_field_changed(self):
+        category = Category(name='Movies')
+
+        assert category.changed_fields == {'name', 'description', 'is_active'}
+
+    def test_mutators_record_only_values_that_changed(self):
+        category = Category(name='Movies', description='Category for movies')
+        category.clear_changes()
+
+        category.update_category(name='Films', description='Category for movies')
+        category.activate()
+
+        assert category.changed_fields == {'name'}
+
+        category.deactivate()
+
+        assert category.changed_fields == {'name', 'is_active'}
+
+    def test_direct_assignment_is_recorded(self):
+        category = Category(name='Movies')
+        category.clear_changes()
+
+        category.description = 'Category for movies'
+
+        assert category.changed_fields == {'description'}
+
+    def test_clear_changes(self):
+        category = Category(name='Movies')
+
+        category.clear_changes()
+
+        assert category.changed_fields == set()
+
+
+class TestRehydrate:
+    def test_rehydrated_category_behaves_like_a_constructed_one(self):
+        cat_id = uuid.uuid4()
+
+        category = Category.rehydrate(id=cat_id, name='Movies', description='Category for movies', is_active=False)
+
+        assert category == Category(name='Movies', id=cat_id)
+        assert category.name == 'Movies'
+        assert category.description == 'Category for movies'
+        assert category.is_active is False
+        assert repr(category) == f'<Category id={cat_id} name=Movies>'
+        assert category.changed_fields == set()
+
+    def test_rehydrated_category_tracks_later_changes(self):
+        category = Category.rehydrate(id=uuid.uuid4(), name='Movies', description='', is_active=True)
+
+        category.deactivate()
+
+        assert category.changed_fields == {'is_active'}
+
+    def test_rehydrate_trusts_stored_data(self):
+        category = Category.rehydrate(id=uuid.uuid4(), name='a' * 256, description='', is_active=True)
+
+        assert category.name == 'a' * 256
+
+
+class TestSlots:
+    def test_category_has_no_instance_dict(self):
+        category = Category(name='Movies')
+
+        assert not hasattr(category, '__dict__')
+        with pytest.raises(AttributeError):
+            category.unknown = 'value'
+
+    def test_deepcopy_keeps_fields_and_changes(self):
+        category = Category(name='Movies', description='Category for movies')
+        category.clear_changes()
+        category.deactivate()
+
+        category_copy = copy.deepcopy(category)
+
+        assert category_copy == category
+        assert category_copy.description == 'Category for movies'
+        assert category_copy.is_active is False
+        assert category_copy.changed_fields == {'is_active'}
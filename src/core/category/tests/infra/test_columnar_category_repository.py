@@ -0,0 +1,192 @@
+import uuid
+
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.category.infra.columnar_category_repository import ColumnarCategoryRepository
+
+
+class TestSave:
+    def test_can_save_category(self):
+        repository = ColumnarCategoryRepository()
+        category = Category(name='Séries', description='Category for series', is_active=False)
+
+        repository.save(category)
+
+        [saved] = repository.categories
+        assert saved == category
+        assert saved.name == 'Séries'
+        assert saved.description == 'Category for series'
+        assert saved.is_active is False
+
+    def test_when_category_is_saved_twice_then_keep_single_entry(self):
+        repository = ColumnarCategoryRepository()
+        category = Category(name='Series', description='Category for series')
+
+        repository.save(category)
+        category.name = 'Shows'
+        repository.save(category)
+
+        assert len(repository.categories) == 1
+        assert repository.categories[0].name == 'Shows'
+
+
+class TestGetById:
+    def test_can_get_category_by_id(self):
+        category_film = Category(name='Films', description='Category for films')
+        category_series = Category(name='Series', description='Category for series', is_active=False)
+        repository = ColumnarCategoryRepository(categories=[category_film, category_series])
+
+        response = repository.get_by_id(id=category_series.id)
+
+        assert response == category_series
+        assert response.is_active is False
+        assert response.changed_fields == set()
+
+    def test_when_category_does_not_exist_then_return_none(self):
+        repository = ColumnarCategoryRepository(categories=[Category(name='Films')])
+
+        assert repository.get_by_id(id=uuid.uuid4()) is None
+
+
+class TestDeleteAndUpdate:
+    def test_delete_and_update_return_rows_affected(self):
+        category_film = Category(name='Films', description='Category for films')
+        category_series = Category(name='Series', description='Category for series')
+        repository = ColumnarCategoryRepository(categories=[category_film, category_series])
+        category_film.update_category(name='Movies', description='')
+        category_film.deactivate()
+
+        assert repository.update(category_film) == 1
+        assert repository.delete(category_series.id) == 1
+        assert repository.delete(category_series.id) == 0
+        assert repository.update(Category(name='Documentaries')) == 0
+
+        [category] = repository.list()
+        assert category.name == 'Movies'
+        assert category.description == ''
+        assert category.is_active is False
+
+    def test_update_fields_writes_only_given_fields(self):
+        category_film = Category(name='Films', description='Category for films')
+        repository = ColumnarCategoryRepository(categories=[category_film])
+
+        assert repository.update_fields(category_film.id, is_active=False) == 1
+        assert repository.update_fields(uuid.uuid4(), name='Movies') == 0
+
+        category = repository.get_by_id(category_film.id)
+        assert category.is_active is False
+        assert category.name == 'Films'
+        assert category.description == 'Category for films'
+
+    def test_update_fields_validates_name(self):
+        category_film = Category(name='Films')
+        repository = ColumnarCategoryRepository(categories=[category_film])
+
+        with pytest.raises(ValueError, match='name cannot be empty'):
+            repository.update_fields(category_film.id, name='')
+
+    def test_list_keeps_insertion_order_after_update_and_delete(self):
+        categories = [Category(name='Films'), Category(name='Series'), Category(name='Documentaries')]
+        repository = ColumnarCategoryRepository(categories=categories)
+
+        repository.update_fields(categories[0].id, name='Movies')
+        repository.delete(categories[1].id)
+
+        assert repository.list() == [categories[0], categories[2]]
+        assert repository.list()[0].name == 'Movies'
+
+
+class TestListPage:
+    def test_pages_are_ordered_by_name_and_id(self):
+        first, second = sorted([uuid.uuid4(), uuid.uuid4()])
+        categories = [
+            Category(name='Series'),
+            Category(name='Films', id=second),
+            Category(name='Films', id=first),
+            Category(name='Documentaries'),
+        ]
+        repository = ColumnarCategoryRepository(categories=categories)
+
+        page = repository.list_page(page_size=2, after=('Documentaries', categories[3].id))
+
+        assert [category.id for category in page] == [first, second]
+        assert [category.name for category in repository.list_page(page_size=10)] == \
+            ['Documentaries', 'Films', 'Films', 'Series']
+
+    def test_pages_can_be_filtered_by_active_state(self):
+        categories = [Category(name='Series', is_active=False), Category(name='Films'), Category(name='Anime')]
+        repository = ColumnarCategoryRepository(categories=categories)
+
+        assert [category.name for category in repository.list_page(page_size=10, is_active=True)] == \
+            ['Anime', 'Films']
+        assert [category.name for category in repository.list_page(page_size=10, is_active=False)] == ['Series']
+
+
+class TestColumnScans:
+    @pytest.fixture
+    def repository(self) -> ColumnarCategoryRepository:
+        return ColumnarCategoryRepository(categories=[
+            Category(name='Films'),
+            Category(name='Documentaries', is_active=False),
+            Category(name='Series', is_active=False),
+            Category(name='Animations'),
+        ])
+
+    def test_count(self, repository: ColumnarCategoryRepository):
+        assert repository.count() == 4
+        assert repository.count(is_active=True) == 2
+        assert repository.count(is_active=False) == 2
+        assert repository.count(name_longer_than=6) == 2
+        assert repository.count(is_active=False, name_longer_than=6) == 1
+
+    def test_find_ids_and_find_return_only_matching_rows(self, repository: ColumnarCategoryRepository):
+        inactive = [category for category in repository.list() if not category.is_active]
+
+        assert repository.find_ids(is_active=False) == [category.id for category in inactive]
+        assert [category.name for category in repository.find(is_active=True, name_longer_than=5)] == \
+            ['Animations']
+
+    def test_deleted_rows_are_skipped(self, repository: ColumnarCategoryRepository):
+        films = repository.list()[0]
+
+        repository.delete(films.id)
+
+        assert repository.count(is_active=True) == 1
+        assert films.id not in repository.find_ids()
+
+    def test_active_flags_are_packed_across_bytes(self):
+        categories = [Category(name=f'Category {i:02}', is_active=i % 3 == 0) for i in range(21)]
+        repository = ColumnarCategoryRepository(categories=categories)
+
+        repository.update_fields(categories[8].id, is_active=True)
+        repository.update_fields(categories[9].id, is_active=False)
+        repository.delete(categories[20].id)
+
+        active = [category.id for i, category in enumerate(categories) if (i % 3 == 0 or i == 8) and i not in (9, 20)]
+        assert len(repository._active.buffer) == 3
+        assert repository.find_ids(is_active=True) == active
+        assert repository.count(is_active=False) == 20 - len(active)
+        assert repository.get_by_id(categories[8].id).is_active is True
+
+
+class TestCompaction:
+    def test_deleted_rows_are_reclaimed(self):
+        categories = [Category(name=f'Category {i}') for i in range(ColumnarCategoryRepository.COMPACT_MIN_ROWS * 3)]
+        repository = ColumnarCategoryRepository(categories=categories)
+
+        repository.delete_many({category.id for category in categories[:-10]})
+
+        assert repository._size() < ColumnarCategoryRepository.COMPACT_MIN_ROWS
+        assert repository.list() == categories[-10:]
+        assert repository.get_by_id(categories[-1].id).name == categories[-1].name
+
+    def test_replaced_strings_are_reclaimed(self):
+        category = Category(name='Films')
+        repository = ColumnarCategoryRepository(categories=[category])
+
+        for i in range(ColumnarCategoryRepository.COMPACT_MIN_BYTES // 8):
+            repository.update_fields(category.id, description=f'{i:>10}')
+
+        assert len(repository._descriptions.buffer) < ColumnarCategoryRepository.COMPACT_MIN_BYTES
+        assert repository.get_by_id(category.id).description.strip() == str(i)
@@ -0,0 +1,121 @@
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.category.domain.category import Category
+from src.core.category.infra.identity_map_category_repository import IdentityMapCategoryRepository
+from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
+
+
+@pytest.fixture
+def category_films() -> Category:
+    return Category(name='Films', description='Category for films')
+
+
+@pytest.fixture
+def category_series() -> Category:
+    return Category(name='Series', description='Category for series')
+
+
+@pytest.fixture
+def inner(category_films: Category, category_series: Category) -> Mock:
+    return Mock(wraps=InMemoryCategoryRepository(categories=[category_films, category_series]))
+
+
+@pytest.fixture
+def repository(inner: Mock) -> IdentityMapCategoryRepository:
+    return IdentityMapCategoryRepository(repository=inner)
+
+
+class TestIdentityMap:
+    def test_category_is_loaded_once_and_returned_as_the_same_object(self, repository: IdentityMapCategoryRepository,
+                                                                      inner: Mock, category_films: Category):
+        first = repository.get_by_id(category_films.id)
+        second = repository.get_by_id(category_films.id)
+        [third] = repository.get_many({category_films.id})
+
+        assert first is second is third
+        inner.get_by_id.assert_called_once_with(category_films.id)
+        inner.get_many.assert_not_called()
+
+    def test_missing_ids_are_remembered(self, repository: IdentityMapCategoryRepository, inner: Mock,
+                                        category_films: Category):
+        not_found_id = uuid.uuid4()
+
+        assert repository.get_by_id(not_found_id) is None
+        assert repository.find_missing({category_films.id, not_found_id}) == {not_found_id}
+        inner.get_by_id.assert_called_once_with(not_found_id)
+        inner.find_missing.assert_called_once_with({category_films.id})
+        inner.get_many.assert_not_called()
+
+    def test_lists_hand_out_the_already_loaded_objects(self, repository: IdentityMapCategoryRepository,
+                                                       category_films: Category):
+        loaded = repository.get_by_id(category_films.id)
+
+        assert any(category is loaded for category in repository.list())
+        assert any(category is loaded for category in repository.list_page(page_size=10))
+
+
+class TestPendingWrites:
+    def test_saves_and_updates_are_written_in_bulk_on_flush(self, repository: IdentityMapCategoryRepository,
+                                                           inner: Mock, category_films: Category,
+                                                           category_series: Category):
+        documentaries = Category(name='Documentaries')
+        repository.save(documentaries)
+        repository.get_many({category_films.id, category_series.id})
+        films = repository.get_by_id(category_films.id)
+        films.deactivate()
+
+        assert repository.update(films) == 1
+        assert repository.update_fields(category_series.id, name='Shows') == 1
+        assert repository.get_by_id(documentaries.id) is documentaries
+        inner.save.assert_not_called()
+        inner.update.assert_not_called()
+        inner.update_fields.assert_not_called()
+
+        repository.flush()
+
+        inner.save_many.assert_called_once_with([documentaries])
+        inner.update_many.assert_called_once()
+        assert {category.name for category in inner.update_many.call_args.args[0]} == {'Films', 'Shows'}
+        assert inner.get_by_id(category_series.id).name == 'Shows'
+
+    def test_updates_of_unknown_categories_run_immediately(self, repository: IdentityMapCategoryRepository,
+                                                           inner: Mock, category_films: Category):
+        category_films.deactivate()
+
+        assert repository.update(category_films) == 1
+        assert repository.update(Category(name='Documentaries')) == 0
+        assert repository.update_fields(uuid.uuid4(), name='Shows') == 0
+        assert inner.update.call_count == 2
+
+    def test_deleting_a_pending_category_never_writes_it(self, repository: IdentityMapCategoryRepository,
+                                                         inner: Mock):
+        documentaries = Category(name='Documentaries')
+        repository.save(documentaries)
+
+        assert repository.delete(documentaries.id) == 1
+        assert repository.get_by_id(documentaries.id) is None
+        repository.flush()
+
+        inner.save_many.assert_not_called()
+        inner.delete.assert_not_called()
+
+    def test_immediate_writes_flush_pending_ones_first(self, repository: IdentityMapCategoryRepository,
+                                                       inner: Mock, category_films: Category):
+        documentaries = Category(name='Documentaries')
+        repository.save(documentaries)
+
+        repository.delete_many({category_films.id})
+
+        assert [call[0] for call in inner.method_calls] == ['save_many', 'delete_many']
+        assert repository.get_by_id(category_films.id) is None
+
+    def test_clear_drops_pending_writes(self, repository: IdentityMapCategoryRepository, inner: Mock):
+        repository.save(Category(name='Documentaries'))
+
+        repository.clear()
+        repository.flush()
+
+        inner.save_many.assert_not_called()
@@ -15,6 +15,16 @@ class TestSave:
         assert len(repository.categories) == 1
         assert repository.categories[0] == category
 
+    def test_when_category_is_saved_twice_then_keep_single_entry(self):
+        repository = InMemoryCategoryRepository()
+        category = Category(name='Series', description='Category for series')
+
+        repository.save(category)
+        repository.save(category)
+
+        assert len(repository.categories) == 1
+        assert repository.categories[0] == category
+
 class TestGetById:
     def test_can_get_category_by_id(self):
         category_film = Category(name='Films', description='Category for films')
@@ -165,4 +175,56 @@ class TestList:
 
         assert len(response) == 2
         assert category_film in response
-        assert category_series in response
\ No newline at end of file
+        assert category_series in response
+
+    def test_list_keeps_insertion_order_after_update_and_delete(self):
+        category_film = Category(name='Films', description='Category for films')
+        category_series = Category(name='Series', description='Category for series')
+        category_documentary = Category(name='Documentaries', description='Category for documentaries')
+        repository = InMemoryCategoryRepository(categories=[category_film, category_series, category_documentary])
+        category_to_update = copy.deepcopy(category_film)
+        category_to_update.name = 'Movies'
+
+        repository.update(category=category_to_update)
+        repository.delete(id=category_series.id)
+
+        response = repository.list()
+
+        assert response == [category_film, category_documentary]
+        assert response[0].name == 'Movies'
+
+class TestFindMissing:
+    def test_return_ids_not_in_repository(self):
+        category_film = Category(name='Films', description='Category for films')
+        category_series = Category(name='Series', description='Category for series')
+        repository = InMemoryCategoryRepository(categories=[category_film, category_series])
+        not_found_id = uuid.uuid4()
+
+        response = repository.find_missing({category_film.id, not_found_id})
+
+        assert response == {not_found_id}
+
+    def test_when_all_ids_exist_then_return_empty_set(self):
+        category_film = Category(name='Films', description='Category for films')
+        repository = InMemoryCategoryRepository(categories=[category_film])
+
+        assert repository.find_missing({category_film.id}) == set()
+        assert repository.find_missing(set()) == set()
+
+class TestUpdateFields:
+    def test_update_only_given_fields(self):
+        category_film = Category(name='Films', description='Category for films')
+        repository = InMemoryCategoryRepository(categories=[category_film])
+
+        updated = repository.update_fields(category_film.id, is_active=False)
+
+        assert updated == 1
+        assert repository.categories[0].is_active is False
+        assert repository.categories[0].name == 'Films'
+        assert repository.categories[0].description == 'Category for films'
+
+    def test_when_category_does_not_exist_then_return_zero(self):
+        repository = InMemoryCategoryRepository()
+
+        assert repository.update_fields(uuid.uuid4(), name='Movies') == 0
+        assert repository.delete(uuid.uuid4()) == 0
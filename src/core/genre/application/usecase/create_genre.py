@@ -23,9 +23,9 @@ class CreateGenre:
         id: UUID
 
     def execute(self, input: Input) -> Output:
-        category_ids = {category.id for category in self.category_repository.list()}
-        if not input.category_ids.issubset(category_ids):
-            raise RelatedCategoriesNotFound(f'Categories not found: {str(input.category_ids - category_ids)}')
+        missing_category_ids = self.category_repository.find_missing(input.category_ids)
+        if missing_category_ids:
+            raise RelatedCategoriesNotFound(f'Categories not found: {str(missing_category_ids)}')
 
         try:
             genre = Genre(name=input.name, categories=input.category_ids, is_active=input.is_active)
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import List
 from uuid import UUID
 
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor, validate_page_size
 from src.core.genre.domain.genre_repository import GenreRepository
 
 
@@ -19,14 +20,32 @@ class ListGenre:
 
     @dataclass
     class Input:
-        pass
+        page_size: int = DEFAULT_PAGE_SIZE
+        cursor: str | None = None
+        is_active: bool | None = None
+        category_id: UUID | None = None
+        name_prefix: str | None = None
 
     @dataclass
     class Output:
         data: List[GenreOutput]
+        next_cursor: str | None = None
 
     def execute(self, input: Input) -> Output:
-        genres = self.repository.list()
+        validate_page_size(input.page_size)
+        after = decode_cursor(input.cursor) if input.cursor else None
+        genres = self.repository.list_page(
+            page_size=input.page_size + 1,
+            after=after,
+            is_active=input.is_active,
+            category_id=input.category_id,
+            name_prefix=input.name_prefix,
+        )
+
+        next_cursor = None
+        if len(genres) > input.page_size:
+            genres = genres[:input.page_size]
+            next_cursor = encode_cursor(genres[-1].name, genres[-1].id)
 
         mapped_genres = [
             GenreOutput(
@@ -36,4 +55,4 @@ class ListGenre:
                 categories=genre.categories
             ) for genre in genres
         ]
-        return self.Output(data=mapped_genres)
\ No newline at end of file
+        return self.Output(data=mapped_genres, next_cursor=next_cursor)
@@ -25,9 +25,9 @@ class UpdateGenre:
 
         name = input.name if input.name is not None else genre.name
         categories = input.category_ids if input.category_ids is not None else genre.categories
-        category_ids = {category.id for category in self.category_repository.list()}
-        if not categories.issubset(category_ids):
-            raise RelatedCategoriesNotFound(f'Categories not found: {str(input.category_ids - category_ids)}')
+        missing_category_ids = self.category_repository.find_missing(categories)
+        if missing_category_ids:
+            raise RelatedCategoriesNotFound(f'Categories not found: {str(missing_category_ids)}')
 
         try:
             genre.change_name(name)
@@ -47,4 +47,6 @@ class UpdateGenre:
         if input.is_active is False:
             genre.deactivate()
 
-        self.genre_repository.update(genre)
+        self.genre_repository.update(
+            genre, categories_added=categories_to_add, categories_removed=categories_to_remove
+        )
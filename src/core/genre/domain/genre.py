@@ -1,10 +1,27 @@
 from dataclasses import dataclass, field
 from uuid import UUID
 import uuid
+import weakref
 
+from src.core._shared.change_tracking import ChangeTracked
+
+# category ids are shared by many genres, so equal ids are interned to a single UUID object
+# (keyed by its 128-bit int, which the UUID already holds); entries go away with the last genre using them
+_category_ids: 'weakref.WeakValueDictionary[int, UUID]' = weakref.WeakValueDictionary()
+
+
+def _intern_category_id(category_id: UUID) -> UUID:
+    return _category_ids.setdefault(category_id.int, category_id)
+
+
+def _intern_category_ids(category_ids: set[UUID]) -> set[UUID]:
+    return {_intern_category_id(category_id) for category_id in category_ids}
+
+
+@dataclass(slots=True)
+class Genre(ChangeTracked):
+    TRACKED_FIELDS = ('name', 'is_active', 'categories')
 
-@dataclass
-class Genre:
     name: str
     id: UUID = field(default_factory=uuid.uuid4)
     is_active: bool = True
@@ -12,6 +29,24 @@ class Genre:
 
     def __post_init__(self):
         self.validate()
+        self._mark_all_changed()
+
+    def __setattr__(self, name, value):
+        if name == 'categories':
+            value = _intern_category_ids(value)
+        ChangeTracked.__setattr__(self, name, value)
+
+    @classmethod
+    def rehydrate(cls, id: UUID, name: str, is_active: bool, categories: set[UUID]) -> 'Genre':
+        # trusted path for data that was validated when it was written: no __init__, validation or tracking
+        genre = object.__new__(cls)
+        setattr_ = object.__setattr__
+        setattr_(genre, 'name', name)
+        setattr_(genre, 'id', id)
+        setattr_(genre, 'is_active', is_active)
+        setattr_(genre, 'categories', _intern_category_ids(categories))
+        setattr_(genre, '_changes', 0)
+        return genre
 
     def change_name(self, name: str):
         self.name = name
@@ -32,11 +67,15 @@ class Genre:
         self.validate()
 
     def add_category(self, category_id: UUID):
-        self.categories.add(category_id)
+        if category_id not in self.categories:
+            self.categories.add(_intern_category_id(category_id))
+            self._mark_changed('categories')
         self.validate()
 
     def remove_category(self, category_id: UUID):
-        self.categories.discard(category_id)
+        if category_id in self.categories:
+            self.categories.discard(category_id)
+            self._mark_changed('categories')
         self.validate()
 
     def __str__(self):
@@ -18,10 +18,23 @@ class GenreRepository(ABC):
     def delete(self, id: UUID) -> None:
         raise NotImplementedError
 
+    # callers that know how the membership changed pass the delta, so only those links are written;
+    # without it the stored membership is compared against `categories`
     @abstractmethod
-    def update(self, genre: Genre) -> None:
+    def update(self, genre: Genre, categories_added: set[UUID] | None = None,
+               categories_removed: set[UUID] | None = None) -> None:
         raise NotImplementedError
 
     @abstractmethod
     def list(self) -> List[Genre]:
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_by_category(self, category_id: UUID) -> List[Genre]:
+        raise NotImplementedError
+
+    # up to page_size genres matching the filters, ordered by (name, id), starting right after the `after` key
+    @abstractmethod
+    def list_page(self, page_size: int, after: tuple[str, UUID] | None = None, is_active: bool | None = None,
+                  category_id: UUID | None = None, name_prefix: str | None = None) -> List[Genre]:
+        raise NotImplementedError
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import heapq
+from typing import Dict, Iterable, List, Optional, Set
 from uuid import UUID
 
 from src.core.genre.domain.genre import Genre
@@ -7,25 +8,73 @@ from src.core.genre.domain.genre_repository import GenreRepository
 
 class InMemoryGenreRepository(GenreRepository):
     def __init__(self, genres: List[Genre] = None):
-        self.genres = genres or []
+        self._genres: Dict[UUID, Genre] = {}
+        # reverse index category id -> genre ids, plus the membership each genre was indexed with
+        self._genre_ids_by_category: Dict[UUID, Set[UUID]] = {}
+        self._indexed_categories: Dict[UUID, Set[UUID]] = {}
+        for genre in genres or []:
+            self.save(genre)
+
+    @property
+    def genres(self) -> List[Genre]:
+        return list(self._genres.values())
 
     def save(self, genre):
-        self.genres.append(genre)
+        self._genres[genre.id] = genre
+        self._reindex(genre)
 
     def get_by_id(self, id: UUID) -> Optional[Genre]:
-        return next((genre for genre in self.genres if genre.id == id), None)
+        return self._genres.get(id)
 
     def delete(self, id: UUID) -> None:
-        genre = self.get_by_id(id)
+        genre = self._genres.pop(id, None)
         if not genre:
             return
-        self.genres.remove(genre)
+        self._unindex(id, self._indexed_categories.pop(id, set()))
 
-    def update(self, genre: Genre) -> None:
-        if not genre in self.genres:
+    def update(self, genre: Genre, categories_added: set[UUID] | None = None,
+               categories_removed: set[UUID] | None = None) -> None:
+        # the category index is reconciled against what it holds, the delta adds nothing here
+        if genre.id not in self._genres:
             return
-        index = self.genres.index(genre)
-        self.genres[index] = genre
+        self._genres[genre.id] = genre
+        self._reindex(genre)
 
     def list(self) -> List[Genre]:
-        return [genre for genre in self.genres]
+        return list(self._genres.values())
+
+    def list_by_category(self, category_id: UUID) -> List[Genre]:
+        return [self._genres[genre_id] for genre_id in self._genre_ids_by_category.get(category_id, ())]
+
+    def list_page(self, page_size: int, after: tuple[str, UUID] | None = None, is_active: bool | None = None,
+                  category_id: UUID | None = None, name_prefix: str | None = None) -> List[Genre]:
+        genres: Iterable[Genre] = self._genres.values()
+        if category_id is not None:
+            genres = self.list_by_category(category_id)
+        if is_active is not None:
+            genres = (genre for genre in genres if genre.is_active is is_active)
+        if name_prefix:
+            prefix = name_prefix.lower()
+            genres = (genre for genre in genres if genre.name.lower().startswith(prefix))
+        if after is not None:
+            genres = (genre for genre in genres if (genre.name, genre.id) > after)
+        return heapq.nsmallest(page_size, genres, key=lambda genre: (genre.name, genre.id))
+
+    def _reindex(self, genre: Genre) -> None:
+        previous = self._indexed_categories.get(genre.id, set())
+        current = set(genre.categories)
+
+        self._unindex(genre.id, previous - current)
+        for category_id in current - previous:
+            self._genre_ids_by_category.setdefault(category_id, set()).add(genre.id)
+
+        self._indexed_categories[genre.id] = current
+
+    def _unindex(self, genre_id: UUID, category_ids: Set[UUID]) -> None:
+        for category_id in category_ids:
+            genre_ids = self._genre_ids_by_category.get(category_id)
+            if genre_ids is None:
+                continue
+            genre_ids.discard(genre_id)
+            if not genre_ids:
+                del self._genre_ids_by_category[category_id]
@@ -58,3 +58,34 @@ class TestListGenre:
 
         assert horror_output is not None
         assert horror_output.categories == set()
+
+    def test_list_genre_filtered_by_category(self, action_genre: Genre, movie_category: Category,
+                                             genre_repository_with_data: InMemoryGenreRepository):
+        use_case = ListGenre(repository=genre_repository_with_data)
+        output = use_case.execute(input=ListGenre.Input(category_id=movie_category.id))
+
+        assert [genre.id for genre in output.data] == [action_genre.id]
+
+    def test_list_genre_filtered_by_is_active_and_name_prefix(self):
+        drama_genre = Genre(name='Drama')
+        docudrama_genre = Genre(name='Docudrama')
+        inactive_genre = Genre(name='Documentary', is_active=False)
+        use_case = ListGenre(repository=InMemoryGenreRepository(genres=[drama_genre, docudrama_genre,
+                                                                        inactive_genre]))
+
+        output = use_case.execute(input=ListGenre.Input(is_active=True, name_prefix='doc'))
+
+        assert [genre.id for genre in output.data] == [docudrama_genre.id]
+
+    def test_can_walk_all_pages_ordered_by_name(self):
+        genres = [Genre(name=name) for name in ('Horror', 'Action', 'Drama', 'Comedy', 'Action')]
+        use_case = ListGenre(repository=InMemoryGenreRepository(genres=genres))
+
+        output = use_case.execute(input=ListGenre.Input(page_size=2))
+        listed = list(output.data)
+        while output.next_cursor:
+            output = use_case.execute(input=ListGenre.Input(page_size=2, cursor=output.next_cursor))
+            listed.extend(output.data)
+
+        assert [genre.name for genre in listed] == ['Action', 'Action', 'Comedy', 'Drama', 'Horror']
+        assert {genre.id for genre in listed} == {genre.id for genre in genres}
@@ -30,14 +30,14 @@ def documentary_category() -> Category:
 @pytest.fixture
 def mock_category_repository_with_categories(movie_category, documentary_category) -> CategoryRepository:
     repository = create_autospec(CategoryRepository)
-    repository.list.return_value = [movie_category, documentary_category]
+    repository.find_missing.side_effect = lambda ids: set(ids) - {movie_category.id, documentary_category.id}
     return repository
 
 
 @pytest.fixture
 def mock_empty_category_repository() -> CategoryRepository:
     repository = create_autospec(CategoryRepository)
-    repository.list.return_value = []
+    repository.find_missing.side_effect = lambda ids: set(ids)
     return repository
 
 
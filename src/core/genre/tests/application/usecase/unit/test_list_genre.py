@@ -1,6 +1,9 @@
 from unittest.mock import create_autospec
 from uuid import uuid4
 
+import pytest
+
+from src.core._shared.pagination import InvalidCursor, InvalidPageSize, encode_cursor
 from src.core.genre.application.usecase.list_genre import ListGenre, GenreOutput
 from src.core.genre.domain.genre import Genre
 from src.core.genre.domain.genre_repository import GenreRepository
@@ -11,13 +14,13 @@ class TestListGenre:
         genre_repository = create_autospec(GenreRepository)
         genre_drama = Genre(name='Drama',categories={uuid4()})
         genre_romance = Genre(name='Romance')
-        genre_repository.list.return_value = [genre_drama, genre_romance]
+        genre_repository.list_page.return_value = [genre_drama, genre_romance]
 
         use_case = ListGenre(repository=genre_repository)
         output = use_case.execute(input=ListGenre.Input())
 
 
-        genre_repository.list.assert_called_once()
+        genre_repository.list_page.assert_called_once()
         assert len(output.data) == 2
         assert output == ListGenre.Output(
             data=[
@@ -38,11 +41,56 @@ class TestListGenre:
 
     def test_list_genre_empty_repository(self):
         genre_repository = create_autospec(GenreRepository)
-        genre_repository.list.return_value = []
+        genre_repository.list_page.return_value = []
 
         use_case = ListGenre(repository=genre_repository)
         output = use_case.execute(input=ListGenre.Input())
 
-        genre_repository.list.assert_called_once()
+        genre_repository.list_page.assert_called_once()
         assert len(output.data) == 0
         assert output == ListGenre.Output(data=[])
+
+    def test_list_genre_forwards_filters_to_repository(self):
+        genre_repository = create_autospec(GenreRepository)
+        genre_repository.list_page.return_value = []
+        category_id = uuid4()
+
+        use_case = ListGenre(repository=genre_repository)
+        use_case.execute(input=ListGenre.Input(page_size=10, is_active=True, category_id=category_id,
+                                               name_prefix='Dra'))
+
+        genre_repository.list_page.assert_called_once_with(page_size=11, after=None, is_active=True,
+                                                           category_id=category_id, name_prefix='Dra')
+
+    def test_when_more_genres_than_page_size_then_return_next_cursor(self):
+        genre_repository = create_autospec(GenreRepository)
+        genre_drama = Genre(name='Drama')
+        genre_romance = Genre(name='Romance')
+        genre_repository.list_page.return_value = [genre_drama, genre_romance]
+
+        use_case = ListGenre(repository=genre_repository)
+        output = use_case.execute(input=ListGenre.Input(page_size=1))
+
+        assert output == ListGenre.Output(
+            data=[GenreOutput(id=genre_drama.id, name=genre_drama.name, categories=set(), is_active=True)],
+            next_cursor=encode_cursor(genre_drama.name, genre_drama.id),
+        )
+
+    def test_when_cursor_is_invalid_then_raise_exception(self):
+        genre_repository = create_autospec(GenreRepository)
+
+        use_case = ListGenre(repository=genre_repository)
+        with pytest.raises(InvalidCursor):
+            use_case.execute(input=ListGenre.Input(cursor='not-a-cursor'))
+
+        genre_repository.list_page.assert_not_called()
+
+    @pytest.mark.parametrize('page_size', [0, -1])
+    def test_when_page_size_is_not_positive_then_raise_exception(self, page_size: int):
+        genre_repository = create_autospec(GenreRepository)
+
+        use_case = ListGenre(repository=genre_repository)
+        with pytest.raises(InvalidPageSize):
+            use_case.execute(input=ListGenre.Input(page_size=page_size))
+
+        genre_repository.list_page.assert_not_called()
@@ -62,7 +62,7 @@ class TestUpdateGenre:
                                                                             genre_repository,
                                                                             category_repository):
         genre_repository.get_by_id.return_value = comedy_genre
-        category_repository.list.return_value = [series_category, films_category]
+        category_repository.find_missing.return_value = set()
 
 
         use_case = UpdateGenre(genre_repository=genre_repository, category_repository=category_repository)
@@ -84,7 +84,7 @@ class TestUpdateGenre:
                                                                                                    genre_repository,
                                                                                                    category_repository):
         genre_repository.get_by_id.return_value = comedy_genre
-        category_repository.list.return_value = []
+        category_repository.find_missing.side_effect = lambda ids: set(ids)
 
         use_case = UpdateGenre(genre_repository=genre_repository, category_repository=category_repository)
 
@@ -95,14 +95,14 @@ class TestUpdateGenre:
             use_case.execute(input_data)
 
         genre_repository.update.assert_not_called()
-        category_repository.list.assert_called_once()
+        category_repository.find_missing.assert_called_once_with(category_ids)
 
     def test_when_genre_and_categories_exist_then_return_success(self, comedy_genre: Genre,
                                                                  documentary_category: Category,
                                                                  films_category: Category, series_category: Category,
                                                                  genre_repository, category_repository):
         genre_repository.get_by_id.return_value = comedy_genre
-        category_repository.list.return_value = [documentary_category, films_category, series_category]
+        category_repository.find_missing.return_value = set()
 
         use_case = UpdateGenre(genre_repository=genre_repository, category_repository=category_repository)
         input_data = UpdateGenre.Input(id=comedy_genre.id, name='Comedy!', is_active=False,
@@ -111,5 +111,7 @@ class TestUpdateGenre:
         use_case.execute(input_data)
 
         genre_repository.get_by_id.assert_called_once_with(id=comedy_genre.id)
-        category_repository.list.assert_called_once()
-        genre_repository.update.assert_called_once()
+        category_repository.find_missing.assert_called_once_with({documentary_category.id, films_category.id})
+        genre_repository.update.assert_called_once_with(
+            comedy_genre, categories_added={documentary_category.id}, categories_removed={series_category.id}
+        )
@@ -1,4 +1,5 @@
 import pytest
+import copy
 import uuid
 from uuid import UUID
 
@@ -190,3 +191,94 @@ class TestEquality:
         dummy.id = cat_id
 
         assert genre != dummy
+
+
+class TestChangeTracking:
+    def test_new_genre_has_every_field_changed(self):
+        genre = Genre(name='Comedy')
+
+        assert genre.changed_fields == {'name', 'is_active', 'categories'}
+
+    def test_mutators_record_only_values_that_changed(self):
+        category_id = uuid.uuid4()
+        genre = Genre(name='Comedy', categories={category_id})
+        genre.clear_changes()
+
+        genre.change_name('Comedy')
+        genre.activate()
+        genre.add_category(category_id)
+        genre.remove_category(uuid.uuid4())
+
+        assert genre.changed_fields == set()
+
+        genre.change_name('Drama')
+        genre.remove_category(category_id)
+
+        assert genre.changed_fields == {'name', 'categories'}
+
+    def test_clear_changes(self):
+        genre = Genre(name='Comedy')
+
+        genre.clear_changes()
+
+        assert genre.changed_fields == set()
+
+
+class TestRehydrate:
+    def test_rehydrated_genre_behaves_like_a_constructed_one(self):
+        genre_id = uuid.uuid4()
+        categories = {uuid.uuid4()}
+
+        genre = Genre.rehydrate(id=genre_id, name='Comedy', is_active=False, categories=categories)
+
+        assert genre == Genre(name='Comedy', id=genre_id)
+        assert genre.is_active is False
+        assert genre.categories == categories
+        assert genre.changed_fields == set()
+
+    def test_rehydrated_genre_tracks_later_changes(self):
+        genre = Genre.rehydrate(id=uuid.uuid4(), name='Comedy', is_active=True, categories=set())
+
+        genre.add_category(uuid.uuid4())
+
+        assert genre.changed_fields == {'categories'}
+
+
+class TestCompactLayout:
+    def test_genre_has_no_instance_dict(self):
+        genre = Genre(name='Comedy')
+
+        assert not hasattr(genre, '__dict__')
+        with pytest.raises(AttributeError):
+            genre.unknown = 'value'
+
+    def test_equal_category_ids_are_shared_between_genres(self):
+        category_id = uuid.uuid4()
+        genre1 = Genre(name='Comedy', categories={UUID(str(category_id))})
+        genre2 = Genre.rehydrate(id=uuid.uuid4(), name='Drama', is_active=True, categories={UUID(str(category_id))})
+        genre3 = Genre(name='Horror')
+        genre3.add_category(UUID(str(category_id)))
+
+        [id1], [id2], [id3] = genre1.categories, genre2.categories, genre3.categories
+        assert id1 == category_id
+        assert id1 is id2 is id3
+
+    def test_assigning_categories_does_not_share_the_callers_set(self):
+        categories = {uuid.uuid4()}
+        genre = Genre(name='Comedy', categories=categories)
+
+        categories.add(uuid.uuid4())
+
+        assert len(genre.categories) == 1
+
+    def test_deepcopy_keeps_fields_and_changes(self):
+        category_id = uuid.uuid4()
+        genre = Genre(name='Comedy', categories={category_id})
+        genre.clear_changes()
+        genre.remove_category(category_id)
+
+        genre_copy = copy.deepcopy(genre)
+
+        assert genre_copy == genre
+        assert genre_copy.categories == set()
+        assert genre_copy.changed_fields == {'categories'}
@@ -0,0 +1,165 @@
+import copy
+import uuid
+
+import pytest
+
+from src.core.genre.domain.genre import Genre
+from src.core.genre.infra.in_memory_genre_repository import InMemoryGenreRepository
+
+
+@pytest.fixture
+def movie_category_id() -> uuid.UUID:
+    return uuid.uuid4()
+
+
+@pytest.fixture
+def documentary_category_id() -> uuid.UUID:
+    return uuid.uuid4()
+
+
+class TestSave:
+    def test_can_save_genre(self):
+        repository = InMemoryGenreRepository()
+        genre = Genre(name='Action')
+
+        repository.save(genre)
+
+        assert len(repository.genres) == 1
+        assert repository.genres[0] == genre
+
+
+class TestGetById:
+    def test_can_get_genre_by_id(self):
+        action_genre = Genre(name='Action')
+        horror_genre = Genre(name='Horror', is_active=False)
+        repository = InMemoryGenreRepository(genres=[action_genre, horror_genre])
+
+        response = repository.get_by_id(id=horror_genre.id)
+
+        assert response == horror_genre
+
+    def test_when_genre_does_not_exist_then_return_none(self):
+        repository = InMemoryGenreRepository(genres=[Genre(name='Action')])
+
+        response = repository.get_by_id(id=uuid.uuid4())
+
+        assert response is None
+
+
+class TestDelete:
+    def test_can_delete_genre_by_id(self, movie_category_id: uuid.UUID):
+        action_genre = Genre(name='Action', categories={movie_category_id})
+        horror_genre = Genre(name='Horror')
+        repository = InMemoryGenreRepository(genres=[action_genre, horror_genre])
+
+        repository.delete(id=action_genre.id)
+
+        assert repository.genres == [horror_genre]
+        assert repository.list_by_category(movie_category_id) == []
+
+    def test_when_genre_does_not_exist_then_no_effect(self):
+        action_genre = Genre(name='Action')
+        repository = InMemoryGenreRepository(genres=[action_genre])
+
+        repository.delete(id=uuid.uuid4())
+
+        assert repository.genres == [action_genre]
+
+
+class TestUpdate:
+    def test_can_update_genre(self):
+        action_genre = Genre(name='Action')
+        horror_genre = Genre(name='Horror')
+        repository = InMemoryGenreRepository(genres=[action_genre, horror_genre])
+        genre_to_update = copy.deepcopy(action_genre)
+        genre_to_update.change_name('Adventure')
+
+        repository.update(genre=genre_to_update)
+
+        assert repository.genres == [action_genre, horror_genre]
+        assert repository.genres[0].name == 'Adventure'
+
+    def test_when_genre_does_not_exist_then_no_effect(self, movie_category_id: uuid.UUID):
+        action_genre = Genre(name='Action')
+        repository = InMemoryGenreRepository(genres=[action_genre])
+
+        repository.update(genre=Genre(name='Horror', categories={movie_category_id}))
+
+        assert repository.genres == [action_genre]
+        assert repository.list_by_category(movie_category_id) == []
+
+
+class TestListByCategory:
+    def test_return_genres_associated_with_category(self, movie_category_id: uuid.UUID,
+                                                    documentary_category_id: uuid.UUID):
+        action_genre = Genre(name='Action', categories={movie_category_id, documentary_category_id})
+        horror_genre = Genre(name='Horror', categories={movie_category_id})
+        drama_genre = Genre(name='Drama')
+        repository = InMemoryGenreRepository(genres=[action_genre, horror_genre, drama_genre])
+
+        assert set(g.id for g in repository.list_by_category(movie_category_id)) == {action_genre.id,
+                                                                                     horror_genre.id}
+        assert repository.list_by_category(documentary_category_id) == [action_genre]
+        assert repository.list_by_category(uuid.uuid4()) == []
+
+    def test_index_follows_category_changes_on_update(self, movie_category_id: uuid.UUID,
+                                                      documentary_category_id: uuid.UUID):
+        action_genre = Genre(name='Action', categories={movie_category_id})
+        repository = InMemoryGenreRepository(genres=[action_genre])
+
+        action_genre.remove_category(movie_category_id)
+        action_genre.add_category(documentary_category_id)
+        repository.update(genre=action_genre)
+
+        assert repository.list_by_category(movie_category_id) == []
+        assert repository.list_by_category(documentary_category_id) == [action_genre]
+
+    def test_index_follows_category_changes_when_genre_is_replaced(self, movie_category_id: uuid.UUID,
+                                                                   documentary_category_id: uuid.UUID):
+        action_genre = Genre(name='Action', categories={movie_category_id})
+        repository = InMemoryGenreRepository(genres=[action_genre])
+        genre_to_update = copy.deepcopy(action_genre)
+        genre_to_update.categories = {documentary_category_id}
+
+        repository.update(genre=genre_to_update)
+
+        assert repository.list_by_category(movie_category_id) == []
+        assert repository.list_by_category(documentary_category_id) == [genre_to_update]
+
+
+class TestList:
+    def test_when_no_genre_then_return_empty_list(self):
+        repository = InMemoryGenreRepository()
+
+        assert repository.list() == []
+
+    def test_when_genre_exists_then_return_list(self):
+        action_genre = Genre(name='Action')
+        horror_genre = Genre(name='Horror')
+        repository = InMemoryGenreRepository(genres=[action_genre, horror_genre])
+
+        assert repository.list() == [action_genre, horror_genre]
+
+
+class TestListPage:
+    def test_return_genres_ordered_by_name(self):
+        horror_genre = Genre(name='Horror')
+        action_genre = Genre(name='Action')
+        drama_genre = Genre(name='Drama')
+        repository = InMemoryGenreRepository(genres=[horror_genre, action_genre, drama_genre])
+
+        assert repository.list_page(page_size=2) == [action_genre, drama_genre]
+        assert repository.list_page(page_size=2, after=(drama_genre.name, drama_genre.id)) == [horror_genre]
+
+    def test_can_combine_filters(self, movie_category_id: uuid.UUID, documentary_category_id: uuid.UUID):
+        action_genre = Genre(name='Action', categories={movie_category_id})
+        adventure_genre = Genre(name='Adventure', categories={movie_category_id}, is_active=False)
+        animation_genre = Genre(name='Animation', categories={documentary_category_id})
+        horror_genre = Genre(name='Horror', categories={movie_category_id})
+        repository = InMemoryGenreRepository(genres=[action_genre, adventure_genre, animation_genre,
+                                                     horror_genre])
+
+        response = repository.list_page(page_size=10, is_active=True, category_id=movie_category_id,
+                                        name_prefix='a')
+
+        assert response == [action_genre]
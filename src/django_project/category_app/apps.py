@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class CategoryAppConfig(AppConfig):
     name = 'django_project.category_app'
+
+    def ready(self):
+        from django_project.category_app import signals  # noqa: F401
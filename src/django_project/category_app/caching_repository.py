@@ -0,0 +1,279 @@
+import hashlib
+import threading
+import uuid
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List
+from uuid import UUID
+
+from django.core.cache import BaseCache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+
+CACHE_ALIAS = 'categories'
+MISSING_CACHE_ALIAS = 'missing'
+# list pages depend on the name buckets their key range spans: the code point of the name's first character,
+# everything from MAX_NAME_BUCKET on sharing the last bucket. Names sort by code point (SQLite's BINARY
+# collation), so a row placed between two names always lands in a bucket between theirs
+MAX_NAME_BUCKET = 128
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # lookups answered "not found" from the negative cache, without reaching the repository
+    missing_hits: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, hits: int = 0, misses: int = 0, missing_hits: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.missing_hits += missing_hits
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.missing_hits = 0
+
+
+# shared by every CachingCategoryRepository using the default stats, since views build one per request
+category_cache_stats = CacheStats()
+
+
+class CachingCategoryRepository(CategoryRepository):
+    WRITES_TAG = 'writes'
+
+    # categories are cached one key per id, and list results together with the tokens of what they depend
+    # on: the ids on a page and the name buckets of its key range, or any write for list(). A write drops
+    # the tokens of the ids it touched and of the buckets it placed rows in, so only the results it can
+    # change are reloaded. ids the repository did not find go to a separate, bounded cache so a flood of
+    # unknown ids cannot evict the categories that are actually read
+    def __init__(self, repository: CategoryRepository, cache: BaseCache | None = None,
+                 timeout: int | None = DEFAULT_TIMEOUT, missing_cache: BaseCache | None = None,
+                 missing_timeout: int | None = DEFAULT_TIMEOUT, stats: CacheStats = category_cache_stats,
+                 key_prefix: str = 'category') -> None:
+        self.repository = repository
+        self.cache = cache if cache is not None else caches[CACHE_ALIAS]
+        self.timeout = timeout
+        self.missing_cache = missing_cache if missing_cache is not None else caches[MISSING_CACHE_ALIAS]
+        self.missing_timeout = missing_timeout
+        self.stats = stats
+        self.key_prefix = key_prefix
+
+    def save(self, category: Category) -> None:
+        self.repository.save(category)
+        self.invalidate([category.id], placed=[(category.name, category.is_active)])
+
+    def save_many(self, categories: List[Category]) -> None:
+        self.repository.save_many(categories)
+        self.invalidate([category.id for category in categories],
+                        placed=[(category.name, category.is_active) for category in categories])
+
+    def get_by_id(self, id: UUID) -> Category | None:
+        row = self.cache.get(self._id_key(id))
+        if row is not None:
+            self.stats.record(hits=1)
+            return self._to_entity(id, row)
+        if self.missing_cache.get(self._id_key(id)) is not None:
+            self.stats.record(missing_hits=1)
+            return None
+
+        self.stats.record(misses=1)
+        category = self.repository.get_by_id(id)
+        if category is None:
+            self.missing_cache.set(self._id_key(id), True, self.missing_timeout)
+        else:
+            self.cache.set(self._id_key(id), self._to_row(category), self.timeout)
+        return category
+
+    def delete(self, id: UUID) -> int:
+        deleted = self.repository.delete(id)
+        if deleted:
+            self.invalidate([id])
+        return deleted
+
+    def update(self, category: Category) -> int:
+        placed = self._placed([category])
+        updated = self.repository.update(category)
+        if updated:
+            self.invalidate([category.id], placed=placed)
+        return updated
+
+    def update_fields(self, id: UUID, name: str | None = None, description: str | None = None,
+                      is_active: bool | None = None) -> int:
+        placed = []
+        if name is not None or is_active is not None:
+            # the unchanged half of the row's position comes from the cached row, when there is one
+            cached_name, _, cached_is_active = self.cache.get(self._id_key(id), (None, None, None))
+            placed.append((cached_name if name is None else name,
+                           cached_is_active if is_active is None else is_active))
+        updated = self.repository.update_fields(id, name=name, description=description, is_active=is_active)
+        if updated:
+            self.invalidate([id], placed=placed)
+        return updated
+
+    def list(self) -> List[Category]:
+        return self._cached_list('list', self.repository.list, lambda categories: [self.WRITES_TAG])
+
+    def iter_all(self) -> Iterator[Category]:
+        # exports stream the whole table once, caching them would only evict the hot keys
+        return self.repository.iter_all()
+
+    def find_missing(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+
+        # ids answered by either cache; the others are checked with the wrapped repository's id-only lookup,
+        # without loading or caching their rows
+        keys = {self._id_key(id): id for id in ids}
+        cached = self.cache.get_many(keys)
+        unknown_keys = [key for key in keys if key not in cached]
+        known_missing = self.missing_cache.get_many(unknown_keys)
+        unknown = {keys[key] for key in unknown_keys if key not in known_missing}
+        self.stats.record(hits=len(cached), misses=len(unknown), missing_hits=len(known_missing))
+
+        not_found = self.repository.find_missing(unknown) if unknown else set()
+        self.missing_cache.set_many({self._id_key(id): True for id in not_found}, self.missing_timeout)
+        return not_found | {keys[key] for key in known_missing}
+
+    def list_page(self, page_size: int, after: tuple[str, UUID] | None = None,
+                  is_active: bool | None = None) -> List[Category]:
+        after_key = 'first' if after is None else hashlib.sha1(f'{after[0]}\x00{after[1]}'.encode()).hexdigest()
+        return self._cached_list(
+            f'page:{page_size}:{after_key}:{is_active}',
+            lambda: self.repository.list_page(page_size=page_size, after=after, is_active=is_active),
+            lambda categories: self._page_tags(page_size, after, is_active, categories),
+        )
+
+    def get_many(self, ids: set[UUID]) -> List[Category]:
+        if not ids:
+            return []
+
+        keys = {self._id_key(id): id for id in ids}
+        rows = self.cache.get_many(keys)
+        categories = [self._to_entity(keys[key], row) for key, row in rows.items()]
+
+        missing_keys = [key for key in keys if key not in rows]
+        known_missing = self.missing_cache.get_many(missing_keys)
+        missing = {keys[key] for key in missing_keys if key not in known_missing}
+        self.stats.record(hits=len(categories), misses=len(missing), missing_hits=len(known_missing))
+        if missing:
+            loaded = self.repository.get_many(missing)
+            self.cache.set_many(
+                {self._id_key(category.id): self._to_row(category) for category in loaded}, self.timeout
+            )
+            not_found = missing - {category.id for category in loaded}
+            self.missing_cache.set_many({self._id_key(id): True for id in not_found}, self.missing_timeout)
+            categories.extend(loaded)
+        return categories
+
+    def update_many(self, categories: List[Category]) -> None:
+        placed = self._placed(categories)
+        self.repository.update_many(categories)
+        self.invalidate([category.id for category in categories], placed=placed)
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        deleted = self.repository.delete_many(ids)
+        self.invalidate(list(deleted))
+        return deleted
+
+    def version(self) -> int:
+        # needs a wrapped repository exposing version(), like DjangoORMCategoryRepository. Not cached: it is
+        # one primary key read, and writes made elsewhere (the admin, another process) must show at once
+        return self.repository.version()
+
+    def _cached_list(self, name: str, load, tags) -> List[Category]:
+        key = f'{self.key_prefix}:list:{name}'
+        entry = self.cache.get(key)
+        if entry is not None:
+            tokens, rows = entry
+            if self.cache.get_many(list(tokens)) == tokens:
+                self.stats.record(hits=1)
+                return [self._to_entity(id, row) for id, *row in rows]
+
+        self.stats.record(misses=1)
+        writes_key = self._tag_key(self.WRITES_TAG)
+        written = self._tokens([writes_key])[writes_key]
+        categories = load()
+        tokens = self._tokens([self._tag_key(tag) for tag in tags(categories)])
+        # a write that landed while loading may not have been seen by the query, nor dropped the tokens read
+        # after it: the result is only cached when no write happened in between
+        if self.cache.get(writes_key) == written:
+            rows = [(category.id, *self._to_row(category)) for category in categories]
+            self.cache.set(key, (tokens, rows), self.timeout)
+        return categories
+
+    def _tokens(self, keys: List[str]) -> dict:
+        # random tokens rather than counters: a token dropped by a write or evicted is replaced by one that
+        # no cached result was stored with
+        tokens = self.cache.get_many(keys)
+        created = {key: uuid.uuid4().hex for key in keys if key not in tokens}
+        if created:
+            self.cache.set_many(created, None)
+        return {**tokens, **created}
+
+    def _page_tags(self, page_size: int, after: tuple[str, UUID] | None, is_active: bool | None,
+                   categories: List[Category]) -> List[str]:
+        # a page changes when a row on it is written, or when a write places a row inside its key range:
+        # from `after` to its last row, or to the end of the table when the page is not full
+        first = _name_bucket(after[0]) if after is not None else 0
+        last = _name_bucket(categories[-1].name) if categories and len(categories) == page_size else MAX_NAME_BUCKET
+        return [
+            *(self._id_tag(category.id) for category in categories),
+            f'range:{is_active}:any',
+            *(f'range:{is_active}:{bucket}' for bucket in range(first, last + 1)),
+        ]
+
+    @staticmethod
+    def _placed(categories: List[Category]) -> List[tuple[str, bool]]:
+        # only a changed name or is_active moves a row between pages
+        return [(category.name, category.is_active) for category in categories
+                if category.changed_fields & {'name', 'is_active'}]
+
+    # also called for writes that bypass the repositories, see signals.py. `placed` has the (name, is_active)
+    # of every row the write inserted or moved, None where the write does not tell
+    def invalidate(self, ids: List[UUID], placed: Iterable[tuple[str | None, bool | None]] = ()) -> None:
+        keys = [self._id_key(id) for id in ids]
+        tags = [self.WRITES_TAG, *(self._id_tag(id) for id in ids)]
+        for name, is_active in placed:
+            bucket = 'any' if name is None else _name_bucket(name)
+            filters = (None, True, False) if is_active is None else (None, is_active)
+            tags.extend(f'range:{filter}:{bucket}' for filter in filters)
+        tag_keys = [self._tag_key(tag) for tag in dict.fromkeys(tags)]
+
+        def drop():
+            self.cache.delete_many([*keys, *tag_keys])
+            self.missing_cache.delete_many(keys)
+
+        # again after commit: other requests may have cached the old rows while the transaction was open
+        drop()
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(drop)
+
+    def _tag_key(self, tag: str) -> str:
+        return f'{self.key_prefix}:tag:{tag}'
+
+    @staticmethod
+    def _id_tag(id: UUID) -> str:
+        return f'id:{id}'
+
+    def _id_key(self, id: UUID) -> str:
+        return f'{self.key_prefix}:id:{id}'
+
+    @staticmethod
+    def _to_row(category: Category) -> tuple:
+        return category.name, category.description, category.is_active
+
+    @staticmethod
+    def _to_entity(id: UUID, row) -> Category:
+        name, description, is_active = row
+        return Category.rehydrate(id=id, name=name, description=description, is_active=is_active)
+
+
+def _name_bucket(name: str) -> int:
+    return min(ord(name[0]), MAX_NAME_BUCKET) if name else 0
@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-18 06:29
+
+from django.db import migrations, models
+
+
+def create_category_version(apps, schema_editor):
+    TableVersion = apps.get_model('category_app', 'TableVersion')
+    TableVersion.objects.create(table='category', version=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0002_category_name_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TableVersion',
+            fields=[
+                ('table', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('version', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'table_version',
+            },
+        ),
+        migrations.RunPython(create_category_version, migrations.RunPython.noop),
+    ]
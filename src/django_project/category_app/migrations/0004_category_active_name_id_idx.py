@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-18 06:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0003_table_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['name', 'id'], name='category_active_name_id_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:10
+
+from django.db import migrations
+
+# SQLite, like the project's database. The version moves with every row written to `category`, whoever
+# writes it (the repository, the admin or a plain queryset), in the same statement as the write. The
+# INSERT OR IGNORE puts the row back if the table was flushed (e.g. between transactional tests)
+BUMP_CATEGORY_VERSION = '''
+    CREATE TRIGGER category_version_after_{event} AFTER {statement} ON category
+    BEGIN
+        INSERT OR IGNORE INTO table_version ("table", version) VALUES ('category', 0);
+        UPDATE table_version SET version = version + 1 WHERE "table" = 'category';
+    END
+'''
+
+EVENTS = ('insert', 'update', 'delete')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0004_category_active_name_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[BUMP_CATEGORY_VERSION.format(event=event, statement=event.upper()) for event in EVENTS],
+            reverse_sql=[f'DROP TRIGGER category_version_after_{event}' for event in EVENTS],
+        ),
+    ]
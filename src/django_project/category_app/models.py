@@ -1,6 +1,7 @@
 from uuid import uuid4
 
 from django.db import models
+from django.db.models import Q
 
 class Category(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid4)
@@ -10,6 +11,24 @@ class Category(models.Model):
 
     class Meta:
         db_table = 'category'
+        indexes = [
+            # keyset pagination: ORDER BY name, id with a (name, id) > (?, ?) bound
+            models.Index(fields=['name', 'id'], name='category_name_id_idx'),
+            # the same keyset over active categories only, for list pages filtered by is_active=true
+            models.Index(fields=['name', 'id'], condition=Q(is_active=True), name='category_active_name_id_idx'),
+        ]
 
     def __str__(self):
         return self.name
+
+
+class TableVersion(models.Model):
+    # bumped by every repository write to the table, so readers can tell it changed without reading it
+    table = models.CharField(max_length=64, primary_key=True)
+    version = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'table_version'
+
+    def __str__(self):
+        return f'{self.table}@{self.version}'
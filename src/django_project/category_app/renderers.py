@@ -0,0 +1,102 @@
+import json
+from operator import attrgetter
+from typing import Any, Callable, Sequence, Tuple
+from uuid import UUID
+
+from rest_framework.response import Response
+
+from src.core.category.application.usecase.get_category import GetCategoryResponse
+from src.core.category.application.usecase.list_category import ListCategoryResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# the read endpoints encode the use case output straight to JSON bytes instead of going through
+# the response serializers and JSONRenderer. The bytes must stay identical to what DRF produces:
+# compact separators, non-ASCII written as UTF-8 (ensure_ascii=False), U+2028/U+2029 escaped
+
+# json.dumps(ensure_ascii=False) escapes strings with this function (the C version when available)
+_encode_basestring = json.encoder.encode_basestring
+
+
+def encode_string(value: str | None) -> str:
+    return 'null' if value is None else _encode_basestring(value)
+
+
+def encode_uuid(value: UUID) -> str:
+    # the canonical form is hex digits and dashes only, so it never needs escaping
+    return f'"{value}"'
+
+
+def encode_bool(value: bool) -> str:
+    return 'true' if value else 'false'
+
+
+def compile_object_encoder(fields: Sequence[Tuple[str, Callable[[Any], str]]]) -> Callable[[Any], str]:
+    # the '{"name":' / ',"name":' key prefixes are built once, encoding an object is then a single join
+    steps = [
+        (('{' if index == 0 else ',') + _encode_basestring(name) + ':', attrgetter(name), encoder)
+        for index, (name, encoder) in enumerate(fields)
+    ]
+
+    def encode(obj: Any) -> str:
+        return ''.join([prefix + encoder(get(obj)) for prefix, get, encoder in steps]) + '}'
+
+    return encode
+
+
+# same fields, in the same order, as CategoryResponseSerializer
+encode_category = compile_object_encoder([
+    ('id', encode_uuid),
+    ('name', encode_string),
+    ('description', encode_string),
+    ('is_active', encode_bool),
+])
+
+
+def render_category_list(response: ListCategoryResponse) -> bytes:
+    if orjson is not None:
+        # orjson writes the output dataclasses and UUIDs natively, with the same escaping as json.dumps
+        return _escape_line_separators(orjson.dumps({
+            'data': response.data,
+            'meta': {'next_cursor': response.next_cursor},
+        }))
+
+    data = ','.join([encode_category(category) for category in response.data])
+    return _escape_line_separators(
+        f'{{"data":[{data}],"meta":{{"next_cursor":{encode_string(response.next_cursor)}}}}}'.encode()
+    )
+
+
+def render_category(response: GetCategoryResponse) -> bytes:
+    if orjson is not None:
+        return _escape_line_separators(orjson.dumps({'data': response}))
+    return _escape_line_separators(f'{{"data":{encode_category(response)}}}'.encode())
+
+
+def _escape_line_separators(content: bytes) -> bytes:
+    # JSONRenderer escapes these two so the output is also valid JavaScript
+    return content.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+
+
+class EncodedJSONResponse(Response):
+    # a DRF response whose body is already encoded; .data is decoded from it only when asked for
+    def __init__(self, content: bytes, status: int | None = None, headers: dict | None = None):
+        self.content_bytes = content
+        super().__init__(status=status, headers=headers)
+
+    @property
+    def data(self):
+        return json.loads(self.content_bytes)
+
+    @data.setter
+    def data(self, value):
+        # Response.__init__ assigns data=None; the body is the one given to the constructor
+        pass
+
+    @property
+    def rendered_content(self) -> bytes:
+        self['Content-Type'] = 'application/json'
+        return self.content_bytes
@@ -1,50 +1,176 @@
+from typing import Iterator, List, Sequence
 from uuid import UUID
 
+from django.db import connection, transaction
+from django.db.models import Q
+
 from src.core.category.domain.category import Category
 from src.core.category.domain.category_repository import CategoryRepository
-from django_project.category_app.models import Category as CategoryModel
+from django_project.category_app.models import Category as CategoryModel, TableVersion
 
 
 class DjangoORMCategoryRepository(CategoryRepository):
+    ITER_CHUNK_SIZE = 2000
+    BULK_BATCH_SIZE = 500
+    VERSION_TABLE = 'category'
+    # reads fetch these columns as tuples, in Category.rehydrate argument order, so no model instance
+    # is built per row
+    COLUMNS = ('id', 'name', 'description', 'is_active')
+
     def __init__(self, category_model: CategoryModel = CategoryModel) -> None:
         self.category_model = category_model
 
+    # bumped by database triggers on every row written to the table (migration 0005), so writes made
+    # outside this repository, like the admin's, move it too
+    def version(self) -> int:
+        versions = TableVersion.objects.filter(table=self.VERSION_TABLE).values_list('version', flat=True)
+        return next(iter(versions), 0)
+
     def save(self, category: Category) -> None:
-        self.category_model.objects.create(
-            id=category.id,
-            name=category.name,
-            description=category.description,
-            is_active=category.is_active
-        )
+        self._to_record(category).save(force_insert=True)
+        category.clear_changes()
+
+    def save_many(self, categories: List[Category]) -> None:
+        if not categories:
+            return
+        records = [self._to_record(category) for category in categories]
+        self.category_model.objects.bulk_create(records, batch_size=self.BULK_BATCH_SIZE)
+        for category in categories:
+            category.clear_changes()
 
     def get_by_id(self, id: UUID) -> Category | None:
-        try:
-            category_record = self.category_model.objects.get(id=id)
-            return Category(
-                id=category_record.id,
-                name=category_record.name,
-                description=category_record.description,
-                is_active=category_record.is_active
-            )
-        except self.category_model.DoesNotExist:
-            return None
-
-    def delete(self, id: UUID) -> None:
-        self.category_model.objects.filter(id=id).delete()
-
-    def update(self, category: Category) -> None:
-        self.category_model.objects.filter(pk=category.id).update(
+        entities = self._to_entities(self.category_model.objects.filter(id=id))
+        return entities[0] if entities else None
+
+    def delete(self, id: UUID) -> int:
+        return self._delete_rows(self.category_model.objects.filter(id=id))
+
+    def update(self, category: Category) -> int:
+        changes = {field: getattr(category, field) for field in Category.TRACKED_FIELDS
+                   if field in category.changed_fields}
+        if not changes:
+            # nothing to write, but a clean entity does not prove the row still exists
+            return int(self.category_model.objects.filter(pk=category.id).exists())
+
+        updated = self.category_model.objects.filter(pk=category.id).update(**changes)
+        if updated:
+            category.clear_changes()
+        return updated
+
+    def update_fields(self, id: UUID, name: str | None = None, description: str | None = None,
+                      is_active: bool | None = None) -> int:
+        fields = {
+            field: value
+            for field, value in (('name', name), ('description', description), ('is_active', is_active))
+            if value is not None
+        }
+        queryset = self.category_model.objects.filter(pk=id)
+        if not fields:
+            return int(queryset.exists())
+        return queryset.update(**fields)
+
+    def list(self) -> List[Category]:
+        return self._to_entities(self.category_model.objects.all())
+
+    def iter_all(self) -> Iterator[Category]:
+        rows = self.category_model.objects.order_by('pk').values_list(*self.COLUMNS)
+        rehydrate = Category.rehydrate
+        for row in rows.iterator(chunk_size=self.ITER_CHUNK_SIZE):
+            yield rehydrate(*row)
+
+    def find_missing(self, ids: set[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+        found_ids = set()
+        for batch in self._batches(list(ids)):
+            found_ids.update(self.category_model.objects.filter(id__in=batch).values_list('id', flat=True))
+        return set(ids) - found_ids
+
+    def list_page(self, page_size: int, after: tuple[str, UUID] | None = None,
+                  is_active: bool | None = None) -> List[Category]:
+        queryset = self.category_model.objects.order_by('name', 'id')
+        if is_active is not None:
+            # is_active=True pages are served by the partial category_active_name_id_idx
+            queryset = queryset.filter(is_active=is_active)
+        if after is not None:
+            name, id = after
+            # name__gte lets the (name, id) index bound the range scan, the Q narrows it to the keyset
+            queryset = queryset.filter(name__gte=name).filter(Q(name__gt=name) | Q(name=name, id__gt=id))
+
+        return self._to_entities(queryset[:page_size])
+
+    def get_many(self, ids: set[UUID]) -> List[Category]:
+        if not ids:
+            return []
+        # in batches, like the writes, so a request of MAX_BULK_SIZE ids stays within the query parameter limits
+        return [category for batch in self._batches(list(ids))
+                for category in self._to_entities(self.category_model.objects.filter(id__in=batch))]
+
+    def update_many(self, categories: List[Category]) -> None:
+        # group by the set of changed columns so every statement writes only what changed
+        groups: dict[tuple[str, ...], List[Category]] = {}
+        for category in categories:
+            fields = tuple(field for field in Category.TRACKED_FIELDS if field in category.changed_fields)
+            if fields:
+                groups.setdefault(fields, []).append(category)
+
+        with transaction.atomic(savepoint=False):
+            for fields, group in groups.items():
+                values = {tuple(getattr(category, field) for field in fields) for category in group}
+                if len(values) == 1:
+                    # the whole group gets the same values (e.g. deactivating many categories)
+                    changes = dict(zip(fields, values.pop()))
+                    for ids in self._batches([category.id for category in group]):
+                        self.category_model.objects.filter(id__in=ids).update(**changes)
+                else:
+                    self.category_model.objects.bulk_update(
+                        [self._to_record(category) for category in group],
+                        fields=list(fields),
+                        batch_size=self.BULK_BATCH_SIZE
+                    )
+
+        for category in categories:
+            category.clear_changes()
+
+    def delete_many(self, ids: set[UUID]) -> set[UUID]:
+        deleted = set()
+        with transaction.atomic(savepoint=False):
+            for batch in self._batches(list(ids)):
+                deleted.update(self._delete_returning_ids(batch))
+        return deleted
+
+    def _delete_rows(self, queryset) -> int:
+        # one plain DELETE: QuerySet.delete() would run the deletion collector, which SELECTs the rows to
+        # cascade to their genre links. A trigger on the table removes those links instead (genre_app
+        # migration 0002), and the repository's callers invalidate caches themselves, so the model's delete
+        # signals are not needed
+        return queryset._raw_delete(queryset.db)
+
+    def _delete_returning_ids(self, ids: Sequence[UUID]) -> List[UUID]:
+        # the same plain DELETE as _delete_rows, with RETURNING (SQLite 3.35+) so the statement itself
+        # reports which rows it removed: a row count could not say which of the ids were missing once
+        # the others are gone, and a lookup beforehand would be a second round trip
+        pk = self.category_model._meta.pk
+        table = connection.ops.quote_name(self.category_model._meta.db_table)
+        column = connection.ops.quote_name(pk.column)
+        placeholders = ', '.join(['%s'] * len(ids))
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {table} WHERE {column} IN ({placeholders}) RETURNING {column}',
+                           [pk.get_db_prep_value(id, connection) for id in ids])
+            return [pk.to_python(id) for id, in cursor.fetchall()]
+
+    def _batches(self, items: Sequence) -> Iterator[Sequence]:
+        for start in range(0, len(items), self.BULK_BATCH_SIZE):
+            yield items[start:start + self.BULK_BATCH_SIZE]
+
+    def _to_record(self, category: Category) -> CategoryModel:
+        return self.category_model(
+            id=category.id,
             name=category.name,
             description=category.description,
             is_active=category.is_active
         )
 
-    def list(self) -> list[Category]:
-        return [
-            Category(
-                id=record.id,
-                name=record.name,
-                description=record.description,
-                is_active=record.is_active
-            ) for record in self.category_model.objects.all()
-        ]
\ No newline at end of file
+    def _to_entities(self, queryset) -> List[Category]:
+        rehydrate = Category.rehydrate
+        return [rehydrate(*row) for row in queryset.values_list(*self.COLUMNS)]
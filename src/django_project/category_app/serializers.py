@@ -1,5 +1,11 @@
 from rest_framework import serializers
 
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+# the repositories write bulk requests in batches of DjangoORMCategoryRepository.BULK_BATCH_SIZE rows,
+# so this only bounds the size of one request
+MAX_BULK_SIZE = 10_000
+
 
 class CategoryResponseSerializer(serializers.Serializer):
     id = serializers.UUIDField()
@@ -8,8 +14,20 @@ class CategoryResponseSerializer(serializers.Serializer):
     is_active = serializers.BooleanField()
 
 
+class ListCategoryRequestSerializer(serializers.Serializer):
+    page_size = serializers.IntegerField(min_value=1, max_value=MAX_PAGE_SIZE, default=DEFAULT_PAGE_SIZE)
+    cursor = serializers.CharField(required=False)
+    # allow_null keeps a missing query parameter as "no filter" instead of False
+    is_active = serializers.BooleanField(required=False, allow_null=True)
+
+
+class ListMetaResponseSerializer(serializers.Serializer):
+    next_cursor = serializers.CharField(allow_null=True)
+
+
 class ListCategoryResponseSerializer(serializers.Serializer):
     data = CategoryResponseSerializer(many=True)
+    meta = ListMetaResponseSerializer(source='*')
 
 
 class RetrieveCategoryResponseSerializer(serializers.Serializer):
@@ -30,6 +48,25 @@ class CreateCategoryResponseSerializer(serializers.Serializer):
     id = serializers.UUIDField()
 
 
+class BulkCreateCategoryRequestSerializer(serializers.Serializer):
+    categories = serializers.ListField(child=serializers.DictField(), allow_empty=False, max_length=MAX_BULK_SIZE)
+
+
+class BulkCreatedCategorySerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    id = serializers.UUIDField()
+
+
+class BulkCreateCategoryErrorSerializer(serializers.Serializer):
+    index = serializers.IntegerField()
+    errors = serializers.DictField()
+
+
+class BulkCreateCategoryResponseSerializer(serializers.Serializer):
+    created = BulkCreatedCategorySerializer(many=True)
+    errors = BulkCreateCategoryErrorSerializer(many=True)
+
+
 class UpdateCategoryRequestSerializer(serializers.Serializer):
     id = serializers.UUIDField()
     name = serializers.CharField(max_length=255, allow_blank=False)
@@ -46,3 +83,24 @@ class PartialUpdateCategoryRequestSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=255, allow_blank=False, required=False)
     description = serializers.CharField(required=False)
     is_active = serializers.BooleanField(required=False)
+
+
+class BulkPatchCategoryRequestSerializer(serializers.Serializer):
+    categories = PartialUpdateCategoryRequestSerializer(many=True, allow_empty=False, max_length=MAX_BULK_SIZE)
+
+
+class BulkDeleteCategoryRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=MAX_BULK_SIZE)
+
+
+class BulkGetCategoryRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=MAX_BULK_SIZE)
+
+
+class BulkGetCategoryResponseSerializer(serializers.Serializer):
+    data = CategoryResponseSerializer(many=True)
+    not_found = serializers.ListField(child=serializers.UUIDField())
+
+
+class BulkCategoryResponseSerializer(serializers.Serializer):
+    not_found = serializers.ListField(child=serializers.UUIDField())
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from django_project.category_app.models import Category as CategoryModel
+from src.django_project.category_app.caching_repository import CachingCategoryRepository
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+
+
+# model instances saved or deleted outside the repositories (e.g. by the admin) drop what the category cache
+# holds for them; the table version behind the ETags is bumped by database triggers for any write
+@receiver(post_save, sender=CategoryModel)
+def invalidate_saved_category(sender, instance: CategoryModel, **kwargs) -> None:
+    _repository().invalidate([instance.pk], placed=[(instance.name, instance.is_active)])
+
+
+@receiver(post_delete, sender=CategoryModel)
+def invalidate_deleted_category(sender, instance: CategoryModel, **kwargs) -> None:
+    _repository().invalidate([instance.pk])
+
+
+def _repository() -> CachingCategoryRepository:
+    return CachingCategoryRepository(repository=DjangoORMCategoryRepository())
@@ -0,0 +1,268 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+
+from src.core.category.domain.category import Category
+from src.core.category.infra.in_memory_category_repository import InMemoryCategoryRepository
+from src.django_project.category_app.caching_repository import CachingCategoryRepository, CacheStats
+
+
+@pytest.fixture
+def category_films() -> Category:
+    return Category(name='Films', description='Category for films')
+
+
+@pytest.fixture
+def category_series() -> Category:
+    return Category(name='Series', description='Category for series', is_active=False)
+
+
+@pytest.fixture
+def inner(category_films: Category, category_series: Category) -> Mock:
+    return Mock(wraps=InMemoryCategoryRepository(categories=[category_films, category_series]))
+
+
+def _cache(**options) -> LocMemCache:
+    return LocMemCache(f'test-{uuid4()}', {'OPTIONS': options})
+
+
+@pytest.fixture
+def repository(inner: Mock) -> CachingCategoryRepository:
+    return CachingCategoryRepository(repository=inner, cache=_cache(), missing_cache=_cache(), stats=CacheStats())
+
+
+class TestGetById:
+    def test_second_read_is_served_from_cache(self, repository: CachingCategoryRepository, inner: Mock,
+                                              category_series: Category):
+        first = repository.get_by_id(category_series.id)
+        second = repository.get_by_id(category_series.id)
+
+        assert inner.get_by_id.call_count == 1
+        assert second == first == category_series
+        assert second is not first
+        assert (second.name, second.description, second.is_active) == ('Series', 'Category for series', False)
+        assert second.changed_fields == set()
+        assert (repository.stats.hits, repository.stats.misses) == (1, 1)
+
+    def test_entries_expire_after_timeout(self, inner: Mock, category_films: Category):
+        repository = CachingCategoryRepository(repository=inner, cache=_cache(), missing_cache=_cache(),
+                                               timeout=-1, stats=CacheStats())
+
+        repository.get_by_id(category_films.id)
+        repository.get_by_id(category_films.id)
+
+        assert inner.get_by_id.call_count == 2
+
+    def test_least_recently_used_entry_is_evicted(self, inner: Mock, category_films: Category,
+                                                  category_series: Category):
+        repository = CachingCategoryRepository(repository=inner, cache=_cache(MAX_ENTRIES=2, CULL_FREQUENCY=2),
+                                               missing_cache=_cache(), stats=CacheStats())
+        documentaries = Category(name='Documentaries')
+        inner.save(documentaries)
+
+        repository.get_by_id(category_films.id)
+        repository.get_by_id(category_series.id)
+        repository.get_by_id(category_films.id)
+        repository.get_by_id(documentaries.id)
+        inner.get_by_id.reset_mock()
+
+        repository.get_by_id(category_films.id)
+        repository.get_by_id(category_series.id)
+
+        assert [call.args[0] for call in inner.get_by_id.call_args_list] == [category_series.id]
+
+
+class TestNegativeCache:
+    def test_missing_category_is_answered_from_cache(self, repository: CachingCategoryRepository, inner: Mock):
+        not_found_id = uuid4()
+
+        assert repository.get_by_id(not_found_id) is None
+        assert repository.get_by_id(not_found_id) is None
+        assert inner.get_by_id.call_count == 1
+        assert (repository.stats.missing_hits, repository.stats.misses) == (1, 1)
+
+    def test_saving_the_missing_id_drops_the_entry(self, repository: CachingCategoryRepository):
+        documentaries = Category(name='Documentaries')
+        assert repository.get_by_id(documentaries.id) is None
+
+        repository.save(documentaries)
+
+        assert repository.get_by_id(documentaries.id) == documentaries
+
+    def test_missing_entries_expire_after_their_own_timeout(self, inner: Mock):
+        repository = CachingCategoryRepository(repository=inner, cache=_cache(), missing_cache=_cache(),
+                                               missing_timeout=-1, stats=CacheStats())
+        not_found_id = uuid4()
+
+        repository.get_by_id(not_found_id)
+        repository.get_by_id(not_found_id)
+
+        assert inner.get_by_id.call_count == 2
+
+    def test_unknown_ids_do_not_evict_cached_categories(self, inner: Mock, category_films: Category):
+        repository = CachingCategoryRepository(repository=inner, cache=_cache(MAX_ENTRIES=2, CULL_FREQUENCY=2),
+                                               missing_cache=_cache(MAX_ENTRIES=2, CULL_FREQUENCY=2),
+                                               stats=CacheStats())
+        repository.get_by_id(category_films.id)
+
+        for _ in range(10):
+            repository.get_by_id(uuid4())
+        inner.get_by_id.reset_mock()
+
+        assert repository.get_by_id(category_films.id) == category_films
+        inner.get_by_id.assert_not_called()
+
+    def test_get_many_and_find_missing_skip_known_missing_ids(self, repository: CachingCategoryRepository,
+                                                              inner: Mock, category_films: Category):
+        not_found_id = uuid4()
+        repository.get_by_id(not_found_id)
+
+        assert repository.find_missing({category_films.id, not_found_id}) == {not_found_id}
+        inner.find_missing.assert_called_once_with({category_films.id})
+
+        other_id = uuid4()
+        repository.get_many({other_id})
+        inner.get_by_id.reset_mock()
+
+        assert repository.get_by_id(other_id) is None
+        inner.get_by_id.assert_not_called()
+
+
+class TestInvalidation:
+    def test_writes_drop_only_the_written_id(self, repository: CachingCategoryRepository, inner: Mock,
+                                             category_films: Category, category_series: Category):
+        repository.get_by_id(category_films.id)
+        repository.get_by_id(category_series.id)
+
+        assert repository.update_fields(category_films.id, name='Movies') == 1
+        inner.get_by_id.reset_mock()
+
+        assert repository.get_by_id(category_films.id).name == 'Movies'
+        assert repository.get_by_id(category_series.id).name == 'Series'
+        assert [call.args[0] for call in inner.get_by_id.call_args_list] == [category_films.id]
+
+    def test_delete_and_update(self, repository: CachingCategoryRepository, category_films: Category,
+                               category_series: Category):
+        repository.get_by_id(category_films.id)
+        repository.get_by_id(category_series.id)
+        category_series.activate()
+
+        assert repository.update(category_series) == 1
+        assert repository.delete(category_films.id) == 1
+
+        assert repository.get_by_id(category_films.id) is None
+        assert repository.get_by_id(category_series.id).is_active is True
+
+    def test_any_write_drops_the_cached_list(self, repository: CachingCategoryRepository, inner: Mock,
+                                             category_films: Category):
+        assert len(repository.list()) == 2
+        assert len(repository.list()) == 2
+        assert inner.list.call_count == 1
+
+        repository.update_fields(category_films.id, description='Films')
+
+        assert len(repository.list()) == 2
+        assert inner.list.call_count == 2
+
+    def test_insert_drops_the_pages_whose_range_it_lands_in(self, repository: CachingCategoryRepository,
+                                                            inner: Mock):
+        [films] = repository.list_page(page_size=1)
+        full_page = repository.list_page(page_size=1, after=(films.name, films.id))
+        last_page = repository.list_page(page_size=10, after=(films.name, films.id))
+        inner.list_page.reset_mock()
+
+        repository.save(Category(name='Animations'))
+
+        assert repository.list_page(page_size=1)[0].name == 'Animations'
+        assert repository.list_page(page_size=1, after=(films.name, films.id)) == full_page
+        assert repository.list_page(page_size=10, after=(films.name, films.id)) == last_page
+        assert inner.list_page.call_count == 1
+
+        repository.save(Category(name='Westerns'))
+
+        assert repository.list_page(page_size=1, after=(films.name, films.id)) == full_page
+        assert [category.name for category in repository.list_page(page_size=10, after=(films.name, films.id))] \
+            == ['Series', 'Westerns']
+        assert inner.list_page.call_count == 2
+
+    def test_writes_to_a_row_drop_the_pages_it_is_on(self, repository: CachingCategoryRepository, inner: Mock,
+                                                     category_films: Category, category_series: Category):
+        repository.list_page(page_size=1)
+        repository.list_page(page_size=1, after=(category_films.name, category_films.id))
+        inner.list_page.reset_mock()
+
+        repository.update_fields(category_series.id, description='Series')
+        repository.list_page(page_size=1)
+        [series] = repository.list_page(page_size=1, after=(category_films.name, category_films.id))
+
+        assert series.description == 'Series'
+        assert inner.list_page.call_count == 1
+
+        repository.delete(category_films.id)
+
+        assert repository.list_page(page_size=1) == [category_series]
+
+    def test_moving_a_row_by_id_drops_the_pages_it_may_enter(self, repository: CachingCategoryRepository,
+                                                             inner: Mock, category_films: Category):
+        repository.list_page(page_size=10, is_active=False)
+        repository.list_page(page_size=10, is_active=True)
+        inner.list_page.reset_mock()
+
+        # the name is not cached, so every page of the is_active=False listing may gain the row
+        repository.update_fields(category_films.id, is_active=False)
+
+        assert len(repository.list_page(page_size=10, is_active=True)) == 0
+        assert len(repository.list_page(page_size=10, is_active=False)) == 2
+        assert inner.list_page.call_count == 2
+
+    def test_result_loaded_across_a_write_is_not_cached(self, category_films: Category):
+        in_memory = InMemoryCategoryRepository(categories=[category_films])
+        inner = Mock(wraps=in_memory)
+        repository = CachingCategoryRepository(repository=inner, cache=_cache(), missing_cache=_cache(),
+                                               stats=CacheStats())
+
+        def load_then_write(*args, **kwargs):
+            page = in_memory.list_page(*args, **kwargs)
+            inner.list_page.side_effect = None
+            repository.save(Category(name='Westerns'))
+            return page
+
+        inner.list_page.side_effect = load_then_write
+        assert len(repository.list_page(page_size=10)) == 1
+
+        assert len(repository.list_page(page_size=10)) == 2
+
+
+class TestGetMany:
+    def test_only_uncached_ids_reach_the_repository(self, repository: CachingCategoryRepository, inner: Mock,
+                                                    category_films: Category, category_series: Category):
+        not_found_id = uuid4()
+        repository.get_by_id(category_films.id)
+
+        categories = repository.get_many({category_films.id, category_series.id, not_found_id})
+
+        assert {category.id for category in categories} == {category_films.id, category_series.id}
+        inner.get_many.assert_called_once_with({category_series.id, not_found_id})
+
+    def test_find_missing_uses_cached_categories(self, repository: CachingCategoryRepository, inner: Mock,
+                                                 category_films: Category, category_series: Category):
+        not_found_id = uuid4()
+        repository.get_by_id(category_films.id)
+
+        assert repository.find_missing({category_films.id, category_series.id, not_found_id}) == {not_found_id}
+        assert repository.find_missing(set()) == set()
+        inner.find_missing.assert_called_once_with({category_series.id, not_found_id})
+        inner.get_many.assert_not_called()
+
+    def test_find_missing_remembers_the_missing_ids(self, repository: CachingCategoryRepository, inner: Mock,
+                                                    category_films: Category):
+        not_found_id = uuid4()
+        repository.find_missing({category_films.id, not_found_id})
+        inner.find_missing.reset_mock()
+
+        assert repository.find_missing({not_found_id}) == {not_found_id}
+        assert repository.get_by_id(not_found_id) is None
+        inner.find_missing.assert_not_called()
+        inner.get_by_id.assert_not_called()
@@ -0,0 +1,83 @@
+from uuid import uuid4
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from src.core.category.application.usecase.get_category import GetCategoryResponse
+from src.core.category.application.usecase.list_category import CategoryOutput, ListCategoryResponse
+from src.django_project.category_app import renderers
+from src.django_project.category_app.renderers import render_category, render_category_list
+from src.django_project.category_app.serializers import ListCategoryResponseSerializer, \
+    RetrieveCategoryResponseSerializer
+
+TRICKY_STRINGS = [
+    '',
+    'Films',
+    'Séries & "Documentários" \\ /',
+    'emoji 😀 and cjk 映画',
+    'line\nbreak\ttab\r\x00\x1f\x7f',
+    'separators \u2028 and \u2029',
+    '\ufeff\xa0\x85',
+]
+
+
+@pytest.fixture(params=['orjson', 'python'])
+def encoder(request, monkeypatch):
+    if request.param == 'python':
+        monkeypatch.setattr(renderers, 'orjson', None)
+    elif renderers.orjson is None:
+        pytest.skip('orjson is not installed')
+    return request.param
+
+
+class TestRenderCategoryList:
+    @pytest.mark.parametrize('next_cursor', [None, 'eyJuYW1lIjoiRmlsbXMifQ'])
+    def test_output_matches_serializer_and_json_renderer(self, encoder: str, next_cursor: str | None):
+        response = ListCategoryResponse(
+            data=[
+                CategoryOutput(id=uuid4(), name=text, description=text, is_active=index % 2 == 0)
+                for index, text in enumerate(TRICKY_STRINGS)
+            ] + [CategoryOutput(id=uuid4(), name='No description', description=None, is_active=True)],
+            next_cursor=next_cursor
+        )
+
+        expected = JSONRenderer().render(ListCategoryResponseSerializer(instance=response).data)
+
+        assert render_category_list(response) == expected
+
+    def test_empty_page(self, encoder: str):
+        response = ListCategoryResponse(data=[])
+
+        assert render_category_list(response) == \
+            JSONRenderer().render(ListCategoryResponseSerializer(instance=response).data)
+
+
+class TestRenderCategory:
+    @pytest.mark.parametrize('text', TRICKY_STRINGS)
+    def test_output_matches_serializer_and_json_renderer(self, encoder: str, text: str):
+        response = GetCategoryResponse(id=uuid4(), name=text, description=text, is_active=False)
+
+        expected = JSONRenderer().render(RetrieveCategoryResponseSerializer(instance=response).data)
+
+        assert render_category(response) == expected
+
+
+@pytest.mark.django_db
+class TestEncodedResponses:
+    def test_json_clients_get_the_encoded_body(self):
+        APIClient().post('/api/categories/', data={'name': 'Séries \u2028 e \u2029 filmes'})
+
+        response = APIClient().get('/api/categories/')
+
+        assert response['Content-Type'] == 'application/json'
+        assert response.data['data'][0]['name'] == 'Séries \u2028 e \u2029 filmes'
+        assert response.content == JSONRenderer().render(response.data)
+
+    def test_browsable_api_still_renders_html(self):
+        APIClient().post('/api/categories/', data={'name': 'Films'})
+
+        response = APIClient().get('/api/categories/', HTTP_ACCEPT='text/html')
+
+        assert response.status_code == 200
+        assert response['Content-Type'].startswith('text/html')
@@ -1,9 +1,12 @@
 from uuid import uuid4
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from src.core.category.domain.category import Category
-from django_project.category_app.models import Category as CategoryModel
+from django_project.category_app.models import Category as CategoryModel, TableVersion
+from django_project.genre_app.models import Genre as GenreModel
 
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
 
@@ -186,3 +189,393 @@ class TestList:
         categories = repository.list()
 
         assert len(categories) == 0
+
+@pytest.mark.django_db
+class TestFindMissing:
+    def test_return_ids_not_in_database(self, django_assert_num_queries):
+        category_film_record = CategoryModel.objects.create(name='Films', description='Category for films')
+        category_series_record = CategoryModel.objects.create(name='Series', description='Category for series')
+        repository = DjangoORMCategoryRepository()
+        not_found_id = uuid4()
+
+        with django_assert_num_queries(1):
+            missing = repository.find_missing({category_film_record.id, category_series_record.id, not_found_id})
+
+        assert missing == {not_found_id}
+
+    def test_when_no_ids_then_skip_query(self, django_assert_num_queries):
+        repository = DjangoORMCategoryRepository()
+
+        with django_assert_num_queries(0):
+            assert repository.find_missing(set()) == set()
+
+@pytest.mark.django_db
+class TestListPage:
+    def test_return_categories_ordered_by_name_and_id(self):
+        CategoryModel.objects.create(name='Series')
+        CategoryModel.objects.create(name='Films')
+        CategoryModel.objects.create(name='Anime')
+        repository = DjangoORMCategoryRepository()
+
+        categories = repository.list_page(page_size=2)
+
+        assert [category.name for category in categories] == ['Anime', 'Films']
+
+    def test_return_categories_after_key(self):
+        first_film, second_film = sorted([CategoryModel.objects.create(name='Films'),
+                                          CategoryModel.objects.create(name='Films')], key=lambda record: record.id)
+        series = CategoryModel.objects.create(name='Series')
+        CategoryModel.objects.create(name='Anime')
+        repository = DjangoORMCategoryRepository()
+
+        categories = repository.list_page(page_size=10, after=(first_film.name, first_film.id))
+
+        assert [category.id for category in categories] == [second_film.id, series.id]
+
+    def test_return_only_categories_with_given_active_state(self):
+        CategoryModel.objects.create(name='Series', is_active=False)
+        CategoryModel.objects.create(name='Films')
+        CategoryModel.objects.create(name='Anime')
+        repository = DjangoORMCategoryRepository()
+
+        active = repository.list_page(page_size=10, is_active=True)
+        inactive = repository.list_page(page_size=10, is_active=False)
+
+        assert [category.name for category in active] == ['Anime', 'Films']
+        assert [category.name for category in inactive] == ['Series']
+
+@pytest.mark.django_db
+class TestIterAll:
+    def test_yield_every_category_in_chunks(self, django_assert_num_queries):
+        records = [CategoryModel.objects.create(name=f'Category {i}') for i in range(5)]
+        repository = DjangoORMCategoryRepository()
+        repository.ITER_CHUNK_SIZE = 2
+
+        categories = repository.iter_all()
+
+        with django_assert_num_queries(1):
+            assert {category.id for category in categories} == {record.id for record in records}
+
+@pytest.mark.django_db
+class TestSaveMany:
+    def test_can_save_categories_in_batches(self, django_assert_max_num_queries):
+        categories = [Category(name=f'Category {i}', is_active=i % 2 == 0) for i in range(5)]
+        repository = DjangoORMCategoryRepository()
+        repository.BULK_BATCH_SIZE = 2
+
+        # three INSERTs plus the transaction savepoint statements
+        with django_assert_max_num_queries(5):
+            repository.save_many(categories)
+
+        assert CategoryModel.objects.count() == 5
+        saved = {record.id: record for record in CategoryModel.objects.all()}
+        for category in categories:
+            assert saved[category.id].name == category.name
+            assert saved[category.id].is_active == category.is_active
+
+@pytest.mark.django_db
+class TestGetMany:
+    def test_return_only_existing_categories(self, django_assert_num_queries):
+        category_film_record = CategoryModel.objects.create(name='Films', description='Category for films')
+        CategoryModel.objects.create(name='Series', description='Category for series')
+        repository = DjangoORMCategoryRepository()
+
+        with django_assert_num_queries(1):
+            categories = repository.get_many({category_film_record.id, uuid4()})
+
+        assert len(categories) == 1
+        assert type(categories[0]) == Category
+        assert categories[0].id == category_film_record.id
+        assert categories[0].name == category_film_record.name
+
+
+@pytest.mark.django_db
+class TestUpdateMany:
+    def test_can_update_categories_in_database(self):
+        category_film_record = CategoryModel.objects.create(name='Films', description='Category for films')
+        category_series_record = CategoryModel.objects.create(name='Series', description='Category for series')
+        repository = DjangoORMCategoryRepository()
+
+        repository.update_many([
+            Category(id=category_film_record.id, name='Movies', description='Category for movies', is_active=False),
+            Category(id=category_series_record.id, name='Series', description='TV series', is_active=True),
+        ])
+
+        category_film_record.refresh_from_db()
+        category_series_record.refresh_from_db()
+        assert category_film_record.name == 'Movies'
+        assert category_film_record.is_active is False
+        assert category_series_record.description == 'TV series'
+
+
+@pytest.mark.django_db
+class TestDeleteMany:
+    def test_can_delete_categories_from_database(self):
+        records = [CategoryModel.objects.create(name=f'Category {i}') for i in range(5)]
+        repository = DjangoORMCategoryRepository()
+        repository.BULK_BATCH_SIZE = 2
+
+        assert repository.delete_many({record.id for record in records[:4]}) == {record.id for record in records[:4]}
+
+        assert list(CategoryModel.objects.values_list('id', flat=True)) == [records[4].id]
+
+    def test_return_the_deleted_ids_from_the_delete_itself(self, django_assert_num_queries):
+        record = CategoryModel.objects.create(name='Films')
+        missing_id = uuid4()
+        repository = DjangoORMCategoryRepository()
+
+        with django_assert_num_queries(1) as context:
+            deleted = repository.delete_many({record.id, missing_id})
+
+        assert deleted == {record.id}
+        assert context.captured_queries[0]['sql'].startswith('DELETE FROM "category"')
+        assert not CategoryModel.objects.exists()
+
+    def test_genre_links_of_deleted_categories_go_with_them(self):
+        records = [CategoryModel.objects.create(name=f'Category {i}') for i in range(3)]
+        genre = GenreModel.objects.create(name='Action')
+        genre.categories.add(*records)
+        repository = DjangoORMCategoryRepository()
+
+        repository.delete_many({records[0].id, records[1].id})
+
+        assert list(genre.categories.values_list('id', flat=True)) == [records[2].id]
+
+@pytest.mark.django_db
+class TestRowsAffected:
+    def test_delete_and_update_report_rows_affected(self):
+        category_record = CategoryModel.objects.create(name='Films', description='Category for films')
+        repository = DjangoORMCategoryRepository()
+
+        assert repository.update(Category(id=category_record.id, name='Movies')) == 1
+        assert repository.update(Category(id=uuid4(), name='Movies')) == 0
+        assert repository.delete(id=uuid4()) == 0
+        assert repository.delete(id=category_record.id) == 1
+
+
+@pytest.mark.django_db
+class TestUpdateFields:
+    def test_write_only_given_fields_in_one_query(self, django_assert_num_queries):
+        category_record = CategoryModel.objects.create(name='Films', description='Category for films')
+        repository = DjangoORMCategoryRepository()
+
+        # the table version is bumped by the UPDATE's trigger, not by another statement
+        with django_assert_num_queries(1) as context:
+            updated = repository.update_fields(category_record.id, is_active=False)
+
+        assert updated == 1
+        assert '"name"' not in context.captured_queries[0]['sql']
+        category_record.refresh_from_db()
+        assert category_record.is_active is False
+        assert category_record.name == 'Films'
+        assert category_record.description == 'Category for films'
+
+    def test_when_category_does_not_exist_then_return_zero(self):
+        repository = DjangoORMCategoryRepository()
+
+        assert repository.update_fields(uuid4(), name='Movies') == 0
+        assert repository.update_fields(uuid4()) == 0
+
+    def test_when_no_field_is_given_then_only_check_existence(self):
+        category_record = CategoryModel.objects.create(name='Films', description='Category for films')
+        repository = DjangoORMCategoryRepository()
+
+        assert repository.update_fields(category_record.id) == 1
+
+@pytest.mark.django_db
+class TestChangeTrackedWrites:
+    def test_loaded_category_has_no_changes(self):
+        category_record = CategoryModel.objects.create(name='Films', description='Category for films')
+        repository = DjangoORMCategoryRepository()
+
+        assert repository.get_by_id(category_record.id).changed_fields == set()
+        assert repository.list()[0].changed_fields == set()
+
+    def test_update_writes_only_changed_columns(self, django_assert_num_queries):
+        category_record = CategoryModel.objects.create(name='Films', description='Category for films')
+        repository = DjangoORMCategoryRepository()
+        category = repository.get_by_id(category_record.id)
+        category.deactivate()
+
+        with django_assert_num_queries(1) as context:
+            assert repository.update(category) == 1
+
+        sql = context.captured_queries[0]['sql']
+        assert '"is_active"' in sql
+        assert '"name"' not in sql
+        assert '"description"' not in sql
+        assert category.changed_fields == set()
+        category_record.refresh_from_db()
+        assert category_record.is_active is False
+
+    def test_update_without_changes_skips_the_write(self, django_assert_num_queries):
+        category_record = CategoryModel.objects.create(name='Films', description='Category for films')
+        repository = DjangoORMCategoryRepository()
+        category = repository.get_by_id(category_record.id)
+        category.activate()
+
+        with django_assert_num_queries(1) as context:
+            assert repository.update(category) == 1
+
+        assert context.captured_queries[0]['sql'].startswith('SELECT')
+
+    def test_update_without_changes_reports_a_missing_row(self):
+        repository = DjangoORMCategoryRepository()
+        category = Category(name='Films')
+        category.clear_changes()
+
+        assert repository.update(category) == 0
+
+    def test_update_many_with_same_change_is_a_set_based_update(self, django_assert_num_queries):
+        records = [CategoryModel.objects.create(name=f'Category {i}') for i in range(4)]
+        repository = DjangoORMCategoryRepository()
+        categories = repository.get_many({record.id for record in records})
+        for category in categories:
+            category.deactivate()
+
+        # one UPDATE ... WHERE id IN (...), joining the surrounding transaction without a savepoint
+        with django_assert_num_queries(1) as context:
+            repository.update_many(categories)
+
+        assert sum(query['sql'].startswith('UPDATE "category"') for query in context.captured_queries) == 1
+        assert CategoryModel.objects.filter(is_active=False).count() == 4
+
+    def test_update_many_skips_unchanged_categories(self, django_assert_num_queries):
+        records = [CategoryModel.objects.create(name=f'Category {i}') for i in range(2)]
+        repository = DjangoORMCategoryRepository()
+        categories = repository.get_many({record.id for record in records})
+        categories[0].update_category(name='Films', description='')
+        categories[1].activate()
+
+        with django_assert_num_queries(1):
+            repository.update_many(categories)
+
+        assert set(CategoryModel.objects.values_list('name', flat=True)) == {'Films', categories[1].name}
+
+
+@pytest.mark.django_db
+class TestVersion:
+    def test_writes_that_change_rows_bump_the_version(self):
+        repository = DjangoORMCategoryRepository()
+        category = Category(name='Films')
+        versions = [repository.version()]
+
+        repository.save(category)
+        versions.append(repository.version())
+        repository.save_many([Category(name='Series')])
+        versions.append(repository.version())
+        repository.update_fields(category.id, name='Movies')
+        versions.append(repository.version())
+        category.deactivate()
+        repository.update_many([category])
+        versions.append(repository.version())
+        repository.delete(category.id)
+        versions.append(repository.version())
+
+        assert versions == sorted(set(versions))
+
+    def test_writes_that_change_nothing_keep_the_version(self):
+        repository = DjangoORMCategoryRepository()
+        version = repository.version()
+
+        assert repository.delete(uuid4()) == 0
+        assert repository.update_fields(uuid4(), name='Movies') == 0
+        assert repository.delete_many({uuid4()}) == set()
+        repository.save_many([])
+
+        assert repository.version() == version
+
+    def test_writes_outside_the_repository_bump_the_version(self):
+        repository = DjangoORMCategoryRepository()
+        versions = [repository.version()]
+
+        record = CategoryModel.objects.create(name='Films')
+        versions.append(repository.version())
+        CategoryModel.objects.filter(id=record.id).update(name='Movies')
+        versions.append(repository.version())
+        record.delete()
+        versions.append(repository.version())
+
+        assert versions == sorted(set(versions))
+
+    def test_version_row_is_recreated_when_missing(self):
+        TableVersion.objects.all().delete()
+        repository = DjangoORMCategoryRepository()
+
+        repository.save(Category(name='Films'))
+
+        assert repository.version() == 1
+
+
+@pytest.fixture
+def no_model_instances(monkeypatch):
+    def from_db(*args, **kwargs):
+        raise AssertionError('read built a model instance')
+
+    monkeypatch.setattr(CategoryModel, 'from_db', classmethod(from_db))
+
+
+@pytest.mark.django_db
+class TestValuesOnlyReads:
+    def test_reads_build_categories_without_model_instances(self, no_model_instances):
+        record = CategoryModel.objects.create(name='Films', description='Category for films', is_active=False)
+        repository = DjangoORMCategoryRepository()
+
+        categories = [
+            repository.get_by_id(record.id),
+            *repository.list(),
+            *repository.list_page(page_size=10),
+            *repository.get_many({record.id}),
+            *repository.iter_all(),
+        ]
+
+        for category in categories:
+            assert category.id == record.id
+            assert category.name == 'Films'
+            assert category.description == 'Category for films'
+            assert category.is_active is False
+            assert category.changed_fields == set()
+
+
+def _query_plan(sql: str) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        return '\n'.join(str(row[-1]) for row in cursor.fetchall())
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != 'sqlite', reason='asserts on SQLite EXPLAIN QUERY PLAN output')
+class TestIndexes:
+    @pytest.fixture(autouse=True)
+    def categories(self):
+        CategoryModel.objects.bulk_create([
+            CategoryModel(name=f'Category {i}', is_active=i % 2 == 0) for i in range(100)
+        ])
+
+    def test_list_page_uses_keyset_index(self):
+        repository = DjangoORMCategoryRepository()
+        after = CategoryModel.objects.order_by('name', 'id').values_list('name', 'id')[10]
+
+        with CaptureQueriesContext(connection) as first_page:
+            repository.list_page(page_size=10)
+        with CaptureQueriesContext(connection) as next_page:
+            repository.list_page(page_size=10, after=after)
+
+        assert 'USING INDEX category_name_id_idx' in _query_plan(first_page.captured_queries[0]['sql'])
+        plan = _query_plan(next_page.captured_queries[0]['sql'])
+        assert 'SEARCH category USING INDEX category_name_id_idx (name>?)' in plan
+        assert 'TEMP B-TREE' not in plan
+
+    def test_active_list_page_uses_partial_index(self):
+        repository = DjangoORMCategoryRepository()
+        after = CategoryModel.objects.filter(is_active=True).order_by('name', 'id').values_list('name', 'id')[10]
+
+        with CaptureQueriesContext(connection) as first_page:
+            repository.list_page(page_size=10, is_active=True)
+        with CaptureQueriesContext(connection) as next_page:
+            repository.list_page(page_size=10, after=after, is_active=True)
+
+        assert 'USING INDEX category_active_name_id_idx' in _query_plan(first_page.captured_queries[0]['sql'])
+        plan = _query_plan(next_page.captured_queries[0]['sql'])
+        assert 'SEARCH category USING INDEX category_active_name_id_idx (name>?)' in plan
+        assert 'TEMP B-TREE' not in plan
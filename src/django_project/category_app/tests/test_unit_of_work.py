@@ -0,0 +1,38 @@
+import pytest
+
+from src.core.category.domain.category import Category
+from django_project.category_app.models import Category as CategoryModel
+
+from src.django_project.unit_of_work import DjangoUnitOfWork
+
+
+@pytest.mark.django_db
+class TestDjangoUnitOfWork:
+    def test_repeated_reads_and_queued_writes_cost_one_query_each(self, django_assert_num_queries):
+        record = CategoryModel.objects.create(name='Films')
+        documentaries = Category(name='Documentaries')
+
+        # get_by_id, then one INSERT and one UPDATE on commit, plus the savepoint around the block
+        with django_assert_num_queries(5):
+            with DjangoUnitOfWork() as uow:
+                category = uow.categories.get_by_id(record.id)
+                assert uow.categories.get_by_id(record.id) is category
+                assert uow.categories.find_missing({record.id}) == set()
+                category.deactivate()
+                uow.categories.update(category)
+                uow.categories.save(documentaries)
+                uow.categories.update_fields(documentaries.id, description='Category for documentaries')
+
+        assert CategoryModel.objects.get(id=record.id).is_active is False
+        assert CategoryModel.objects.get(id=documentaries.id).description == 'Category for documentaries'
+
+    def test_writes_are_rolled_back_when_the_block_raises(self):
+        record = CategoryModel.objects.create(name='Films')
+
+        with pytest.raises(RuntimeError):
+            with DjangoUnitOfWork() as uow:
+                uow.categories.delete(record.id)
+                uow.categories.save(Category(name='Documentaries'))
+                raise RuntimeError
+
+        assert list(CategoryModel.objects.values_list('name', flat=True)) == ['Films']
@@ -1,12 +1,25 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 from uuid import uuid4, UUID
 
 import pytest
 from rest_framework.status import HTTP_200_OK, HTTP_404_NOT_FOUND, HTTP_400_BAD_REQUEST, HTTP_201_CREATED, \
-    HTTP_204_NO_CONTENT
+    HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED
 from rest_framework.test import APIClient
 
+from src.core.category.application.usecase.list_category import CategoryOutput, ListCategory, \
+    ListCategoryResponse
 from src.core.category.domain.category import Category
+from django_project.category_app.models import Category as CategoryModel
+from django_project.genre_app.models import Genre as GenreModel
+# the views module the URLconf routes to, so its single-flight stats are the ones requests update
+from django_project.category_app.views import category_reads
+from src.django_project.category_app.caching_repository import CachingCategoryRepository
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.category_app.serializers import MAX_BULK_SIZE
 
 
 @pytest.fixture
@@ -47,13 +60,206 @@ class TestListCategoryAPI:
                     'description': category_series.description,
                     'is_active': category_series.is_active
                 }
-            ]
+            ],
+            'meta': {
+                'next_cursor': None
+            }
         }
 
         assert response.status_code == HTTP_200_OK
         assert len(response.data['data']) == 2
         assert response.data == expected_data
 
+    def test_list_categories_by_page(self, category_films: Category, category_series: Category,
+                                     repository: DjangoORMCategoryRepository):
+        repository.save(category_films)
+        repository.save(category_series)
+
+        first_page = APIClient().get('/api/categories/', {'page_size': 1})
+
+        assert first_page.status_code == HTTP_200_OK
+        assert [category['id'] for category in first_page.data['data']] == [str(category_films.id)]
+        assert first_page.data['meta']['next_cursor'] is not None
+
+        second_page = APIClient().get('/api/categories/', {'page_size': 1,
+                                                           'cursor': first_page.data['meta']['next_cursor']})
+
+        assert second_page.status_code == HTTP_200_OK
+        assert [category['id'] for category in second_page.data['data']] == [str(category_series.id)]
+        assert second_page.data['meta']['next_cursor'] is None
+
+    def test_list_categories_by_active_state(self, category_films: Category, category_series: Category,
+                                             repository: DjangoORMCategoryRepository):
+        repository.save(category_films)
+        repository.save(category_series)
+
+        active = APIClient().get('/api/categories/', {'is_active': 'true'})
+        inactive = APIClient().get('/api/categories/', {'is_active': 'false'})
+
+        assert [category['id'] for category in active.data['data']] == [str(category_films.id)]
+        assert [category['id'] for category in inactive.data['data']] == [str(category_series.id)]
+
+    def test_when_cursor_is_invalid_then_return_400(self):
+        response = APIClient().get('/api/categories/', {'cursor': 'not-a-cursor'})
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert 'cursor' in response.data
+
+    def test_when_page_size_is_out_of_range_then_return_400(self):
+        response = APIClient().get('/api/categories/', {'page_size': 0})
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert 'page_size' in response.data
+
+    def test_concurrent_identical_requests_share_one_execution(self):
+        entered, release = threading.Event(), threading.Event()
+
+        def execute(use_case, request):
+            entered.set()
+            release.wait(timeout=5)
+            return ListCategoryResponse(data=[])
+
+        collapsed_before = category_reads.stats.collapsed
+        with patch.object(ListCategory, 'execute', autospec=True, side_effect=execute) as list_category:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                requests = [executor.submit(APIClient().get, '/api/categories/')]
+                entered.wait(timeout=5)
+                requests += [executor.submit(APIClient().get, '/api/categories/') for _ in range(2)]
+                deadline = time.monotonic() + 5
+                while category_reads.stats.collapsed < collapsed_before + 2 and time.monotonic() < deadline:
+                    time.sleep(0.001)
+                release.set()
+                responses = [request.result() for request in requests]
+
+        assert list_category.call_count == 1
+        assert [response.status_code for response in responses] == [HTTP_200_OK] * 3
+        assert all(response.data == {'data': [], 'meta': {'next_cursor': None}} for response in responses)
+
+    def test_request_after_a_write_does_not_join_an_older_read(self, category_films: Category):
+        entered, release = threading.Event(), threading.Event()
+        films = CategoryOutput(id=category_films.id, name=category_films.name,
+                               description=category_films.description, is_active=category_films.is_active)
+
+        def execute(use_case, request):
+            if not entered.is_set():
+                # the read started before the write: it still sees the old, empty table
+                entered.set()
+                release.wait(timeout=5)
+                return ListCategoryResponse(data=[])
+            return ListCategoryResponse(data=[films])
+
+        with patch.object(CachingCategoryRepository, 'version', autospec=True, side_effect=[1, 2]), \
+                patch.object(ListCategory, 'execute', autospec=True, side_effect=execute) as list_category:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                before_write = executor.submit(APIClient().get, '/api/categories/')
+                entered.wait(timeout=5)
+                after_write = executor.submit(APIClient().get, '/api/categories/').result(timeout=5)
+                release.set()
+                before_write = before_write.result()
+
+        assert list_category.call_count == 2
+        assert before_write.data['data'] == []
+        assert [category['id'] for category in after_write.data['data']] == [str(category_films.id)]
+        assert after_write.headers['ETag'] != before_write.headers['ETag']
+
+
+@pytest.mark.django_db
+class TestConditionalGetAPI:
+    def test_list_is_not_modified_until_a_write(self, django_assert_num_queries):
+        APIClient().post('/api/categories/', data={'name': 'Films'})
+        first = APIClient().get('/api/categories/')
+        etag = first.headers['ETag']
+
+        # only the table version is read
+        with django_assert_num_queries(1):
+            not_modified = APIClient().get('/api/categories/', HTTP_IF_NONE_MATCH=etag)
+
+        assert not_modified.status_code == HTTP_304_NOT_MODIFIED
+        assert not_modified.headers['ETag'] == etag
+        assert 'Accept' in not_modified.headers['Vary']
+        assert not_modified.content == b''
+
+        APIClient().post('/api/categories/', data={'name': 'Series'})
+        modified = APIClient().get('/api/categories/', HTTP_IF_NONE_MATCH=etag)
+
+        assert modified.status_code == HTTP_200_OK
+        assert modified.headers['ETag'] != etag
+        assert len(modified.data['data']) == 2
+
+    def test_writes_outside_the_repository_change_the_etag(self, category_films: Category,
+                                                           repository: DjangoORMCategoryRepository):
+        repository.save(category_films)
+        etag = APIClient().get('/api/categories/').headers['ETag']
+
+        # e.g. the admin, which saves model instances
+        record = CategoryModel.objects.get(id=category_films.id)
+        record.name = 'Movies'
+        record.save()
+        modified = APIClient().get('/api/categories/', HTTP_IF_NONE_MATCH=etag)
+
+        assert modified.status_code == HTTP_200_OK
+        assert modified.data['data'][0]['name'] == 'Movies'
+
+    def test_etag_depends_on_the_negotiated_media_type(self):
+        APIClient().post('/api/categories/', data={'name': 'Films'})
+        json_etag = APIClient().get('/api/categories/').headers['ETag']
+
+        browsable = APIClient().get('/api/categories/', HTTP_ACCEPT='text/html', HTTP_IF_NONE_MATCH=json_etag)
+
+        assert browsable.status_code == HTTP_200_OK
+        assert browsable.headers['ETag'] != json_etag
+        assert 'Accept' in browsable.headers['Vary']
+
+    def test_etag_depends_on_the_query(self):
+        APIClient().post('/api/categories/', data={'name': 'Films'})
+
+        first_page = APIClient().get('/api/categories/', {'page_size': 1})
+        default_page = APIClient().get('/api/categories/', HTTP_IF_NONE_MATCH=first_page.headers['ETag'])
+
+        assert default_page.status_code == HTTP_200_OK
+        assert default_page.headers['ETag'] != first_page.headers['ETag']
+
+    def test_retrieve_is_not_modified_until_a_write(self, category_films: Category,
+                                                    repository: DjangoORMCategoryRepository):
+        repository.save(category_films)
+        etag = APIClient().get(f'/api/categories/{category_films.id}/').headers['ETag']
+
+        not_modified = APIClient().get(f'/api/categories/{category_films.id}/', HTTP_IF_NONE_MATCH=f'"other", {etag}')
+        APIClient().patch(f'/api/categories/{category_films.id}/', data={'name': 'Movies'})
+        modified = APIClient().get(f'/api/categories/{category_films.id}/', HTTP_IF_NONE_MATCH=etag)
+
+        assert not_modified.status_code == HTTP_304_NOT_MODIFIED
+        assert modified.status_code == HTTP_200_OK
+        assert modified.data['data']['name'] == 'Movies'
+
+
+@pytest.mark.django_db
+class TestExportCategoryAPI:
+    def test_export_categories_as_ndjson(self, category_films: Category, category_series: Category,
+                                         repository: DjangoORMCategoryRepository):
+        repository.save(category_films)
+        repository.save(category_series)
+
+        response = APIClient().get('/api/categories/export/')
+
+        assert response.status_code == HTTP_200_OK
+        assert response['Content-Type'] == 'application/x-ndjson'
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        assert sorted(json.loads(line)['id'] for line in lines) == sorted([str(category_films.id),
+                                                                           str(category_series.id)])
+        assert {
+            'id': str(category_films.id),
+            'name': category_films.name,
+            'description': category_films.description,
+            'is_active': category_films.is_active
+        } in [json.loads(line) for line in lines]
+
+    def test_when_no_categories_then_stream_is_empty(self):
+        response = APIClient().get('/api/categories/export/')
+
+        assert response.status_code == HTTP_200_OK
+        assert b''.join(response.streaming_content) == b''
+
 
 @pytest.mark.django_db
 class TestRetrieveCategoryAPI:
@@ -86,6 +292,34 @@ class TestRetrieveCategoryAPI:
 
         assert response.status_code == HTTP_404_NOT_FOUND
 
+    def test_repeated_404_does_not_query_the_category(self, django_assert_num_queries):
+        not_found_id = uuid4()
+        APIClient().get(f'/api/categories/{not_found_id}/')
+
+        # only the table version, for the ETag
+        with django_assert_num_queries(1):
+            response = APIClient().get(f'/api/categories/{not_found_id}/')
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    def test_repeated_reads_are_served_from_cache_until_updated(self, category_films: Category,
+                                                                repository: DjangoORMCategoryRepository,
+                                                                django_assert_num_queries):
+        repository.save(category_films)
+        APIClient().get(f'/api/categories/{category_films.id}/')
+
+        # only the table version, for the ETag
+        with django_assert_num_queries(1):
+            response = APIClient().get(f'/api/categories/{category_films.id}/')
+        assert response.data['data']['name'] == 'Films'
+
+        APIClient().patch(f'/api/categories/{category_films.id}/', data={'name': 'Movies'})
+
+        # the table version and the category itself
+        with django_assert_num_queries(2):
+            response = APIClient().get(f'/api/categories/{category_films.id}/')
+        assert response.data['data']['name'] == 'Movies'
+
 
 @pytest.mark.django_db
 class TestCreateCategoryAPI:
@@ -135,6 +369,166 @@ class TestCreateCategoryAPI:
         assert repository.list() == [expected_category]
 
 
+@pytest.mark.django_db
+class TestBulkCreateCategoryAPI:
+    def test_create_every_valid_category(self, repository: DjangoORMCategoryRepository):
+        payload = {'categories': [
+            {'name': 'Films', 'description': 'Category for films'},
+            {'name': 'Series', 'is_active': False},
+        ]}
+
+        response = APIClient().post('/api/categories/bulk/', data=payload, format='json')
+
+        assert response.status_code == HTTP_201_CREATED
+        assert response.data['errors'] == []
+        assert [item['index'] for item in response.data['created']] == [0, 1]
+        series = repository.get_by_id(UUID(response.data['created'][1]['id']))
+        assert series.name == 'Series'
+        assert series.is_active is False
+        assert len(repository.list()) == 2
+
+    def test_report_item_errors_and_keep_valid_rows(self, repository: DjangoORMCategoryRepository):
+        payload = {'categories': [
+            {'name': ''},
+            {'name': 'Films'},
+            {'description': 'Category without name'},
+        ]}
+
+        response = APIClient().post('/api/categories/bulk/', data=payload, format='json')
+
+        assert response.status_code == HTTP_201_CREATED
+        assert [item['index'] for item in response.data['created']] == [1]
+        assert response.data['errors'] == [
+            {'index': 0, 'errors': {'name': ['This field may not be blank.']}},
+            {'index': 2, 'errors': {'name': ['This field is required.']}},
+        ]
+        assert [category.name for category in repository.list()] == ['Films']
+
+    def test_when_no_category_is_valid_then_return_400(self, repository: DjangoORMCategoryRepository):
+        response = APIClient().post('/api/categories/bulk/', data={'categories': [{'name': ''}]}, format='json')
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.data['created'] == []
+        assert len(response.data['errors']) == 1
+        assert repository.list() == []
+
+    def test_when_payload_is_empty_then_return_400(self):
+        response = APIClient().post('/api/categories/bulk/', data={'categories': []}, format='json')
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert 'categories' in response.data
+
+
+@pytest.mark.django_db
+class TestBulkPartialUpdateCategoryAPI:
+    def test_patch_categories_and_report_missing_ids(self, category_films: Category, category_series: Category,
+                                                     repository: DjangoORMCategoryRepository):
+        repository.save(category_films)
+        repository.save(category_series)
+        missing_id = uuid4()
+
+        response = APIClient().patch('/api/categories/bulk/', data={'categories': [
+            {'id': str(category_films.id), 'is_active': False},
+            {'id': str(category_series.id), 'name': 'TV Series', 'is_active': True},
+            {'id': str(missing_id), 'is_active': False},
+        ]}, format='json')
+
+        assert response.status_code == HTTP_200_OK
+        assert response.data == {'not_found': [str(missing_id)]}
+        films = repository.get_by_id(category_films.id)
+        assert films.is_active is False
+        assert films.name == category_films.name
+        series = repository.get_by_id(category_series.id)
+        assert series.name == 'TV Series'
+        assert series.is_active is True
+
+    def test_when_payload_is_invalid_then_return_400(self):
+        response = APIClient().patch('/api/categories/bulk/', data={'categories': [
+            {'id': 'invalid-uuid', 'name': ''},
+        ]}, format='json')
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert response.data['categories'][0] == {'id': ['Must be a valid UUID.'],
+                                                  'name': ['This field may not be blank.']}
+
+
+@pytest.mark.django_db
+class TestBulkDeleteCategoryAPI:
+    def test_delete_categories_and_report_missing_ids(self, category_films: Category, category_series: Category,
+                                                      repository: DjangoORMCategoryRepository,
+                                                      django_assert_num_queries):
+        repository.save(category_films)
+        repository.save(category_series)
+        missing_id = uuid4()
+
+        # the DELETE reports the ids it removed, no lookup of the missing ones; inside the unit of work's savepoint
+        with django_assert_num_queries(3) as context:
+            response = APIClient().delete('/api/categories/bulk/', data={
+                'ids': [str(category_films.id), str(missing_id)]
+            }, format='json')
+
+        assert [query['sql'].split()[0] for query in context.captured_queries] == ['SAVEPOINT', 'DELETE', 'RELEASE']
+
+        assert response.status_code == HTTP_200_OK
+        assert response.data == {'not_found': [str(missing_id)]}
+        assert repository.list() == [category_series]
+
+    def test_when_ids_are_missing_then_return_400(self):
+        response = APIClient().delete('/api/categories/bulk/', data={'ids': []}, format='json')
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert 'ids' in response.data
+
+
+@pytest.mark.django_db
+class TestBulkRetrieveCategoryAPI:
+    def test_return_found_categories_and_missing_ids_in_one_query(self, category_films: Category,
+                                                                  category_series: Category,
+                                                                  repository: DjangoORMCategoryRepository,
+                                                                  django_assert_num_queries):
+        repository.save(category_films)
+        repository.save(category_series)
+        missing_id = uuid4()
+
+        with django_assert_num_queries(1):
+            response = APIClient().get('/api/categories/bulk/', {
+                'ids': [f'{category_series.id},{missing_id}', str(category_films.id)]
+            })
+
+        assert response.status_code == HTTP_200_OK
+        assert response.data == {
+            'data': [
+                {
+                    'id': str(category_films.id),
+                    'name': category_films.name,
+                    'description': category_films.description,
+                    'is_active': category_films.is_active
+                },
+                {
+                    'id': str(category_series.id),
+                    'name': category_series.name,
+                    'description': category_series.description,
+                    'is_active': category_series.is_active
+                }
+            ],
+            'not_found': [str(missing_id)]
+        }
+
+    def test_when_ids_are_missing_or_invalid_then_return_400(self):
+        client = APIClient()
+
+        assert client.get('/api/categories/bulk/').status_code == HTTP_400_BAD_REQUEST
+        assert client.get('/api/categories/bulk/', {'ids': 'not-a-uuid'}).status_code == HTTP_400_BAD_REQUEST
+
+    def test_when_batch_is_too_large_then_return_400(self):
+        ids = ','.join(str(uuid4()) for _ in range(MAX_BULK_SIZE + 1))
+
+        response = APIClient().get('/api/categories/bulk/', {'ids': ids})
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert 'ids' in response.data
+
+
 @pytest.mark.django_db
 class TestUpdateCategoryAPI:
     def test_when_payload_is_invalid_then_return_400(self):
@@ -199,6 +593,24 @@ class TestDeleteCategoryAPI:
         assert response.status_code == HTTP_204_NO_CONTENT
         assert repository.get_by_id(category_series.id) is None
 
+    def test_delete_is_one_statement_that_drops_genre_links(self, category_series: Category,
+                                                            repository: DjangoORMCategoryRepository,
+                                                            django_assert_num_queries):
+        repository.save(category_series)
+        genre = GenreModel.objects.create(name='Action')
+        genre.categories.add(category_series.id)
+
+        # table triggers bump the version and remove the genre links within the DELETE; the unit of work's
+        # transaction shows up as a savepoint inside the test's own
+        with django_assert_num_queries(3) as context:
+            response = APIClient().delete(f'/api/categories/{category_series.id}/')
+
+        statements = [query['sql'] for query in context.captured_queries]
+        assert statements[0].startswith('SAVEPOINT') and statements[2].startswith('RELEASE SAVEPOINT')
+        assert statements[1].startswith('DELETE FROM "category"')
+        assert response.status_code == HTTP_204_NO_CONTENT
+        assert genre.categories.count() == 0
+
     def test_when_category_not_found_then_return_404(self):
         response = APIClient().delete(f'/api/categories/{uuid4()}/')
 
@@ -220,6 +632,21 @@ class TestPartialUpdateCategoryAPI:
         assert updated_category.description == category_films.description  # unchanged
         assert updated_category.is_active == category_films.is_active  # unchanged
 
+    def test_partial_update_does_not_read_before_writing(self, category_films: Category,
+                                                         repository: DjangoORMCategoryRepository,
+                                                         django_assert_num_queries):
+        repository.save(category_films)
+
+        # the UPDATE of the row, which also bumps the table version through its trigger, inside the unit of
+        # work's savepoint
+        with django_assert_num_queries(3) as context:
+            response = APIClient().patch(f'/api/categories/{category_films.id}/', data={'is_active': False})
+
+        assert [query['sql'].split()[0] for query in context.captured_queries] == ['SAVEPOINT', 'UPDATE', 'RELEASE']
+
+        assert response.status_code == HTTP_204_NO_CONTENT
+        assert repository.get_by_id(category_films.id).is_active is False
+
     def test_can_update_description_only(self, category_films: Category,
                                          repository: DjangoORMCategoryRepository):
         repository.save(category_films)
@@ -1,63 +1,201 @@
+import hashlib
+import json
+from typing import Iterator
 from uuid import UUID
 
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import viewsets
+from rest_framework.decorators import action
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_404_NOT_FOUND, HTTP_201_CREATED, \
-    HTTP_204_NO_CONTENT
+    HTTP_204_NO_CONTENT, HTTP_304_NOT_MODIFIED
 
+from src.core._shared.pagination import InvalidCursor
+from src.core._shared.single_flight import SingleFlight
+from src.core.category.application.usecase.bulk_create_category import BulkCreateCategory, \
+    BulkCreateCategoryRequest
 from src.core.category.application.usecase.create_category import CreateCategoryRequest, CreateCategory
+from src.core.category.application.usecase.delete_categories import DeleteCategories, DeleteCategoriesRequest
 from src.core.category.application.usecase.delete_category import DeleteCategory, DeleteCategoryRequest
-from src.core.category.application.usecase.exceptions import CategoryNotFound
+from src.core.category.application.usecase.exceptions import CategoryNotFound, InvalidCategoryData
+from src.core.category.application.usecase.export_category import ExportCategory, ExportCategoryRequest
+from src.core.category.application.usecase.get_categories import GetCategories, GetCategoriesRequest
 from src.core.category.application.usecase.get_category import GetCategory, GetCategoryRequest
-from src.core.category.application.usecase.list_category import ListCategoryRequest, ListCategory
+from src.core.category.application.usecase.list_category import ListCategoryRequest, ListCategory, CategoryOutput
+from src.core.category.application.usecase.patch_categories import PatchCategories, PatchCategoriesRequest
 from src.core.category.application.usecase.update_category import UpdateCategoryRequest, UpdateCategory
+from src.core.category.domain.category_repository import CategoryRepository
+from src.django_project.category_app.caching_repository import CachingCategoryRepository
 from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.category_app.renderers import EncodedJSONResponse, render_category, render_category_list
+from src.django_project.unit_of_work import DjangoUnitOfWork
 from src.django_project.category_app.serializers import ListCategoryResponseSerializer, \
     RetrieveCategoryRequestSerializer, RetrieveCategoryResponseSerializer, CreateCategoryRequestSerializer, \
-    CreateCategoryResponseSerializer, UpdateCategoryRequestSerializer, DeleteCategoryRequestSerializer
+    CreateCategoryResponseSerializer, UpdateCategoryRequestSerializer, DeleteCategoryRequestSerializer, \
+    ListCategoryRequestSerializer, BulkCreateCategoryRequestSerializer, BulkCreateCategoryResponseSerializer, \
+    BulkPatchCategoryRequestSerializer, BulkDeleteCategoryRequestSerializer, BulkCategoryResponseSerializer, \
+    BulkGetCategoryRequestSerializer, BulkGetCategoryResponseSerializer
+
+
+# concurrent identical list/retrieve requests share one use case execution; see category_reads.stats
+category_reads = SingleFlight()
 
 
 class CategoryViewSet(viewsets.ViewSet):
     def list(self, request: Request) -> Response:
-        use_case = ListCategory(repository=DjangoORMCategoryRepository())
-        response = use_case.execute(request=ListCategoryRequest())
+        serializer = ListCategoryRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        repository = _category_repository()
+        version = repository.version()
+        headers = _conditional_headers(request, version)
+        if _not_modified(request, headers['ETag']):
+            return Response(status=HTTP_304_NOT_MODIFIED, headers=headers)
 
+        use_case = ListCategory(repository=repository)
+        list_request = ListCategoryRequest(**serializer.validated_data)
+        try:
+            # keyed by version too: a request that saw a newer version must not join a read started before
+            # the write, or it would send the old body under the new ETag
+            response = category_reads.do(
+                ('list', version, list_request.page_size, list_request.cursor, list_request.is_active),
+                lambda: use_case.execute(request=list_request)
+            )
+        except InvalidCursor as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={'cursor': [str(e)]})
+
+        if request.accepted_renderer.format == 'json':
+            return EncodedJSONResponse(render_category_list(response), status=HTTP_200_OK, headers=headers)
+
+        # other renderers (the browsable API) still go through the serializer
         serializer = ListCategoryResponseSerializer(instance=response)
 
-        return Response(status=HTTP_200_OK, data=serializer.data)
+        return Response(status=HTTP_200_OK, data=serializer.data, headers=headers)
+
+    @action(detail=False, methods=['get'])
+    def export(self, request: Request) -> StreamingHttpResponse:
+        use_case = ExportCategory(repository=_category_repository())
+        response = use_case.execute(request=ExportCategoryRequest())
+
+        return StreamingHttpResponse(_to_ndjson(response.data), content_type='application/x-ndjson')
 
     def retrieve(self, request: Request, pk=None) -> Response:
         serializer = RetrieveCategoryRequestSerializer(data={'id': pk})
         serializer.is_valid(raise_exception=True)
 
-        use_case = GetCategory(repository=DjangoORMCategoryRepository())
+        repository = _category_repository()
+        version = repository.version()
+        headers = _conditional_headers(request, version)
+        if _not_modified(request, headers['ETag']):
+            return Response(status=HTTP_304_NOT_MODIFIED, headers=headers)
+
+        use_case = GetCategory(repository=repository)
+        id = serializer.validated_data['id']
         try:
-            response = use_case.execute(request=GetCategoryRequest(id=serializer.validated_data['id']))
+            response = category_reads.do(
+                ('retrieve', version, id), lambda: use_case.execute(request=GetCategoryRequest(id=id))
+            )
         except CategoryNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
 
+        if request.accepted_renderer.format == 'json':
+            return EncodedJSONResponse(render_category(response), status=HTTP_200_OK, headers=headers)
+
         category_data = RetrieveCategoryResponseSerializer(instance=response)
-        return Response(status=HTTP_200_OK, data=category_data.data)
+        return Response(status=HTTP_200_OK, data=category_data.data, headers=headers)
 
     def create(self, request: Request) -> Response:
         serializer = CreateCategoryRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         input = CreateCategoryRequest(**serializer.validated_data)
-        use_case = CreateCategory(repository=DjangoORMCategoryRepository())
+        use_case = CreateCategory(repository=_category_repository())
         response = use_case.execute(request=input)
 
         return Response(status=HTTP_201_CREATED, data=CreateCategoryResponseSerializer(instance=response).data)
 
+    @action(detail=False, methods=['post'])
+    def bulk(self, request: Request) -> Response:
+        serializer = BulkCreateCategoryRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        errors = []
+        inputs, positions = [], []
+        for index, item in enumerate(serializer.validated_data['categories']):
+            item_serializer = CreateCategoryRequestSerializer(data=item)
+            if not item_serializer.is_valid():
+                errors.append({'index': index, 'errors': item_serializer.errors})
+                continue
+            inputs.append(CreateCategoryRequest(**item_serializer.validated_data))
+            positions.append(index)
+
+        with DjangoUnitOfWork() as uow:
+            use_case = BulkCreateCategory(repository=uow.categories)
+            response = use_case.execute(request=BulkCreateCategoryRequest(categories=inputs))
+
+        created = [{'index': positions[item.index], 'id': item.id} for item in response.created]
+        errors.extend(
+            {'index': positions[error.index], 'errors': {'non_field_errors': [error.message]}}
+            for error in response.errors
+        )
+        errors.sort(key=lambda error: error['index'])
+
+        return Response(
+            status=HTTP_201_CREATED if created else HTTP_400_BAD_REQUEST,
+            data=BulkCreateCategoryResponseSerializer(instance={'created': created, 'errors': errors}).data
+        )
+
+    @bulk.mapping.get
+    def bulk_retrieve(self, request: Request) -> Response:
+        # ?ids=a,b&ids=c: repeated and comma-separated values both work
+        ids = [id for value in request.query_params.getlist('ids') for id in value.split(',') if id]
+        serializer = BulkGetCategoryRequestSerializer(data={'ids': ids})
+        serializer.is_valid(raise_exception=True)
+
+        use_case = GetCategories(repository=_category_repository())
+        response = use_case.execute(request=GetCategoriesRequest(ids=set(serializer.validated_data['ids'])))
+
+        response.not_found = sorted(response.not_found, key=str)
+        return Response(status=HTTP_200_OK, data=BulkGetCategoryResponseSerializer(instance=response).data)
+
+    @bulk.mapping.patch
+    def bulk_partial_update(self, request: Request) -> Response:
+        serializer = BulkPatchCategoryRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            with DjangoUnitOfWork() as uow:
+                use_case = PatchCategories(repository=uow.categories)
+                response = use_case.execute(request=PatchCategoriesRequest(categories=[
+                    UpdateCategoryRequest(**item) for item in serializer.validated_data['categories']
+                ]))
+        except InvalidCategoryData as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={'non_field_errors': [str(e)]})
+
+        return Response(status=HTTP_200_OK, data=BulkCategoryResponseSerializer(instance=response).data)
+
+    @bulk.mapping.delete
+    def bulk_destroy(self, request: Request) -> Response:
+        serializer = BulkDeleteCategoryRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        with DjangoUnitOfWork() as uow:
+            use_case = DeleteCategories(repository=uow.categories)
+            response = use_case.execute(request=DeleteCategoriesRequest(ids=set(serializer.validated_data['ids'])))
+
+        return Response(status=HTTP_200_OK, data=BulkCategoryResponseSerializer(instance=response).data)
+
     def update(self, request: Request, pk=None) -> Response:
         serializer = UpdateCategoryRequestSerializer(data={**request.data, 'id': pk})
         serializer.is_valid(raise_exception=True)
 
-        use_case = UpdateCategory(repository=DjangoORMCategoryRepository())
         try:
-            use_case.execute(request=UpdateCategoryRequest(**serializer.validated_data))
+            with DjangoUnitOfWork() as uow:
+                use_case = UpdateCategory(repository=uow.categories)
+                use_case.execute(request=UpdateCategoryRequest(**serializer.validated_data))
         except CategoryNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
 
@@ -66,9 +204,10 @@ class CategoryViewSet(viewsets.ViewSet):
     def destroy(self, request: Request, pk=None) -> Response:
         serializer = DeleteCategoryRequestSerializer(data={'id': pk})
         serializer.is_valid(raise_exception=True)
-        use_case = DeleteCategory(repository=DjangoORMCategoryRepository())
         try:
-            use_case.execute(request=DeleteCategoryRequest(**serializer.validated_data))
+            with DjangoUnitOfWork() as uow:
+                use_case = DeleteCategory(repository=uow.categories)
+                use_case.execute(request=DeleteCategoryRequest(**serializer.validated_data))
         except CategoryNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
 
@@ -77,10 +216,38 @@ class CategoryViewSet(viewsets.ViewSet):
     def partial_update(self, request: Request, pk=None) -> Response:
         serializer = UpdateCategoryRequestSerializer(data={**request.data, 'id': pk}, partial=True)
         serializer.is_valid(raise_exception=True)
-        use_case = UpdateCategory(repository=DjangoORMCategoryRepository())
         try:
-            use_case.execute(request=UpdateCategoryRequest(**serializer.validated_data))
+            with DjangoUnitOfWork() as uow:
+                use_case = UpdateCategory(repository=uow.categories)
+                use_case.execute(request=UpdateCategoryRequest(**serializer.validated_data))
         except CategoryNotFound:
             return Response(status=HTTP_404_NOT_FOUND)
 
         return Response(status=HTTP_204_NO_CONTENT)
+
+
+def _category_repository() -> CategoryRepository:
+    # every view goes through the cache, so writes made here invalidate what reads made here cached
+    return CachingCategoryRepository(repository=DjangoORMCategoryRepository())
+
+
+def _conditional_headers(request: Request, version: int) -> dict[str, str]:
+    # the table version changes with every write, so the same version, URL and negotiated media type always
+    # mean the same body; it is read before the data and is part of the single-flight key, so a write racing
+    # the request can only make the ETag older, never newer. The body depends on Accept, so caches must too
+    key = f'{version}:{request.accepted_media_type}:{request.get_full_path()}'
+    return {'ETag': quote_etag(hashlib.sha1(key.encode()).hexdigest()), 'Vary': 'Accept'}
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    return etag in parse_etags(request.headers.get('If-None-Match', ''))
+
+
+def _to_ndjson(categories: Iterator[CategoryOutput]) -> Iterator[str]:
+    for category in categories:
+        yield json.dumps({
+            'id': str(category.id),
+            'name': category.name,
+            'description': category.description,
+            'is_active': category.is_active,
+        }, ensure_ascii=False) + '\n'
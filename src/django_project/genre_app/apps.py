@@ -0,0 +1,5 @@
+from django.apps import AppConfig
+
+
+class GenreAppConfig(AppConfig):
+    name = 'django_project.genre_app'
@@ -0,0 +1,71 @@
+from typing import List
+from uuid import UUID
+
+from django.core.cache import BaseCache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+
+from src.core.genre.domain.genre import Genre
+from src.core.genre.domain.genre_repository import GenreRepository
+from src.django_project.category_app.caching_repository import MISSING_CACHE_ALIAS, CacheStats
+
+# shared by every CachingGenreRepository using the default stats, since views build one per request
+genre_cache_stats = CacheStats()
+
+
+class CachingGenreRepository(GenreRepository):
+    # only the ids the repository did not find are cached, in the same bounded cache the categories use
+    # for theirs, so repeated lookups of unknown genres are answered without a query. Found genres are
+    # not cached: their category links change with every genre and category write
+    def __init__(self, repository: GenreRepository, missing_cache: BaseCache | None = None,
+                 missing_timeout: int | None = DEFAULT_TIMEOUT, stats: CacheStats = genre_cache_stats,
+                 key_prefix: str = 'genre') -> None:
+        self.repository = repository
+        self.missing_cache = missing_cache if missing_cache is not None else caches[MISSING_CACHE_ALIAS]
+        self.missing_timeout = missing_timeout
+        self.stats = stats
+        self.key_prefix = key_prefix
+
+    def save(self, genre: Genre) -> None:
+        self.repository.save(genre)
+        key = self._id_key(genre.id)
+
+        def drop():
+            self.missing_cache.delete(key)
+
+        # again after commit: other requests may have missed the row while the transaction was open
+        drop()
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(drop)
+
+    def get_by_id(self, id: UUID) -> Genre | None:
+        if self.missing_cache.get(self._id_key(id)) is not None:
+            self.stats.record(missing_hits=1)
+            return None
+
+        self.stats.record(misses=1)
+        genre = self.repository.get_by_id(id)
+        if genre is None:
+            self.missing_cache.set(self._id_key(id), True, self.missing_timeout)
+        return genre
+
+    def delete(self, id: UUID) -> None:
+        self.repository.delete(id)
+
+    def update(self, genre: Genre, categories_added: set[UUID] | None = None,
+               categories_removed: set[UUID] | None = None) -> None:
+        self.repository.update(genre, categories_added=categories_added, categories_removed=categories_removed)
+
+    def list(self) -> List[Genre]:
+        return self.repository.list()
+
+    def list_by_category(self, category_id: UUID) -> List[Genre]:
+        return self.repository.list_by_category(category_id)
+
+    def list_page(self, page_size: int, after: tuple[str, UUID] | None = None, is_active: bool | None = None,
+                  category_id: UUID | None = None, name_prefix: str | None = None) -> List[Genre]:
+        return self.repository.list_page(page_size, after=after, is_active=is_active, category_id=category_id,
+                                         name_prefix=name_prefix)
+
+    def _id_key(self, id: UUID) -> str:
+        return f'{self.key_prefix}:id:{id}'
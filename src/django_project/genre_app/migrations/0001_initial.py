@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-18 06:36
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('category_app', '0003_table_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Genre',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('is_active', models.BooleanField(default=True)),
+                ('categories', models.ManyToManyField(db_table='genre_category', related_name='genres', to='category_app.category')),
+            ],
+            options={
+                'db_table': 'genre',
+                'indexes': [models.Index(fields=['name', 'id'], name='genre_name_id_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0.1 on 2026-10-18 07:25
+
+from django.db import migrations
+
+# SQLite. Stands in for ON DELETE CASCADE on genre_category.category_id, which Django does not declare:
+# a category deleted with a plain DELETE (no deletion collector) takes its genre links with it, in the
+# same statement. Deletes that go through the collector have removed the links already
+DELETE_CATEGORY_LINKS = '''
+    CREATE TRIGGER genre_category_after_category_delete AFTER DELETE ON category
+    BEGIN
+        DELETE FROM genre_category WHERE category_id = OLD.id;
+    END
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('genre_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=DELETE_CATEGORY_LINKS,
+            reverse_sql='DROP TRIGGER genre_category_after_category_delete',
+        ),
+    ]
@@ -0,0 +1,22 @@
+from uuid import uuid4
+
+from django.db import models
+
+from django_project.category_app.models import Category
+
+
+class Genre(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid4)
+    name = models.CharField(max_length=255)
+    is_active = models.BooleanField(default=True)
+    # the link table is unique on (genre_id, category_id) and indexed on category_id, which list_by_category scans
+    categories = models.ManyToManyField(Category, related_name='genres', db_table='genre_category')
+
+    class Meta:
+        db_table = 'genre'
+        indexes = [
+            models.Index(fields=['name', 'id'], name='genre_name_id_idx'),
+        ]
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,111 @@
+from typing import Dict, Iterable, List, Set
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Q
+
+from src.core.genre.domain.genre import Genre
+from src.core.genre.domain.genre_repository import GenreRepository
+from django_project.genre_app.models import Genre as GenreModel
+
+
+class DjangoORMGenreRepository(GenreRepository):
+    BULK_BATCH_SIZE = 500
+    # genre rows are read as tuples in Genre.rehydrate argument order, the categories come from a second query
+    COLUMNS = ('id', 'name', 'is_active')
+
+    def __init__(self, genre_model: GenreModel = GenreModel) -> None:
+        self.genre_model = genre_model
+        self.link_model = genre_model.categories.through
+
+    # every read costs two queries whatever the number of genres: one for the genre rows and one for
+    # all of their category links
+
+    def save(self, genre: Genre) -> None:
+        with transaction.atomic(savepoint=False):
+            self.genre_model.objects.create(id=genre.id, name=genre.name, is_active=genre.is_active)
+            self._add_links(genre.id, genre.categories)
+        genre.clear_changes()
+
+    def get_by_id(self, id: UUID) -> Genre | None:
+        genres = self._to_entities(self.genre_model.objects.filter(id=id), self.link_model.objects.filter(genre_id=id))
+        return genres[0] if genres else None
+
+    def delete(self, id: UUID) -> None:
+        # the links go with the genre (the collector deletes them in one statement)
+        self.genre_model.objects.filter(id=id).delete()
+
+    def update(self, genre: Genre, categories_added: set[UUID] | None = None,
+               categories_removed: set[UUID] | None = None) -> None:
+        changes = {field: getattr(genre, field) for field in ('name', 'is_active') if field in genre.changed_fields}
+        with transaction.atomic(savepoint=False):
+            queryset = self.genre_model.objects.filter(id=genre.id)
+            if not (queryset.update(**changes) if changes else queryset.exists()):
+                return
+            if categories_added is None or categories_removed is None:
+                # no delta given: always diff against the stored links, since `categories` is a plain set
+                # and changes made to it in place are not tracked; only what differs is written
+                links = self.link_model.objects.filter(genre_id=genre.id)
+                stored = set(links.values_list('category_id', flat=True))
+                categories_added = genre.categories - stored
+                categories_removed = stored - genre.categories
+            self._remove_links(genre.id, categories_removed)
+            self._add_links(genre.id, categories_added)
+        genre.clear_changes()
+
+    def list(self) -> List[Genre]:
+        return self._to_entities(self.genre_model.objects.all(), self.link_model.objects.all())
+
+    def list_by_category(self, category_id: UUID) -> List[Genre]:
+        genre_ids = self.link_model.objects.filter(category_id=category_id).values('genre_id')
+        return self._to_entities(
+            self.genre_model.objects.filter(id__in=genre_ids),
+            self.link_model.objects.filter(genre_id__in=genre_ids),
+        )
+
+    def list_page(self, page_size: int, after: tuple[str, UUID] | None = None, is_active: bool | None = None,
+                  category_id: UUID | None = None, name_prefix: str | None = None) -> List[Genre]:
+        queryset = self.genre_model.objects.order_by('name', 'id')
+        if is_active is not None:
+            queryset = queryset.filter(is_active=is_active)
+        if category_id is not None:
+            genre_ids = self.link_model.objects.filter(category_id=category_id).values('genre_id')
+            queryset = queryset.filter(id__in=genre_ids)
+        if name_prefix:
+            queryset = queryset.filter(name__istartswith=name_prefix)
+        if after is not None:
+            name, id = after
+            # name__gte lets the (name, id) index bound the range scan, the Q narrows it to the keyset
+            queryset = queryset.filter(name__gte=name).filter(Q(name__gt=name) | Q(name=name, id__gt=id))
+
+        rows = list(queryset[:page_size].values_list(*self.COLUMNS))
+        # a page is small, so its ids go to the link query as a list rather than repeating the filters
+        return self._rehydrate(rows, self.link_model.objects.filter(genre_id__in=[row[0] for row in rows]))
+
+    def _add_links(self, genre_id: UUID, category_ids: Iterable[UUID]) -> None:
+        # a link that is already there (e.g. a delta computed from a stale genre) is not an error
+        self.link_model.objects.bulk_create(
+            [self.link_model(genre_id=genre_id, category_id=category_id) for category_id in category_ids],
+            batch_size=self.BULK_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+    def _remove_links(self, genre_id: UUID, category_ids: Iterable[UUID]) -> None:
+        category_ids = list(category_ids)
+        for start in range(0, len(category_ids), self.BULK_BATCH_SIZE):
+            self.link_model.objects.filter(
+                genre_id=genre_id, category_id__in=category_ids[start:start + self.BULK_BATCH_SIZE]
+            ).delete()
+
+    def _to_entities(self, genres, links) -> List[Genre]:
+        return self._rehydrate(list(genres.values_list(*self.COLUMNS)), links)
+
+    def _rehydrate(self, rows: List[tuple], links) -> List[Genre]:
+        if not rows:
+            return []
+        categories: Dict[UUID, Set[UUID]] = {}
+        for genre_id, category_id in links.values_list('genre_id', 'category_id'):
+            categories.setdefault(genre_id, set()).add(category_id)
+
+        rehydrate = Genre.rehydrate
+        return [rehydrate(id, name, is_active, categories.get(id, set())) for id, name, is_active in rows]
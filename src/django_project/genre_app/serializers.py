@@ -0,0 +1,61 @@
+from rest_framework import serializers
+
+from src.core._shared.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from src.django_project.category_app.serializers import CategoryResponseSerializer, ListMetaResponseSerializer
+
+EXPAND_CATEGORIES = 'categories'
+
+
+class GenreResponseSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255)
+    is_active = serializers.BooleanField()
+    categories = serializers.ListField(child=serializers.UUIDField())
+
+
+class ExpandedGenreResponseSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255)
+    is_active = serializers.BooleanField()
+    categories = CategoryResponseSerializer(many=True)
+
+
+class ListGenreRequestSerializer(serializers.Serializer):
+    page_size = serializers.IntegerField(min_value=1, max_value=MAX_PAGE_SIZE, default=DEFAULT_PAGE_SIZE)
+    cursor = serializers.CharField(required=False)
+    # allow_null keeps a missing query parameter as "no filter" instead of False
+    is_active = serializers.BooleanField(required=False, allow_null=True)
+    category_id = serializers.UUIDField(required=False)
+    name_prefix = serializers.CharField(required=False)
+    expand = serializers.ChoiceField(choices=[EXPAND_CATEGORIES], required=False)
+
+
+class ListGenreResponseSerializer(serializers.Serializer):
+    data = GenreResponseSerializer(many=True)
+    meta = ListMetaResponseSerializer(source='*')
+
+
+class ListExpandedGenreResponseSerializer(serializers.Serializer):
+    data = ExpandedGenreResponseSerializer(many=True)
+    meta = ListMetaResponseSerializer(source='*')
+
+
+class CreateGenreRequestSerializer(serializers.Serializer):
+    name = serializers.CharField(max_length=255, allow_blank=False)
+    category_ids = serializers.ListField(child=serializers.UUIDField(), required=False, default=list)
+    is_active = serializers.BooleanField(required=False, default=True)
+
+
+class CreateGenreResponseSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+
+
+class UpdateGenreRequestSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255, allow_blank=False)
+    is_active = serializers.BooleanField()
+    category_ids = serializers.ListField(child=serializers.UUIDField())
+
+
+class DeleteGenreRequestSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
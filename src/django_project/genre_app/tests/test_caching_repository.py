@@ -0,0 +1,65 @@
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+
+from src.core.genre.domain.genre import Genre
+from src.django_project.category_app.caching_repository import CacheStats
+from src.django_project.genre_app.caching_repository import CachingGenreRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+def _cache(**options) -> LocMemCache:
+    return LocMemCache(f'test-{uuid4()}', {'OPTIONS': options})
+
+
+@pytest.fixture
+def inner() -> Mock:
+    return Mock(wraps=DjangoORMGenreRepository())
+
+
+@pytest.fixture
+def repository(inner: Mock) -> CachingGenreRepository:
+    return CachingGenreRepository(repository=inner, missing_cache=_cache(), stats=CacheStats())
+
+
+@pytest.mark.django_db
+class TestNegativeCache:
+    def test_missing_genre_is_answered_from_cache(self, repository: CachingGenreRepository, inner: Mock,
+                                                  django_assert_num_queries):
+        not_found_id = uuid4()
+        assert repository.get_by_id(not_found_id) is None
+
+        with django_assert_num_queries(0):
+            assert repository.get_by_id(not_found_id) is None
+
+        assert inner.get_by_id.call_count == 1
+        assert (repository.stats.missing_hits, repository.stats.misses) == (1, 1)
+
+    def test_found_genres_are_always_read_from_the_repository(self, repository: CachingGenreRepository,
+                                                              inner: Mock):
+        genre = Genre(name='Action')
+        repository.save(genre)
+
+        assert repository.get_by_id(genre.id) == genre
+        assert repository.get_by_id(genre.id) == genre
+        assert inner.get_by_id.call_count == 2
+
+    def test_saving_the_missing_id_drops_the_entry(self, repository: CachingGenreRepository):
+        genre = Genre(name='Action')
+        assert repository.get_by_id(genre.id) is None
+
+        repository.save(genre)
+
+        assert repository.get_by_id(genre.id) == genre
+
+    def test_missing_entries_expire_after_their_own_timeout(self, inner: Mock):
+        repository = CachingGenreRepository(repository=inner, missing_cache=_cache(), missing_timeout=-1,
+                                            stats=CacheStats())
+        not_found_id = uuid4()
+
+        repository.get_by_id(not_found_id)
+        repository.get_by_id(not_found_id)
+
+        assert inner.get_by_id.call_count == 2
@@ -0,0 +1,276 @@
+from uuid import uuid4
+
+import pytest
+
+from src.core.genre.domain.genre import Genre
+from django_project.category_app.models import Category as CategoryModel
+from django_project.genre_app.models import Genre as GenreModel
+
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+@pytest.fixture
+def movie_category() -> CategoryModel:
+    return CategoryModel.objects.create(name='Movie')
+
+
+@pytest.fixture
+def documentary_category() -> CategoryModel:
+    return CategoryModel.objects.create(name='Documentary')
+
+
+@pytest.mark.django_db
+class TestSave:
+    def test_can_save_genre_with_categories(self, movie_category, documentary_category):
+        repository = DjangoORMGenreRepository()
+        genre = Genre(name='Action', is_active=False, categories={movie_category.id, documentary_category.id})
+
+        repository.save(genre)
+
+        record = GenreModel.objects.get(id=genre.id)
+        assert record.name == 'Action'
+        assert record.is_active is False
+        assert set(record.categories.values_list('id', flat=True)) == {movie_category.id, documentary_category.id}
+        assert genre.changed_fields == set()
+
+
+@pytest.mark.django_db
+class TestGetById:
+    def test_can_get_genre_with_categories(self, movie_category, django_assert_num_queries):
+        genre = Genre(name='Action', categories={movie_category.id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        with django_assert_num_queries(2):
+            response = repository.get_by_id(genre.id)
+
+        assert response == genre
+        assert response.name == 'Action'
+        assert response.categories == {movie_category.id}
+        assert response.changed_fields == set()
+
+    def test_when_genre_does_not_exist_then_return_none(self, django_assert_num_queries):
+        repository = DjangoORMGenreRepository()
+
+        with django_assert_num_queries(1):
+            assert repository.get_by_id(uuid4()) is None
+
+
+@pytest.mark.django_db
+class TestDelete:
+    def test_can_delete_genre_and_its_links(self, movie_category):
+        action = Genre(name='Action', categories={movie_category.id})
+        horror = Genre(name='Horror', categories={movie_category.id})
+        repository = DjangoORMGenreRepository()
+        repository.save(action)
+        repository.save(horror)
+
+        repository.delete(action.id)
+
+        assert repository.list() == [horror]
+        assert repository.list_by_category(movie_category.id) == [horror]
+
+    def test_when_genre_does_not_exist_then_no_effect(self):
+        repository = DjangoORMGenreRepository()
+        repository.save(Genre(name='Action'))
+
+        repository.delete(uuid4())
+
+        assert GenreModel.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestUpdate:
+    def test_can_update_genre_and_categories(self, movie_category, documentary_category):
+        genre = Genre(name='Action', categories={movie_category.id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        genre.change_name('Adventure')
+        genre.deactivate()
+        genre.remove_category(movie_category.id)
+        genre.add_category(documentary_category.id)
+        repository.update(genre)
+
+        response = repository.get_by_id(genre.id)
+        assert response.name == 'Adventure'
+        assert response.is_active is False
+        assert response.categories == {documentary_category.id}
+        assert genre.changed_fields == set()
+
+    def test_update_without_category_changes_keeps_links(self, movie_category, django_assert_num_queries):
+        genre = Genre(name='Action', categories={movie_category.id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        genre.change_name('Adventure')
+        with django_assert_num_queries(2) as context:
+            repository.update(genre)
+
+        assert [query['sql'].split()[0] for query in context.captured_queries] == ['UPDATE', 'SELECT']
+        assert repository.get_by_id(genre.id).categories == {movie_category.id}
+
+    def test_update_writes_categories_changed_in_place(self, movie_category, documentary_category):
+        genre = Genre(name='Action', categories={movie_category.id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        genre.categories.add(documentary_category.id)
+        repository.update(genre)
+
+        assert repository.get_by_id(genre.id).categories == {movie_category.id, documentary_category.id}
+
+    def test_when_genre_does_not_exist_then_no_effect(self, movie_category):
+        repository = DjangoORMGenreRepository()
+
+        repository.update(Genre(name='Action', categories={movie_category.id}))
+
+        assert GenreModel.objects.count() == 0
+        assert GenreModel.categories.through.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestDeltaUpdate:
+    @pytest.fixture
+    def categories(self) -> list[CategoryModel]:
+        return CategoryModel.objects.bulk_create([CategoryModel(name=f'Category {i}') for i in range(2_000)])
+
+    def test_write_only_the_membership_delta(self, categories, django_assert_num_queries):
+        genre = Genre(name='Action', categories={category.id for category in categories[:-1]})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+        removed, added = categories[0].id, categories[-1].id
+
+        genre.remove_category(removed)
+        genre.add_category(added)
+        with django_assert_num_queries(3) as context:
+            repository.update(genre, categories_added={added}, categories_removed={removed})
+
+        assert [query['sql'].split()[0] for query in context.captured_queries] == ['SELECT', 'DELETE', 'INSERT']
+        assert repository.get_by_id(genre.id).categories == {category.id for category in categories[1:]}
+
+    def test_without_delta_diff_against_stored_links(self, categories, django_assert_num_queries):
+        genre = Genre(name='Action', categories={category.id for category in categories[:-1]})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        genre.categories = {category.id for category in categories[1:]}
+        with django_assert_num_queries(4) as context:
+            repository.update(genre)
+
+        assert [query['sql'].split()[0] for query in context.captured_queries] == \
+            ['SELECT', 'SELECT', 'DELETE', 'INSERT']
+        assert repository.get_by_id(genre.id).categories == {category.id for category in categories[1:]}
+
+    def test_stale_delta_does_not_fail(self, categories):
+        genre = Genre(name='Action', categories={categories[0].id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        genre.add_category(categories[1].id)
+        repository.update(genre, categories_added={categories[0].id, categories[1].id}, categories_removed=set())
+
+        assert repository.get_by_id(genre.id).categories == {categories[0].id, categories[1].id}
+
+
+@pytest.mark.django_db(transaction=True)
+class TestDeltaUpdateTransaction:
+    def test_delta_is_written_with_the_genre_row(self, movie_category, documentary_category, monkeypatch):
+        genre = Genre(name='Action', categories={movie_category.id})
+        repository = DjangoORMGenreRepository()
+        repository.save(genre)
+
+        def fail(*args, **kwargs):
+            raise RuntimeError('insert failed')
+
+        monkeypatch.setattr(repository, '_add_links', fail)
+        genre.change_name('Adventure')
+        genre.remove_category(movie_category.id)
+        genre.add_category(documentary_category.id)
+        with pytest.raises(RuntimeError):
+            repository.update(genre, categories_added={documentary_category.id},
+                              categories_removed={movie_category.id})
+
+        response = repository.get_by_id(genre.id)
+        assert response.name == 'Action'
+        assert response.categories == {movie_category.id}
+
+
+@pytest.mark.django_db
+class TestListByCategory:
+    def test_return_genres_with_all_their_categories(self, movie_category, documentary_category,
+                                                     django_assert_num_queries):
+        action = Genre(name='Action', categories={movie_category.id, documentary_category.id})
+        drama = Genre(name='Drama', categories={documentary_category.id})
+        repository = DjangoORMGenreRepository()
+        repository.save(action)
+        repository.save(drama)
+
+        with django_assert_num_queries(2):
+            [genre] = repository.list_by_category(movie_category.id)
+
+        assert genre == action
+        assert genre.categories == {movie_category.id, documentary_category.id}
+
+
+@pytest.mark.django_db
+class TestListPage:
+    @pytest.fixture
+    def genres(self, movie_category) -> list[Genre]:
+        genres = [
+            Genre(name='Drama', categories={movie_category.id}),
+            Genre(name='Action', is_active=False),
+            Genre(name='Adventure', categories={movie_category.id}),
+            Genre(name='Comedy', categories={movie_category.id}),
+        ]
+        repository = DjangoORMGenreRepository()
+        for genre in genres:
+            repository.save(genre)
+        return genres
+
+    def test_return_genres_ordered_by_name_after_key(self, genres, django_assert_num_queries):
+        repository = DjangoORMGenreRepository()
+        adventure = genres[2]
+
+        with django_assert_num_queries(2):
+            page = repository.list_page(page_size=2, after=(adventure.name, adventure.id))
+
+        assert [genre.name for genre in page] == ['Comedy', 'Drama']
+
+    def test_apply_filters(self, genres, movie_category):
+        repository = DjangoORMGenreRepository()
+
+        active = repository.list_page(page_size=10, is_active=True, category_id=movie_category.id)
+        by_prefix = repository.list_page(page_size=10, name_prefix='a')
+
+        assert [genre.name for genre in active] == ['Adventure', 'Comedy', 'Drama']
+        assert all(genre.categories == {movie_category.id} for genre in active)
+        assert [genre.name for genre in by_prefix] == ['Action', 'Adventure']
+
+    def test_when_no_genre_matches_then_skip_links_query(self, django_assert_num_queries):
+        repository = DjangoORMGenreRepository()
+
+        with django_assert_num_queries(1):
+            assert repository.list_page(page_size=10) == []
+
+
+@pytest.mark.django_db
+class TestQueryCount:
+    def test_listing_10k_genres_costs_constant_queries(self, movie_category, documentary_category,
+                                                       django_assert_num_queries):
+        records = GenreModel.objects.bulk_create([GenreModel(name=f'Genre {i}') for i in range(10_000)])
+        link_model = GenreModel.categories.through
+        link_model.objects.bulk_create([
+            link_model(genre_id=record.id, category_id=category.id)
+            for record in records
+            for category in (movie_category, documentary_category)
+        ], batch_size=500)
+        repository = DjangoORMGenreRepository()
+
+        with django_assert_num_queries(2):
+            genres = repository.list()
+        with django_assert_num_queries(2):
+            by_category = repository.list_by_category(movie_category.id)
+
+        assert len(genres) == len(by_category) == 10_000
+        assert all(genre.categories == {movie_category.id, documentary_category.id} for genre in genres)
@@ -0,0 +1,232 @@
+from uuid import uuid4
+
+import pytest
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT, HTTP_400_BAD_REQUEST, \
+    HTTP_404_NOT_FOUND
+from rest_framework.test import APIClient
+
+from src.core.category.domain.category import Category
+from src.core.genre.domain.genre import Genre
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+
+
+@pytest.fixture
+def category_films() -> Category:
+    return Category(name='Films', description='Category for films')
+
+
+@pytest.fixture
+def category_series() -> Category:
+    return Category(name='Series', description='Category for series', is_active=False)
+
+
+@pytest.fixture
+def category_repository(category_films: Category, category_series: Category) -> DjangoORMCategoryRepository:
+    repository = DjangoORMCategoryRepository()
+    repository.save_many([category_films, category_series])
+    return repository
+
+
+@pytest.fixture
+def repository() -> DjangoORMGenreRepository:
+    return DjangoORMGenreRepository()
+
+
+@pytest.fixture
+def genre_action(category_films: Category, category_series: Category) -> Genre:
+    return Genre(name='Action', categories={category_films.id, category_series.id})
+
+
+@pytest.fixture
+def genre_drama(category_films: Category) -> Genre:
+    return Genre(name='Drama', is_active=False, categories={category_films.id})
+
+
+@pytest.mark.django_db
+class TestListGenreAPI:
+    def test_list_genres(self, category_repository, repository, genre_action: Genre, genre_drama: Genre,
+                         category_films: Category, category_series: Category):
+        repository.save(genre_action)
+        repository.save(genre_drama)
+
+        response = APIClient().get('/api/genres/')
+
+        assert response.status_code == HTTP_200_OK
+        assert response.data == {
+            'data': [
+                {
+                    'id': str(genre_action.id),
+                    'name': 'Action',
+                    'is_active': True,
+                    'categories': sorted([str(category_films.id), str(category_series.id)]),
+                },
+                {
+                    'id': str(genre_drama.id),
+                    'name': 'Drama',
+                    'is_active': False,
+                    'categories': [str(category_films.id)],
+                },
+            ],
+            'meta': {'next_cursor': None},
+        }
+
+    def test_filters_and_pagination(self, category_repository, repository, genre_action: Genre,
+                                    genre_drama: Genre, category_series: Category):
+        repository.save(genre_action)
+        repository.save(genre_drama)
+        client = APIClient()
+
+        first_page = client.get('/api/genres/', {'page_size': 1})
+        second_page = client.get('/api/genres/', {'page_size': 1, 'cursor': first_page.data['meta']['next_cursor']})
+        inactive = client.get('/api/genres/', {'is_active': 'false'})
+        by_category = client.get('/api/genres/', {'category_id': str(category_series.id)})
+
+        assert [genre['name'] for genre in first_page.data['data']] == ['Action']
+        assert [genre['name'] for genre in second_page.data['data']] == ['Drama']
+        assert [genre['name'] for genre in inactive.data['data']] == ['Drama']
+        assert [genre['name'] for genre in by_category.data['data']] == ['Action']
+
+    def test_expand_embeds_categories_with_one_batched_lookup(self, category_repository, repository,
+                                                              genre_action: Genre, genre_drama: Genre,
+                                                              category_films: Category, category_series: Category,
+                                                              django_assert_num_queries):
+        repository.save(genre_action)
+        repository.save(genre_drama)
+        films = {
+            'id': str(category_films.id),
+            'name': 'Films',
+            'description': 'Category for films',
+            'is_active': True,
+        }
+
+        # genres, their links, and one query for every category the page references
+        with django_assert_num_queries(3):
+            response = APIClient().get('/api/genres/', {'expand': 'categories'})
+
+        assert response.status_code == HTTP_200_OK
+        assert response.data['data'][0]['categories'] == [films, {
+            'id': str(category_series.id),
+            'name': 'Series',
+            'description': 'Category for series',
+            'is_active': False,
+        }]
+        assert response.data['data'][1]['categories'] == [films]
+
+    def test_when_expand_is_unknown_then_return_400(self):
+        response = APIClient().get('/api/genres/', {'expand': 'videos'})
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert 'expand' in response.data
+
+    def test_when_cursor_is_invalid_then_return_400(self):
+        response = APIClient().get('/api/genres/', {'cursor': 'not-a-cursor'})
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert 'cursor' in response.data
+
+
+@pytest.mark.django_db
+class TestCreateGenreAPI:
+    def test_create_genre(self, category_repository, repository, category_films: Category):
+        response = APIClient().post('/api/genres/', {'name': 'Action', 'category_ids': [str(category_films.id)]},
+                                    format='json')
+
+        assert response.status_code == HTTP_201_CREATED
+        genre = repository.get_by_id(response.data['id'])
+        assert genre.name == 'Action'
+        assert genre.is_active is True
+        assert genre.categories == {category_films.id}
+
+    def test_when_category_does_not_exist_then_return_400(self, repository):
+        response = APIClient().post('/api/genres/', {'name': 'Action', 'category_ids': [str(uuid4())]},
+                                    format='json')
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert repository.list() == []
+
+    def test_when_payload_is_invalid_then_return_400(self):
+        response = APIClient().post('/api/genres/', {'name': ''}, format='json')
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert 'name' in response.data
+
+
+@pytest.mark.django_db
+class TestUpdateGenreAPI:
+    def test_update_genre(self, category_repository, repository, genre_action: Genre, category_series: Category):
+        repository.save(genre_action)
+
+        response = APIClient().put(f'/api/genres/{genre_action.id}/', {
+            'name': 'Adventure',
+            'is_active': False,
+            'category_ids': [str(category_series.id)],
+        }, format='json')
+
+        assert response.status_code == HTTP_204_NO_CONTENT
+        genre = repository.get_by_id(genre_action.id)
+        assert genre.name == 'Adventure'
+        assert genre.is_active is False
+        assert genre.categories == {category_series.id}
+
+    def test_when_payload_is_incomplete_then_return_400(self, repository, genre_action: Genre, category_repository):
+        repository.save(genre_action)
+
+        response = APIClient().put(f'/api/genres/{genre_action.id}/', {'name': 'Adventure'}, format='json')
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+
+    def test_partial_update_keeps_other_fields(self, category_repository, repository, genre_action: Genre):
+        repository.save(genre_action)
+
+        response = APIClient().patch(f'/api/genres/{genre_action.id}/', {'name': 'Adventure'}, format='json')
+
+        assert response.status_code == HTTP_204_NO_CONTENT
+        genre = repository.get_by_id(genre_action.id)
+        assert genre.name == 'Adventure'
+        assert genre.categories == genre_action.categories
+
+    def test_when_genre_does_not_exist_then_return_404(self):
+        response = APIClient().patch(f'/api/genres/{uuid4()}/', {'name': 'Adventure'}, format='json')
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    def test_when_category_does_not_exist_then_return_400(self, category_repository, repository,
+                                                          genre_action: Genre):
+        repository.save(genre_action)
+
+        response = APIClient().patch(f'/api/genres/{genre_action.id}/', {'category_ids': [str(uuid4())]},
+                                     format='json')
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
+        assert repository.get_by_id(genre_action.id).categories == genre_action.categories
+
+
+@pytest.mark.django_db
+class TestDeleteGenreAPI:
+    def test_delete_genre(self, category_repository, repository, genre_action: Genre):
+        repository.save(genre_action)
+
+        response = APIClient().delete(f'/api/genres/{genre_action.id}/')
+
+        assert response.status_code == HTTP_204_NO_CONTENT
+        assert repository.get_by_id(genre_action.id) is None
+
+    def test_when_genre_does_not_exist_then_return_404(self):
+        response = APIClient().delete(f'/api/genres/{uuid4()}/')
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    def test_repeated_404_does_not_query_the_genre(self, django_assert_num_queries):
+        not_found_id = uuid4()
+        APIClient().delete(f'/api/genres/{not_found_id}/')
+
+        with django_assert_num_queries(0):
+            response = APIClient().delete(f'/api/genres/{not_found_id}/')
+
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    def test_when_id_is_invalid_then_return_400(self):
+        response = APIClient().delete('/api/genres/not-a-uuid/')
+
+        assert response.status_code == HTTP_400_BAD_REQUEST
@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from typing import Dict, List
+from uuid import UUID
+
+from rest_framework import viewsets
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT, HTTP_400_BAD_REQUEST, \
+    HTTP_404_NOT_FOUND
+
+from src.core._shared.pagination import InvalidCursor
+from src.core.category.domain.category import Category
+from src.core.category.domain.category_repository import CategoryRepository
+from src.core.genre.application.exceptions import GenreNotFound, InvalidGenre, RelatedCategoriesNotFound
+from src.core.genre.application.usecase.create_genre import CreateGenre
+from src.core.genre.application.usecase.delete_genre import DeleteGenre
+from src.core.genre.application.usecase.list_genre import GenreOutput, ListGenre
+from src.core.genre.application.usecase.update_genre import UpdateGenre
+from src.core.genre.domain.genre_repository import GenreRepository
+from src.django_project.category_app.caching_repository import CachingCategoryRepository
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+from src.django_project.genre_app.caching_repository import CachingGenreRepository
+from src.django_project.genre_app.repository import DjangoORMGenreRepository
+from src.django_project.unit_of_work import DjangoUnitOfWork
+from src.django_project.genre_app.serializers import EXPAND_CATEGORIES, CreateGenreRequestSerializer, \
+    CreateGenreResponseSerializer, DeleteGenreRequestSerializer, ListExpandedGenreResponseSerializer, \
+    ListGenreRequestSerializer, ListGenreResponseSerializer, UpdateGenreRequestSerializer
+
+
+@dataclass
+class ExpandedGenreOutput:
+    id: UUID
+    name: str
+    is_active: bool
+    categories: List[Category]
+
+
+class GenreViewSet(viewsets.ViewSet):
+    def list(self, request: Request) -> Response:
+        serializer = ListGenreRequestSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        expand = serializer.validated_data.pop('expand', None)
+
+        use_case = ListGenre(repository=_genre_repository())
+        try:
+            response = use_case.execute(ListGenre.Input(**serializer.validated_data))
+        except InvalidCursor as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={'cursor': [str(e)]})
+
+        if expand == EXPAND_CATEGORIES:
+            response.data = _expand_categories(response.data, _category_repository())
+            return Response(status=HTTP_200_OK, data=ListExpandedGenreResponseSerializer(instance=response).data)
+
+        for genre in response.data:
+            genre.categories = sorted(genre.categories, key=str)
+        return Response(status=HTTP_200_OK, data=ListGenreResponseSerializer(instance=response).data)
+
+    def create(self, request: Request) -> Response:
+        serializer = CreateGenreRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        input = CreateGenre.Input(**{**serializer.validated_data,
+                                     'category_ids': set(serializer.validated_data['category_ids'])})
+        try:
+            with DjangoUnitOfWork() as uow:
+                use_case = CreateGenre(repository=_genre_repository(), category_repository=uow.categories)
+                response = use_case.execute(input)
+        except (InvalidGenre, RelatedCategoriesNotFound) as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={'non_field_errors': [str(e)]})
+
+        return Response(status=HTTP_201_CREATED, data=CreateGenreResponseSerializer(instance=response).data)
+
+    def update(self, request: Request, pk=None) -> Response:
+        return self._update(request, pk, partial=False)
+
+    def partial_update(self, request: Request, pk=None) -> Response:
+        return self._update(request, pk, partial=True)
+
+    def destroy(self, request: Request, pk=None) -> Response:
+        serializer = DeleteGenreRequestSerializer(data={'id': pk})
+        serializer.is_valid(raise_exception=True)
+
+        use_case = DeleteGenre(repository=_genre_repository())
+        try:
+            use_case.execute(DeleteGenre.Input(**serializer.validated_data))
+        except GenreNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+
+        return Response(status=HTTP_204_NO_CONTENT)
+
+    def _update(self, request: Request, pk, partial: bool) -> Response:
+        serializer = UpdateGenreRequestSerializer(data={**request.data, 'id': pk}, partial=partial)
+        serializer.is_valid(raise_exception=True)
+
+        data = serializer.validated_data
+        if 'category_ids' in data:
+            data['category_ids'] = set(data['category_ids'])
+        try:
+            # the genre write and the category checks share one transaction and identity map
+            with DjangoUnitOfWork() as uow:
+                use_case = UpdateGenre(genre_repository=_genre_repository(),
+                                       category_repository=uow.categories)
+                use_case.execute(UpdateGenre.Input(**data))
+        except GenreNotFound:
+            return Response(status=HTTP_404_NOT_FOUND)
+        except (InvalidGenre, RelatedCategoriesNotFound) as e:
+            return Response(status=HTTP_400_BAD_REQUEST, data={'non_field_errors': [str(e)]})
+
+        return Response(status=HTTP_204_NO_CONTENT)
+
+
+def _genre_repository() -> GenreRepository:
+    # unknown ids are answered GenreNotFound from the negative cache, without a query
+    return CachingGenreRepository(repository=DjangoORMGenreRepository())
+
+
+def _category_repository() -> CategoryRepository:
+    # the same cache the category views read and invalidate
+    return CachingCategoryRepository(repository=DjangoORMCategoryRepository())
+
+
+def _expand_categories(genres: List[GenreOutput], repository: CategoryRepository) -> List[ExpandedGenreOutput]:
+    # every category referenced by the page is fetched in one get_many, instead of one request per id
+    ids = set().union(*(genre.categories for genre in genres))
+    categories: Dict[UUID, Category] = {category.id: category for category in repository.get_many(ids)}
+    return [
+        ExpandedGenreOutput(
+            id=genre.id,
+            name=genre.name,
+            is_active=genre.is_active,
+            categories=sorted(
+                (categories[id] for id in genre.categories if id in categories),
+                key=lambda category: (category.name, category.id)
+            ),
+        ) for genre in genres
+    ]
@@ -39,6 +39,7 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'django_project.category_app',
+    'django_project.genre_app',
 ]
 
 MIDDLEWARE = [
@@ -82,6 +83,41 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+# CULL_FREQUENCY equal to MAX_ENTRIES makes locmem drop only the least recently used entry when full
+CATEGORY_CACHE_TIMEOUT = 300
+CATEGORY_CACHE_MAX_ENTRIES = 10000
+# ids that were looked up and not found; short-lived, since an insert made outside the API is not seen
+MISSING_CACHE_TIMEOUT = 60
+MISSING_CACHE_MAX_ENTRIES = 10000
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'categories': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'categories',
+        'TIMEOUT': CATEGORY_CACHE_TIMEOUT,
+        'OPTIONS': {
+            'MAX_ENTRIES': CATEGORY_CACHE_MAX_ENTRIES,
+            'CULL_FREQUENCY': CATEGORY_CACHE_MAX_ENTRIES,
+        },
+    },
+    'missing': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'missing',
+        'TIMEOUT': MISSING_CACHE_TIMEOUT,
+        'OPTIONS': {
+            'MAX_ENTRIES': MISSING_CACHE_MAX_ENTRIES,
+            'CULL_FREQUENCY': MISSING_CACHE_MAX_ENTRIES,
+        },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
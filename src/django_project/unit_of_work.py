@@ -0,0 +1,32 @@
+from django.db import transaction
+
+from src.core._shared.unit_of_work import UnitOfWork
+from src.core.category.infra.identity_map_category_repository import IdentityMapCategoryRepository
+from src.django_project.category_app.caching_repository import CachingCategoryRepository
+from src.django_project.category_app.repository import DjangoORMCategoryRepository
+
+
+class DjangoUnitOfWork(UnitOfWork):
+    def __init__(self, using: str | None = None):
+        self.using = using
+        self.categories = IdentityMapCategoryRepository(
+            repository=CachingCategoryRepository(repository=DjangoORMCategoryRepository())
+        )
+        self._atomic = None
+
+    def begin(self) -> None:
+        self._atomic = transaction.atomic(using=self.using)
+        self._atomic.__enter__()
+
+    def commit(self) -> None:
+        try:
+            self.categories.flush()
+        except BaseException:
+            self.rollback()
+            raise
+        self._atomic.__exit__(None, None, None)
+
+    def rollback(self) -> None:
+        self.categories.clear()
+        transaction.set_rollback(True, using=self.using)
+        self._atomic.__exit__(None, None, None)